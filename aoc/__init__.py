@@ -0,0 +1 @@
+"""Shared tooling for running, measuring and benchmarking the daily solutions."""
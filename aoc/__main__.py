@@ -0,0 +1,507 @@
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+from operator import attrgetter
+from pathlib import Path
+
+from aoc import answers, batch, bench, cache, generators, memory, profiling, scaling, service
+from aoc.days import discover_days, parse_day_spec
+from aoc.runner import (
+    PARTS,
+    default_worker_count,
+    format_allocations,
+    format_json,
+    format_metrics,
+    format_table,
+    run_days,
+)
+
+
+def select_days(specs: list[str]):
+    days = discover_days()
+    if not specs:
+        return days
+
+    wanted = {number for spec in specs for number in parse_day_spec(spec)}
+    unknown = wanted - {day.number for day in days}
+    if unknown:
+        raise SystemExit(f"No solution found for day(s): {sorted(unknown)}")
+
+    return [day for day in days if day.number in wanted]
+
+
+def apply_cache_flags(args: argparse.Namespace):
+    # environment variables, so the worker processes see them too
+    if getattr(args, "no_parse_cache", False):
+        os.environ["AOC_PARSE_CACHE"] = "0"
+    if getattr(args, "no_answer_cache", False):
+        os.environ["AOC_ANSWER_CACHE"] = answers.OFF
+    elif any(getattr(args, name, False) for name in ("refresh", "metrics", "allocations")):
+        # stored answers come without metrics and allocations, the solutions have to run
+        os.environ["AOC_ANSWER_CACHE"] = answers.REFRESH
+    if getattr(args, "metrics", False):
+        os.environ["AOC_METRICS"] = "1"
+
+
+def command_run(args: argparse.Namespace):
+    apply_cache_flags(args)
+    days = select_days(args.days)
+
+    if args.profile is not None:
+        return command_profile(args, days)
+
+    memory_limit = None
+    if args.memory_limit is not None:
+        if not memory.supported():
+            raise SystemExit("--memory-limit needs /proc to watch the memory of the workers")
+        memory_limit = int(args.memory_limit * 2**20)
+
+    if args.allocations and args.no_memory:
+        raise SystemExit("--allocations needs tracemalloc, it cannot be used with --no-memory")
+
+    start = time.perf_counter()
+    results = run_days(
+        days,
+        tuple(args.part),
+        measure_memory=not args.no_memory,
+        workers=args.workers,
+        memory_limit=memory_limit,
+        allocations=args.allocations,
+    )
+    elapsed = time.perf_counter() - start
+
+    if args.sort == "time":
+        results.sort(key=attrgetter("wall_time"), reverse=True)
+
+    if args.json is None:
+        print(format_table(results, elapsed))
+    elif args.json == "-":
+        print(format_json(results))
+    else:
+        with open(args.json, "w") as f:
+            f.write(format_json(results) + "\n")
+        print(format_table(results, elapsed))
+
+    if args.metrics and args.json != "-":
+        print()
+        print(format_metrics(results))
+
+    if args.allocations and args.json != "-":
+        print()
+        print(format_allocations(results))
+
+    return 1 if any(r.error is not None and r.error.startswith("killed") for r in results) else 0
+
+
+def command_profile(args: argparse.Namespace, days: list) -> int:
+    # one part after the other in this process, always running the solution
+    reports = []
+    for day in days:
+        for part in args.part:
+            report = profiling.profile_part(
+                day, part, args.profile, directory=args.profile_dir, top=args.top
+            )
+            print(report.summary())
+            print()
+            reports.append(report)
+
+    return 1 if any(r.error is not None for r in reports) else 0
+
+
+def command_bench(args: argparse.Namespace) -> int:
+    apply_cache_flags(args)
+    days = select_days(args.days)
+
+    results = [
+        bench.benchmark_part(
+            day, part, repeat=args.repeat, warmup=args.warmup, parse_cache=args.parse_cache
+        )
+        for day in days
+        for part in args.part
+    ]
+
+    if args.save:
+        bench.save_baseline(results, args.baseline, replace=args.replace)
+        baseline = {}
+    elif args.baseline.exists():
+        baseline = bench.load_baseline(args.baseline)
+    else:
+        baseline = {}
+
+    comparisons = bench.compare(results, baseline, args.threshold)
+
+    if args.json == "-":
+        print(json.dumps(bench.as_json(comparisons), indent=2))
+    else:
+        if args.json is not None:
+            Path(args.json).write_text(json.dumps(bench.as_json(comparisons), indent=2) + "\n")
+        print(bench.format_report(comparisons))
+        if args.save:
+            print(f"baseline saved to {args.baseline}")
+
+    status = 0
+
+    regressions = [c for c in comparisons if c.regressed]
+    if regressions:
+        keys = ", ".join(c.result.key for c in regressions)
+        print(f"{len(regressions)} part(s) regressed by more than {args.threshold:.0%}: {keys}", file=sys.stderr)
+        status = 1
+
+    if args.import_budget > 0:
+        import_times = [bench.import_time(day) for day in days]
+        # keep stdout clean JSON
+        output = sys.stderr if args.json == "-" else sys.stdout
+        print(file=output)
+        print(bench.format_import_report(import_times, args.import_budget), file=output)
+
+        slow = [r for r in import_times if r.seconds is not None and r.seconds > args.import_budget]
+        if slow:
+            numbers = ", ".join(f"{r.day:02d}" for r in slow)
+            print(f"{len(slow)} day(s) took longer than {args.import_budget}s to import: {numbers}", file=sys.stderr)
+            status = 1
+
+    return status
+
+
+def command_batch(args: argparse.Namespace) -> int:
+    apply_cache_flags(args)
+    (day,) = select_days([str(args.day)])
+
+    paths = batch.find_inputs(args.inputs)
+    if not paths:
+        raise SystemExit(f"No input files match: {' '.join(args.inputs)}")
+
+    status = 0
+    # one JSON object per line, printed as soon as the part is solved
+    for result in batch.run_batch(day, paths, tuple(args.part), workers=args.workers):
+        print(json.dumps(result.to_json()), flush=True)
+        if result.error is not None:
+            status = 1
+
+    return status
+
+
+def command_scaling(args: argparse.Namespace) -> int:
+    days = select_days(args.days)
+
+    with contextlib.ExitStack() as stack:
+        if args.inputs is None:
+            directory = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="aoc-scaling-")))
+        else:
+            directory = args.inputs
+            directory.mkdir(parents=True, exist_ok=True)
+        stack.enter_context(cache.parse_from_scratch())
+
+        results = []
+        for day in days:
+            for part in args.part:
+                result = scaling.measure_scaling(
+                    day,
+                    part,
+                    directory,
+                    start_scale=args.start,
+                    steps=args.steps,
+                    repeat=args.repeat,
+                    max_time=args.max_time,
+                    seed=args.seed,
+                )
+                # measuring takes a while, show the progress next to the report
+                slope = "-" if result.slope is None else f"{result.slope:.2f}"
+                print(f"{result.key}: slope {slope}", file=sys.stderr)
+                results.append(result)
+
+    if args.json == "-":
+        print(json.dumps(scaling.as_json(results), indent=2))
+    else:
+        if args.json is not None:
+            Path(args.json).write_text(json.dumps(scaling.as_json(results), indent=2) + "\n")
+        print(scaling.format_report(results))
+
+    flagged = [r for r in results if r.too_slow]
+    if flagged:
+        keys = ", ".join(r.key for r in flagged)
+        print(f"{len(flagged)} part(s) grow faster than their target: {keys}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+def command_serve(args: argparse.Namespace):
+    apply_cache_flags(args)
+
+    try:
+        asyncio.run(
+            service.serve(
+                host=args.host,
+                port=args.port,
+                unix_socket=args.unix,
+                workers=args.workers,
+                timeout=args.timeout,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+def command_generate(args: argparse.Namespace):
+    if args.output is None:
+        sys.stdout.write(generators.generate(args.day, scale=args.scale, seed=args.seed))
+    else:
+        generators.write(args.day, args.output, scale=args.scale, seed=args.seed)
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--no-parse-cache",
+        action="store_true",
+        help="parse the inputs from scratch instead of loading the cached results",
+    )
+
+
+def main(argv: list[str] = None):
+    parser = argparse.ArgumentParser(prog="python -m aoc")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser(
+        "run", help="run the solutions and report time and memory per part"
+    )
+    run_parser.add_argument(
+        "days", nargs="*", help="days to run, eg. 5 or 10-15 (default: every day)"
+    )
+    run_parser.add_argument(
+        "-p", "--part", type=int, nargs="+", choices=PARTS, default=list(PARTS)
+    )
+    run_parser.add_argument(
+        "--json", metavar="FILE", help="write the results as JSON ('-' for stdout)"
+    )
+    run_parser.add_argument(
+        "--sort", choices=("day", "time"), default="day", help="order of the report"
+    )
+    run_parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=default_worker_count(),
+        help="number of worker processes, 1 runs everything in this process (default: %(default)s)",
+    )
+    run_parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip tracemalloc, it slows the solutions down noticeably",
+    )
+    run_parser.add_argument(
+        "--allocations",
+        action="store_true",
+        help="list the lines that allocated the most memory near the traced peak of each part",
+    )
+    run_parser.add_argument(
+        "--memory-limit",
+        type=float,
+        metavar="MIB",
+        help="kill the worker of any part whose resident memory goes over this limit; "
+        "every part runs in a process of its own",
+    )
+    run_parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="record the operation counters of the solutions, they are part of the JSON output too",
+    )
+    run_parser.add_argument(
+        "--profile",
+        choices=profiling.PROFILERS,
+        help="run the parts one by one under a profiler, write the profiles and summarize the hot spots",
+    )
+    run_parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=profiling.DEFAULT_DIRECTORY,
+        help="where to write the .pstats and .collapsed files (default: %(default)s)",
+    )
+    run_parser.add_argument(
+        "--top", type=int, default=15, help="functions listed in the profile summary"
+    )
+    add_cache_arguments(run_parser)
+    answer_cache = run_parser.add_mutually_exclusive_group()
+    answer_cache.add_argument(
+        "--no-answer-cache",
+        action="store_true",
+        help="always run the solutions, do not read or write the stored answers",
+    )
+    answer_cache.add_argument(
+        "--refresh",
+        action="store_true",
+        help="run the solutions and overwrite the stored answers",
+    )
+    run_parser.set_defaults(func=command_run)
+
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="time the solutions repeatedly and compare them to a stored baseline",
+    )
+    bench_parser.add_argument(
+        "days", nargs="*", help="days to benchmark, eg. 5 or 10-15 (default: every day)"
+    )
+    bench_parser.add_argument(
+        "-p", "--part", type=int, nargs="+", choices=PARTS, default=list(PARTS)
+    )
+    bench_parser.add_argument("--repeat", type=int, default=5, help="timed runs per part")
+    bench_parser.add_argument(
+        "--warmup", type=int, default=1, help="untimed runs before the timed ones"
+    )
+    bench_parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=bench.DEFAULT_BASELINE,
+        help="baseline file (default: %(default)s)",
+    )
+    bench_parser.add_argument(
+        "--save",
+        action="store_true",
+        help="store the results in the baseline, the parts that did not run keep their entries",
+    )
+    bench_parser.add_argument(
+        "--replace",
+        action="store_true",
+        help="with --save, replace the whole baseline with the parts of this run",
+    )
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="allowed slowdown of the median compared to the baseline (default: %(default)s)",
+    )
+    bench_parser.add_argument(
+        "--json", metavar="FILE", help="write the results as JSON ('-' for stdout)"
+    )
+    bench_parser.add_argument(
+        "--import-budget",
+        type=float,
+        default=0.1,
+        metavar="SECONDS",
+        help="maximum time the imports of a day may take, 0 skips the check (default: %(default)s)",
+    )
+    bench_parser.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help="load the parsed inputs from the cache, the timings then leave out parsing",
+    )
+    bench_parser.set_defaults(func=command_bench)
+
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="solve every input file matching the patterns, one JSON line per file and part",
+    )
+    batch_parser.add_argument("day", type=int)
+    batch_parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="input files or glob patterns, eg. 'inputs/day-17/*.txt' (quoted, ** matches subfolders)",
+    )
+    batch_parser.add_argument(
+        "-p", "--part", type=int, nargs="+", choices=PARTS, default=list(PARTS)
+    )
+    batch_parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=default_worker_count(),
+        help="number of worker processes, 1 solves everything in this process (default: %(default)s)",
+    )
+    add_cache_arguments(batch_parser)
+    batch_parser.set_defaults(func=command_batch)
+
+    scaling_parser = subparsers.add_parser(
+        "scaling",
+        help="time the parts on generated inputs of growing size and fit the growth of the time",
+    )
+    scaling_parser.add_argument(
+        "days", nargs="*", help="days to measure, eg. 5 or 10-15 (default: every day)"
+    )
+    scaling_parser.add_argument(
+        "-p", "--part", type=int, nargs="+", choices=PARTS, default=list(PARTS)
+    )
+    scaling_parser.add_argument(
+        "--start",
+        type=float,
+        help="scale of the smallest input (default: 0.25, less for the slowest parts)",
+    )
+    scaling_parser.add_argument(
+        "--steps", type=int, default=5, help="number of sizes, each twice the previous (default: %(default)s)"
+    )
+    scaling_parser.add_argument("--repeat", type=int, default=3, help="timed runs per size")
+    scaling_parser.add_argument(
+        "--max-time",
+        type=float,
+        default=2.0,
+        metavar="SECONDS",
+        help="stop growing the input once a run takes longer than this (default: %(default)s)",
+    )
+    scaling_parser.add_argument("--seed", type=int, default=0)
+    scaling_parser.add_argument(
+        "--inputs",
+        type=Path,
+        help="keep the generated inputs in this folder (default: a temporary folder)",
+    )
+    scaling_parser.add_argument(
+        "--json", metavar="FILE", help="write the results as JSON ('-' for stdout)"
+    )
+    scaling_parser.set_defaults(func=command_scaling)
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="answer solve requests over HTTP from a pool of warm worker processes"
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1", help="(default: %(default)s)")
+    serve_parser.add_argument("--port", type=int, default=8023, help="(default: %(default)s)")
+    serve_parser.add_argument(
+        "--unix", type=Path, metavar="PATH", help="listen on this Unix socket instead of a TCP port"
+    )
+    serve_parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=default_worker_count(),
+        help="number of worker processes (default: %(default)s)",
+    )
+    serve_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30.0,
+        metavar="SECONDS",
+        help="time a request may take unless it sets its own timeout (default: %(default)s)",
+    )
+    serve_parser.add_argument(
+        "--no-answer-cache",
+        action="store_true",
+        help="always run the solutions, do not read or write the stored answers",
+    )
+    add_cache_arguments(serve_parser)
+    serve_parser.set_defaults(func=command_serve)
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="generate a random puzzle input of the given size"
+    )
+    generate_parser.add_argument("day", type=int, choices=sorted(generators.GENERATORS))
+    generate_parser.add_argument(
+        "-s",
+        "--scale",
+        type=float,
+        default=1,
+        help="size compared to the real puzzle input (default: %(default)s)",
+    )
+    generate_parser.add_argument("--seed", type=int, default=0)
+    generate_parser.add_argument(
+        "-o", "--output", type=Path, help="output file (default: stdout)"
+    )
+    generate_parser.set_defaults(func=command_generate)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
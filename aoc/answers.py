@@ -0,0 +1,177 @@
+"""Store of computed answers.
+
+Answers are keyed by (day, part, input hash, source hash) in a SQLite file. The source hash covers the
+day's own .py files and the aoc modules it imports, so editing the solution invalidates its answers.
+
+AOC_ANSWER_CACHE selects the mode: "1" (default) reads and writes the store, "refresh" recomputes and
+overwrites the stored answers, "0" bypasses the store completely.
+"""
+
+import ast
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from aoc.cache import cache_dir, file_digest
+from aoc.days import ROOT, Day
+
+USE = "1"
+REFRESH = "refresh"
+OFF = "0"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    input_hash TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    answer BLOB NOT NULL,
+    wall_time REAL NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (day, part, input_hash, source_hash)
+)
+"""
+
+
+def answer_cache_mode() -> str:
+    mode = os.environ.get("AOC_ANSWER_CACHE", USE)
+    if mode not in (USE, REFRESH, OFF):
+        raise ValueError(f"Unknown AOC_ANSWER_CACHE mode '{mode}'")
+    return mode
+
+
+def aoc_imports(path: Path) -> set[str]:
+    # names of the aoc modules imported by a source file
+    tree = ast.parse(path.read_text(), filename=str(path))
+    modules = set()
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module and node.module.split(".")[0] == "aoc":
+            modules.add(node.module)
+            # from aoc import metrics: the names may be modules of the package themselves
+            modules.update(
+                f"{node.module}.{a.name}" for a in node.names if module_path(f"{node.module}.{a.name}")
+            )
+        elif isinstance(node, ast.Import):
+            modules.update(a.name for a in node.names if a.name.split(".")[0] == "aoc")
+
+    return modules
+
+
+def module_path(name: str) -> Optional[Path]:
+    path = ROOT.joinpath(*name.split("."))
+    if path.with_suffix(".py").is_file():
+        return path.with_suffix(".py")
+    if (path / "__init__.py").is_file():
+        return path / "__init__.py"
+    return None
+
+
+def source_files(day: Day) -> list[Path]:
+    files = sorted(p for p in day.path.glob("*.py") if not p.name.startswith("test_"))
+
+    # follow the imports of the shared modules too
+    pending = [name for f in files for name in aoc_imports(f)]
+    seen = set()
+    while pending:
+        name = pending.pop()
+        path = module_path(name)
+        if name in seen or path is None:
+            continue
+        seen.add(name)
+        files.append(path)
+        pending.extend(aoc_imports(path))
+
+    return files
+
+
+def source_hash(day: Day) -> str:
+    digest = hashlib.sha256()
+    for path in source_files(day):
+        digest.update(f"{path.relative_to(ROOT)}:{file_digest(path)}\n".encode())
+    return digest.hexdigest()
+
+
+def input_hash(day: Day) -> str:
+    # The runner calls the parts without a path, they read input.txt, but the solutions may open
+    # other files of their folder too, so every data file counts. The .py files are covered by the source hash.
+    digest = hashlib.sha256()
+    for path in sorted(day.path.iterdir()):
+        if path.is_file() and path.suffix != ".py" and not path.name.startswith("."):
+            digest.update(f"{path.name}:{file_digest(path)}\n".encode())
+    return digest.hexdigest()
+
+
+def text_hash(text: str) -> str:
+    # inputs sent as text, by the solver service
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class AnswerStore:
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or cache_dir() / "answers.sqlite"
+        self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # the worker processes of the runner write concurrently, give them time to wait for the lock
+            self._connection = sqlite3.connect(self.path, timeout=30)
+            self._connection.execute(SCHEMA)
+        return self._connection
+
+    def get(self, day: int, part: int, input_hash: str, source_hash: str) -> tuple[bool, Any]:
+        row = (
+            self._connect()
+            .execute(
+                "SELECT answer FROM answers WHERE day = ? AND part = ? AND input_hash = ? AND source_hash = ?",
+                (day, part, input_hash, source_hash),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return False, None
+        return True, pickle.loads(row[0])
+
+    def put(
+        self,
+        day: int,
+        part: int,
+        input_hash: str,
+        source_hash: str,
+        answer: Any,
+        wall_time: float,
+    ):
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    day,
+                    part,
+                    input_hash,
+                    source_hash,
+                    pickle.dumps(answer),
+                    wall_time,
+                    time.time(),
+                ),
+            )
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+_store: Optional[AnswerStore] = None
+
+
+def default_store() -> AnswerStore:
+    # one connection per process
+    global _store
+    if _store is None:
+        _store = AnswerStore()
+    return _store
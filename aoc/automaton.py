@@ -0,0 +1,98 @@
+"""Aho-Corasick automaton over bytes, to find the first of many patterns in a single pass.
+
+    digits = Automaton({b"1": 1, b"one": 1, b"2": 2, b"two": 2, ...})
+    digits.find_first(line)            # value of the first pattern to end in the line
+    digits.find_first(reversed(line))  # the same automaton built from reversed patterns scans backwards
+
+The failure links are folded into a dense transition table of 256 entries per state, so overlapping
+matches ("eightwo") are never missed and every byte costs one list lookup whatever the state. The
+table holds the offsets of the rows, state << 8, and the states where a pattern ends are numbered
+last, so the hot loop is one lookup and one comparison per byte.
+
+The match reported is the first one to end; when no pattern contains another one, that is also the
+first one to start.
+"""
+
+from collections import deque
+from collections.abc import Iterable, Mapping
+from typing import Any, Optional
+
+
+class Automaton:
+    def __init__(self, patterns: Mapping[bytes, Any]):
+        # the trie of the patterns, output[state] is the value of the pattern ending there
+        children: list[dict[int, int]] = [{}]
+        output: list[Any] = [None]
+
+        for pattern, value in patterns.items():
+            if not pattern:
+                raise ValueError("Patterns cannot be empty")
+            if value is None:
+                raise ValueError(f"Pattern {pattern!r} needs a value other than None")
+
+            state = 0
+            for byte in pattern:
+                if byte not in children[state]:
+                    children[state][byte] = len(children)
+                    children.append({})
+                    output.append(None)
+                state = children[state][byte]
+            output[state] = value
+
+        # breadth first, so the failure link of a state, which is shallower, is always done before it
+        table = [0] * (len(children) << 8)
+        fail = [0] * len(children)
+        queue = deque()
+
+        for byte, child in children[0].items():
+            table[byte] = child
+            queue.append(child)
+
+        while queue:
+            state = queue.popleft()
+            # a pattern that is a suffix of this state's text ends here too
+            if output[state] is None:
+                output[state] = output[fail[state]]
+
+            base = state << 8
+            fail_base = fail[state] << 8
+            for byte in range(256):
+                child = children[state].get(byte)
+                if child is None:
+                    table[base | byte] = table[fail_base | byte]
+                else:
+                    fail[child] = table[fail_base | byte]
+                    table[base | byte] = child
+                    queue.append(child)
+
+        # renumber the states, the ones with an output go last, root stays 0
+        order = sorted(range(len(children)), key=lambda state: output[state] is not None)
+        number = {state: i for i, state in enumerate(order)}
+
+        self.table = [0] * len(table)
+        for state in order:
+            base = number[state] << 8
+            old_base = state << 8
+            for byte in range(256):
+                self.table[base | byte] = number[table[old_base | byte]] << 8
+
+        self.output = [output[state] for state in order]
+        # row offset of the first state with an output
+        self.accepting = sum(value is None for value in output) << 8
+
+    @property
+    def states(self) -> int:
+        return len(self.output)
+
+    def find_first(self, data: Iterable[int]) -> Optional[Any]:
+        # value of the first pattern to end in the bytes, None if there is none
+        table = self.table
+        accepting = self.accepting
+        state = 0
+
+        for byte in data:
+            state = table[state | byte]
+            if state >= accepting:
+                return self.output[state >> 8]
+
+        return None
@@ -0,0 +1,110 @@
+"""Solve many inputs of the same day.
+
+Every part takes the path of its input, input.txt of the day's folder by default. The input files
+are spread over a pool of worker processes, one task per file that solves the selected parts one
+after the other, so the second part finds the parsed input in the cache of the first. Results are
+yielded as the files are done, not in the order of the files.
+"""
+
+import contextlib
+import glob
+import io
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from aoc.days import Day, day_context, load_module
+from aoc.runner import PARTS, json_answer
+
+
+@dataclass
+class BatchResult:
+    file: str
+    part: int
+    answer: Any = None
+    # wall-clock time of the part, in seconds
+    time: float = 0.0
+    error: Optional[str] = None
+    # size of the input file in bytes
+    size: int = 0
+
+    @property
+    def throughput(self) -> Optional[float]:
+        # megabytes of input per second
+        if self.error is not None or self.time <= 0:
+            return None
+        return self.size / 1e6 / self.time
+
+    def to_json(self) -> dict:
+        result = asdict(self)
+        result["answer"] = json_answer(self.answer)
+        result["mb_per_s"] = self.throughput
+        return result
+
+
+def find_inputs(patterns: Iterable[str]) -> list[Path]:
+    # files matching any of the glob patterns (** included), each once, in sorted order
+    paths = {
+        Path(match)
+        for pattern in patterns
+        for match in glob.glob(pattern, recursive=True)
+    }
+    return sorted(path for path in paths if path.is_file())
+
+
+def solve_file(day: Day, path: Path, parts: tuple[int, ...] = PARTS) -> list[BatchResult]:
+    # the solutions run in the folder of the day, they get the absolute path
+    absolute = str(path.resolve())
+    size = path.stat().st_size
+
+    try:
+        module = load_module(day)
+    except Exception as e:
+        error = f"import failed: {type(e).__name__}: {e}"
+        return [BatchResult(str(path), part, error=error) for part in parts]
+
+    results = []
+
+    for part in parts:
+        result = BatchResult(str(path), part, size=size)
+        results.append(result)
+
+        func = getattr(module, f"part_{part}", None)
+        if func is None:
+            result.error = "not implemented"
+            continue
+
+        start = time.perf_counter()
+        try:
+            with day_context(day), contextlib.redirect_stdout(io.StringIO()):
+                result.answer = func(absolute)
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+        finally:
+            result.time = time.perf_counter() - start
+
+    return results
+
+
+def run_batch(
+    day: Day, paths: list[Path], parts: tuple[int, ...] = PARTS, workers: int = 1
+) -> Iterator[BatchResult]:
+    if workers <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield from solve_file(day, path, parts)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+        futures = {executor.submit(solve_file, day, path, parts): path for path in paths}
+
+        for future in as_completed(futures):
+            try:
+                yield from future.result()
+            except Exception as e:
+                # the worker process died (eg. killed by the OS), the pool reports it here
+                path = futures[future]
+                error = f"{type(e).__name__}: {e}"
+                yield from (BatchResult(str(path), part, error=error) for part in parts)
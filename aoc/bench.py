@@ -0,0 +1,268 @@
+import contextlib
+import io
+import json
+import math
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from aoc.cache import parse_from_scratch
+from aoc.days import ROOT, Day, day_context, load_module
+
+# bump this when the layout of the baseline file or the meaning of its timings changes,
+# 2: the timings include parsing, the parse cache is off
+BASELINE_VERSION = 2
+
+DEFAULT_BASELINE = ROOT / "benchmarks" / "baseline.json"
+
+# written to stderr right before the day is loaded, the imports after it are the day's
+IMPORT_MARKER = "-- loading day --"
+
+
+@dataclass
+class BenchResult:
+    day: int
+    part: int
+    runs: int = 0
+    median: Optional[float] = None
+    p95: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.day:02d}/{self.part}"
+
+
+def percentile(values: list[float], q: float) -> float:
+    # nearest-rank percentile, good enough for a handful of samples
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def benchmark_part(
+    day: Day, part: int, repeat: int = 5, warmup: int = 1, parse_cache: bool = False
+) -> BenchResult:
+    # Without the parse cache every run parses its input, otherwise the warm-up fills the cache
+    # and the timed runs only unpickle the parsed input.
+    result = BenchResult(day.number, part)
+
+    try:
+        module = load_module(day)
+    except Exception as e:
+        result.error = f"import failed: {type(e).__name__}: {e}"
+        return result
+
+    func = getattr(module, f"part_{part}", None)
+    if func is None:
+        result.error = "not implemented"
+        return result
+
+    timings = []
+
+    try:
+        cache_context = contextlib.nullcontext() if parse_cache else parse_from_scratch()
+        with cache_context, day_context(day), contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(warmup):
+                func()
+
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func()
+                timings.append(time.perf_counter() - start)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+        return result
+
+    result.runs = len(timings)
+    result.median = statistics.median(timings)
+    result.p95 = percentile(timings, 95)
+
+    return result
+
+
+def save_baseline(results: list[BenchResult], path: Path = DEFAULT_BASELINE, replace: bool = False):
+    # the parts that ran replace their entries, the other parts keep theirs unless replace is set
+    parts = {}
+    if not replace and path.exists():
+        previous = json.loads(path.read_text())
+        if previous.get("version") == BASELINE_VERSION:
+            parts = previous["parts"]
+
+    parts.update(
+        {
+            r.key: {"runs": r.runs, "median": r.median, "p95": r.p95}
+            for r in results
+            if r.error is None
+        }
+    )
+
+    baseline = {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "parts": dict(sorted(parts.items())),
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(baseline, indent=2) + "\n")
+
+
+def load_baseline(path: Path = DEFAULT_BASELINE) -> dict:
+    baseline = json.loads(path.read_text())
+
+    version = baseline.get("version")
+    if version != BASELINE_VERSION:
+        raise ValueError(
+            f"Baseline {path} has version {version}, expected {BASELINE_VERSION}. Save a new one."
+        )
+
+    return baseline["parts"]
+
+
+@dataclass
+class Comparison:
+    result: BenchResult
+    baseline_median: Optional[float]
+    # relative change of the median, 0.1 means 10% slower than the baseline
+    change: Optional[float]
+    regressed: bool
+
+
+def compare(
+    results: list[BenchResult], baseline: dict, threshold: float
+) -> list[Comparison]:
+    comparisons = []
+
+    for r in results:
+        reference = baseline.get(r.key)
+        if r.error is not None or reference is None:
+            comparisons.append(Comparison(r, None, None, False))
+            continue
+
+        change = r.median / reference["median"] - 1
+        comparisons.append(Comparison(r, reference["median"], change, change > threshold))
+
+    return comparisons
+
+
+def format_report(comparisons: list[Comparison]) -> str:
+    header = ("day", "part", "runs", "median [s]", "p95 [s]", "baseline [s]", "change", "")
+
+    rows = []
+    for c in comparisons:
+        r = c.result
+        if r.error is not None:
+            rows.append((f"{r.day:02d}", str(r.part), "-", "-", "-", "-", "-", r.error))
+            continue
+
+        rows.append(
+            (
+                f"{r.day:02d}",
+                str(r.part),
+                str(r.runs),
+                f"{r.median:.4f}",
+                f"{r.p95:.4f}",
+                "-" if c.baseline_median is None else f"{c.baseline_median:.4f}",
+                "-" if c.change is None else f"{c.change:+.1%}",
+                "REGRESSION" if c.regressed else "",
+            )
+        )
+
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    align = ["<", "<", ">", ">", ">", ">", ">", "<"]
+
+    lines = [
+        "  ".join(f"{cell:{a}{w}}" for cell, a, w in zip(row, align, widths)).rstrip()
+        for row in [header, *rows]
+    ]
+    lines.insert(1, "  ".join("-" * w for w in widths).rstrip())
+
+    return "\n".join(lines)
+
+
+def as_json(comparisons: list[Comparison]) -> list[dict]:
+    return [
+        {
+            **asdict(c.result),
+            "baseline_median": c.baseline_median,
+            "change": c.change,
+            "regressed": c.regressed,
+        }
+        for c in comparisons
+    ]
+
+
+@dataclass
+class ImportTime:
+    day: int
+    seconds: Optional[float] = None
+    error: Optional[str] = None
+
+
+def parse_import_times(output: str) -> float:
+    # Sum of the cumulative times of the top level imports after the marker, in seconds.
+    # The lines of -X importtime look like "import time:  self [us] | cumulative | package",
+    # nested imports are indented under the package that imported them.
+    total = 0
+    started = False
+
+    for line in output.splitlines():
+        if line == IMPORT_MARKER:
+            started = True
+            continue
+        if not started or not line.startswith("import time:"):
+            continue
+
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            total += int(cumulative)
+
+    return total / 1_000_000
+
+
+def import_time(day: Day, repeat: int = 3) -> ImportTime:
+    # time spent importing modules while the day is loaded in a fresh interpreter,
+    # the best of a few runs, the first one also pays for compiling the sources
+    code = "\n".join(
+        [
+            "import sys",
+            "from aoc.days import get_day, load_module",
+            f"sys.stderr.write({IMPORT_MARKER!r} + '\\n')",
+            f"load_module(get_day({day.number}))",
+        ]
+    )
+
+    timings = []
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+        )
+        if process.returncode != 0:
+            lines = process.stderr.strip().splitlines()
+            return ImportTime(day.number, error=lines[-1] if lines else "import failed")
+        timings.append(parse_import_times(process.stderr))
+
+    return ImportTime(day.number, seconds=min(timings))
+
+
+def format_import_report(results: list[ImportTime], budget: float) -> str:
+    lines = [f"import time per day (budget {budget * 1000:.0f} ms)"]
+
+    for r in results:
+        if r.error is not None:
+            lines.append(f"  {r.day:02d}  {'-':>8}  {r.error}")
+        else:
+            flag = "  OVER BUDGET" if r.seconds > budget else ""
+            lines.append(f"  {r.day:02d}  {r.seconds * 1000:6.1f} ms{flag}")
+
+    return "\n".join(lines)
@@ -0,0 +1,164 @@
+"""Cache of parsed puzzle inputs.
+
+Parsers decorated with `parsed_input` store their result as a pickle, keyed by the SHA-256 of the
+input file, the parser and its version. Later calls - the other part, the next run, another process -
+unpickle it instead of parsing again. Every call returns a fresh copy, so the solutions are free to
+mutate what they get. Bump the version of a parser when its output changes.
+
+Set AOC_PARSE_CACHE=0 to turn it off, AOC_CACHE_DIR to move it (default: .aoc-cache in the repository).
+Only the most recently used results and file digests are kept in memory, the pickles stay on disk.
+"""
+
+import contextlib
+import functools
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional, TypeVar, Union
+
+from aoc.days import ROOT
+from aoc.inputs import resolve
+
+T = TypeVar("T")
+
+PathLike = Union[str, Path]
+
+# how many pickled results and file digests are kept in memory, the least recently used go first
+MEMORY_ENTRIES = 32
+DIGEST_ENTRIES = 1024
+
+# file path -> (mtime, size, digest), so unchanged files are not hashed again
+_digests: "OrderedDict[Path, tuple[int, int, str]]" = OrderedDict()
+
+# cache key -> pickled result
+_memory: "OrderedDict[str, bytes]" = OrderedDict()
+
+
+def _remember(entries: OrderedDict, key, value, limit: int):
+    entries[key] = value
+    entries.move_to_end(key)
+    while len(entries) > limit:
+        entries.popitem(last=False)
+
+
+def clear_memory():
+    # forget the results and digests kept in memory, the pickles on disk are not touched
+    _memory.clear()
+    _digests.clear()
+
+
+def cache_dir() -> Path:
+    return Path(os.environ.get("AOC_CACHE_DIR", ROOT / ".aoc-cache"))
+
+
+def parse_cache_enabled() -> bool:
+    return os.environ.get("AOC_PARSE_CACHE", "1") != "0"
+
+
+@contextlib.contextmanager
+def parse_from_scratch():
+    # turns the cache off for the code inside, eg. to time the parsers too
+    previous = os.environ.get("AOC_PARSE_CACHE")
+    os.environ["AOC_PARSE_CACHE"] = "0"
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ["AOC_PARSE_CACHE"]
+        else:
+            os.environ["AOC_PARSE_CACHE"] = previous
+
+
+def file_digest(path: PathLike) -> str:
+    path = Path(path).resolve()
+    stat = path.stat()
+
+    known = _digests.get(path)
+    if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+        _digests.move_to_end(path)
+        return known[2]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+
+    _remember(_digests, path, (stat.st_mtime_ns, stat.st_size, digest.hexdigest()), DIGEST_ENTRIES)
+    return digest.hexdigest()
+
+
+def _load(key: str):
+    data = _memory.get(key)
+
+    if data is None:
+        path = cache_dir() / "parsed" / f"{key}.pickle"
+        if not path.exists():
+            raise KeyError(key)
+        data = path.read_bytes()
+
+    # raises if the pickle refers to something that is not importable here,
+    # eg. a class pickled while the day was running as __main__
+    result = pickle.loads(data)
+    _remember(_memory, key, data, MEMORY_ENTRIES)
+    return result
+
+
+def _store(key: str, value):
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    _remember(_memory, key, data, MEMORY_ENTRIES)
+
+    directory = cache_dir() / "parsed"
+    directory.mkdir(parents=True, exist_ok=True)
+    # write and rename, so parallel workers never read a half written file
+    temp = directory / f"{key}.{os.getpid()}.tmp"
+    temp.write_bytes(data)
+    os.replace(temp, directory / f"{key}.pickle")
+
+
+def parsed_input(version: int, filename: Optional[PathLike] = None):
+    """Cache the result of a parser.
+
+    The parser reads the file given as its first argument, or the fixed `filename` if it has no arguments.
+    Relative names are resolved next to the parser's module, like `aoc.inputs` does.
+    """
+
+    def decorator(parser: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(parser)
+        def wrapper(*args, **kwargs) -> T:
+            if not parse_cache_enabled():
+                return parser(*args, **kwargs)
+
+            path = resolve(parser.__code__.co_filename, filename if filename is not None else args[0])
+
+            key_source = "|".join(
+                [
+                    file_digest(path),
+                    parser.__module__,
+                    parser.__qualname__,
+                    str(version),
+                    repr(args[1:] if filename is None else args),
+                    repr(sorted(kwargs.items())),
+                ]
+            )
+            key = hashlib.sha256(key_source.encode()).hexdigest()
+
+            try:
+                return _load(key)
+            except Exception:
+                pass
+
+            result = parser(*args, **kwargs)
+
+            try:
+                _store(key, result)
+            except (pickle.PicklingError, TypeError, AttributeError, OSError):
+                # not everything can be pickled, those results are simply not cached
+                pass
+
+            return result
+
+        return wrapper
+
+    return decorator
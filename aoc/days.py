@@ -0,0 +1,86 @@
+import contextlib
+import importlib.util
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DAY_DIR_PATTERN = re.compile(r"^day-(\d\d)$")
+
+
+@dataclass(frozen=True)
+class Day:
+    number: int
+    path: Path
+
+    @property
+    def name(self) -> str:
+        return f"day-{self.number:02d}"
+
+    @property
+    def main(self) -> Path:
+        return self.path / "main.py"
+
+    @property
+    def module_name(self) -> str:
+        # every day lives in a main.py, so they need distinct names in sys.modules
+        return f"day_{self.number:02d}"
+
+
+def discover_days(root: Path = ROOT) -> list[Day]:
+    days = []
+
+    for path in sorted(root.iterdir()):
+        match = DAY_DIR_PATTERN.match(path.name)
+        if match and (path / "main.py").is_file():
+            days.append(Day(int(match.group(1)), path))
+
+    return days
+
+
+def get_day(number: int, root: Path = ROOT) -> Day:
+    for day in discover_days(root):
+        if day.number == number:
+            return day
+    raise ValueError(f"No solution found for day {number}")
+
+
+def parse_day_spec(spec: str) -> list[int]:
+    # "17" -> [17], "3-5" -> [3, 4, 5]
+    if "-" in spec:
+        first, last = spec.split("-", 1)
+        return list(range(int(first), int(last) + 1))
+    return [int(spec)]
+
+
+@contextlib.contextmanager
+def day_context(day: Day):
+    # The solutions import helper modules (linalg.py, condition.py) from their own folder, and
+    # the debug files some of them write belong there too. Inputs are found without the chdir.
+    sys.path.insert(0, str(day.path))
+    try:
+        with contextlib.chdir(day.path):
+            yield
+    finally:
+        sys.path.remove(str(day.path))
+
+
+def load_module(day: Day) -> ModuleType:
+    if day.module_name in sys.modules:
+        return sys.modules[day.module_name]
+
+    spec = importlib.util.spec_from_file_location(day.module_name, day.main)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[day.module_name] = module
+
+    try:
+        with day_context(day):
+            spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[day.module_name]
+        raise
+
+    return module
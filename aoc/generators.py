@@ -0,0 +1,856 @@
+"""Synthetic puzzle inputs of any size.
+
+Every generator takes a random number generator and a scale factor and returns the puzzle input in
+the same text format as the real input.txt. Scale 1 is roughly the size of the real puzzle input,
+scale 10 has about ten times as many lines, cells, bricks, ... in it.
+
+Inputs that make sense at gigabyte sizes also have a streaming generator yielding the input piece
+by piece, `write` uses it to fill a file without holding the whole input in memory.
+"""
+
+import math
+import random
+from collections import defaultdict
+from collections.abc import Iterator
+from pathlib import Path
+from string import ascii_lowercase, ascii_uppercase
+from typing import Callable
+
+Generator = Callable[[random.Random, float], str]
+StreamGenerator = Callable[[random.Random, float], Iterator[str]]
+
+GENERATORS: dict[int, Generator] = {}
+STREAM_GENERATORS: dict[int, StreamGenerator] = {}
+
+
+def generator(day: int):
+    def register(func: Generator) -> Generator:
+        GENERATORS[day] = func
+        return func
+
+    return register
+
+
+def generate(day: int, scale: float = 1, seed: int = 0) -> str:
+    if day not in GENERATORS:
+        raise ValueError(f"No input generator for day {day}")
+    if scale <= 0:
+        raise ValueError(f"Scale has to be positive, got {scale}")
+
+    return GENERATORS[day](random.Random(seed), scale)
+
+
+def stream_generator(day: int):
+    # also registers the joined stream as the day's generator
+    def register(func: StreamGenerator) -> StreamGenerator:
+        STREAM_GENERATORS[day] = func
+        GENERATORS[day] = lambda rng, scale: "".join(func(rng, scale))
+        return func
+
+    return register
+
+
+def write(day: int, path: Path, scale: float = 1, seed: int = 0):
+    # same text as generate(), streamed into the file when the day has a streaming generator
+    if day not in STREAM_GENERATORS:
+        path.write_text(generate(day, scale=scale, seed=seed))
+        return
+    if scale <= 0:
+        raise ValueError(f"Scale has to be positive, got {scale}")
+
+    chunk = []
+    with open(path, "w") as f:
+        for piece in STREAM_GENERATORS[day](random.Random(seed), scale):
+            chunk.append(piece)
+            if len(chunk) >= 10_000:
+                f.write("".join(chunk))
+                chunk.clear()
+        f.write("".join(chunk))
+
+
+def scaled(base: int, scale: float, minimum: int = 1) -> int:
+    # for lists of things: lines, bricks, hailstones, ...
+    return max(round(base * scale), minimum)
+
+
+def scaled_side(base: int, scale: float, minimum: int = 5) -> int:
+    # for square grids the number of cells grows with the scale, not the side length
+    return max(round(base * math.sqrt(scale)), minimum)
+
+
+def unique_names(
+    rng: random.Random,
+    count: int,
+    alphabet: str = ascii_lowercase,
+    length: int = 2,
+    exclude: set[str] = frozenset(),
+) -> list[str]:
+    # grow the name length until there is enough room to pick names randomly
+    while len(alphabet) ** length < 2 * (count + len(exclude)):
+        length += 1
+
+    names = set()
+    while len(names) < count:
+        name = "".join(rng.choice(alphabet) for _ in range(length))
+        if name not in exclude:
+            names.add(name)
+
+    result = sorted(names)
+    rng.shuffle(result)
+    return result
+
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+@stream_generator(1)
+def calibration_document(rng: random.Random, scale: float) -> Iterator[str]:
+    for _ in range(scaled(1000, scale)):
+        tokens = [rng.choice("123456789")]
+        for _ in range(rng.randint(1, 7)):
+            kind = rng.random()
+            if kind < 0.4:
+                tokens.append("".join(rng.choices(ascii_lowercase, k=rng.randint(1, 4))))
+            elif kind < 0.7:
+                tokens.append(rng.choice(DIGIT_WORDS))
+            else:
+                tokens.append(rng.choice("123456789"))
+        rng.shuffle(tokens)
+        yield "".join(tokens) + "\n"
+
+
+@generator(2)
+def cube_games(rng: random.Random, scale: float) -> str:
+    # part 1 asks about 12 red, 13 green and 14 blue cubes, most counts stay within them so that
+    # both possible and impossible games come up
+    limits = {"red": 12, "green": 13, "blue": 14}
+    lines = []
+
+    def count(color: str) -> int:
+        if rng.random() < 0.05:
+            return rng.randint(limits[color] + 1, 20)
+        return rng.randint(1, limits[color])
+
+    for game_id in range(1, scaled(100, scale) + 1):
+        reveals = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(list(limits), rng.randint(1, 3))
+            reveals.append(", ".join(f"{count(color)} {color}" for color in colors))
+        lines.append(f"Game {game_id}: " + "; ".join(reveals))
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(3)
+def engine_schematic(rng: random.Random, scale: float) -> str:
+    side = scaled_side(140, scale)
+    symbols = "*#+$/@%=&-"
+
+    lines = []
+    for _ in range(side):
+        row = []
+        while len(row) < side:
+            kind = rng.random()
+            if kind < 0.12:
+                number = str(rng.randint(1, 999))
+                if len(row) + len(number) >= side:
+                    row.append(".")
+                    continue
+                row.extend(number)
+                # a number is always followed by something that is not a digit
+                row.append(rng.choice("*.........#+"))
+            elif kind < 0.16:
+                row.append("*" if rng.random() < 0.4 else rng.choice(symbols))
+            else:
+                row.append(".")
+        lines.append("".join(row[:side]))
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(4)
+def scratchcards(rng: random.Random, scale: float) -> str:
+    card_count = scaled(200, scale)
+    id_width = len(str(card_count))
+
+    lines = []
+    for card_id in range(1, card_count + 1):
+        # Part 2 copies the next cards for every match. With less than one match per card on average
+        # the number of copies stays small, with more it grows exponentially with the card count.
+        matches = rng.choices(range(11), weights=(60, 18, 8, 5, 3, 2, 2, 1, 1, 0, 0))[0]
+        winning = rng.sample(range(1, 100), 10)
+        others = [n for n in range(1, 100) if n not in winning]
+        numbers = rng.sample(winning, matches) + rng.sample(others, 25 - matches)
+        rng.shuffle(numbers)
+        lines.append(
+            f"Card {card_id:>{id_width}}: "
+            + " ".join(f"{n:>2}" for n in winning)
+            + " | "
+            + " ".join(f"{n:>2}" for n in numbers)
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+ALMANAC_MAPS = [
+    "seed-to-soil",
+    "soil-to-fertilizer",
+    "fertilizer-to-water",
+    "water-to-light",
+    "light-to-temperature",
+    "temperature-to-humidity",
+    "humidity-to-location",
+]
+
+
+@generator(5)
+def almanac(rng: random.Random, scale: float) -> str:
+    upper = 2**32
+
+    seeds = []
+    for _ in range(scaled(10, scale)):
+        start = rng.randrange(upper // 2)
+        seeds += [start, rng.randint(1, 500_000_000)]
+
+    sections = ["seeds: " + " ".join(map(str, seeds))]
+
+    for name in ALMANAC_MAPS:
+        # the source ranges tile [0, 2^32), the destination ranges are the same blocks shuffled
+        cuts = sorted(rng.sample(range(1, upper), scaled(30, scale)))
+        bounds = [0, *cuts, upper]
+        lengths = [b - a for a, b in zip(bounds, bounds[1:])]
+
+        order = list(range(len(lengths)))
+        rng.shuffle(order)
+        destinations = {}
+        position = 0
+        for index in order:
+            destinations[index] = position
+            position += lengths[index]
+
+        entries = [
+            f"{destinations[i]} {bounds[i]} {lengths[i]}" for i in range(len(lengths))
+        ]
+        # like in the real input, some ranges are not mapped at all
+        entries = [e for e in entries if rng.random() < 0.9]
+        rng.shuffle(entries)
+        sections.append(f"{name} map:\n" + "\n".join(entries))
+
+    return "\n\n".join(sections) + "\n"
+
+
+@generator(6)
+def boat_races(rng: random.Random, scale: float) -> str:
+    times = []
+    distances = []
+
+    for _ in range(scaled(4, scale)):
+        time = rng.randint(30, 99)
+        # the record is always beatable, holding the button for time/2 goes time^2/4 far
+        distances.append(rng.randint(time * time // 8, time * time // 4 - 1))
+        times.append(time)
+
+    width = max(len(str(n)) for n in times + distances) + 2
+    return (
+        "Time:    " + "".join(f"{t:>{width}}" for t in times) + "\n"
+        "Distance:" + "".join(f"{d:>{width}}" for d in distances) + "\n"
+    )
+
+
+@generator(7)
+def camel_cards(rng: random.Random, scale: float) -> str:
+    lines = []
+
+    for _ in range(scaled(1000, scale)):
+        hand = "".join(rng.choices("AKQJT98765432", k=5))
+        lines.append(f"{hand} {rng.randint(1, 1000)}")
+
+    return "\n".join(lines) + "\n"
+
+
+SMALL_PRIMES = [43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97, 101, 103, 107, 109]
+
+
+@generator(8)
+def haunted_wasteland(rng: random.Random, scale: float) -> str:
+    instruction_count = 263
+    instructions = "".join(rng.choices("LR", k=instruction_count))
+
+    ghost_count = 6
+    # every ghost walks its own loop, the first Z comes after exactly one loop length,
+    # so the answer of part 2 is the least common multiple of the lengths
+    primes = rng.sample(SMALL_PRIMES, ghost_count)
+    multiplier = max(round(scale), 1)
+    loop_lengths = [p * multiplier for p in primes]
+
+    inner_count = sum(2 * (length - 1) for length in loop_lengths)
+    alphabet = ascii_uppercase[1:-1]
+    inner_names = iter(unique_names(rng, inner_count, alphabet=alphabet, length=3))
+
+    start_ends = [("AAA", "ZZZ")]
+    endpoint_names = unique_names(rng, ghost_count - 1, alphabet=alphabet, length=2)
+    start_ends += [(name + "A", name + "Z") for name in endpoint_names]
+
+    nodes = []
+    for (start, end), length in zip(start_ends, loop_lengths):
+        # two parallel lanes, L and R both move one layer ahead, the end node leads back to layer 1
+        layers = [[start]]
+        layers += [[next(inner_names), next(inner_names)] for _ in range(length - 1)]
+        layers.append([end])
+
+        for layer, following in zip(layers, layers[1:]):
+            left, right = following[0], following[-1]
+            for name in layer:
+                nodes.append(f"{name} = ({left}, {right})")
+        nodes.append(f"{end} = ({layers[1][0]}, {layers[1][1]})")
+
+    rng.shuffle(nodes)
+    return instructions + "\n\n" + "\n".join(nodes) + "\n"
+
+
+@generator(9)
+def oasis_report(rng: random.Random, scale: float) -> str:
+    lines = []
+
+    for _ in range(scaled(200, scale)):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(2, 7))]
+        values = [
+            sum(c * x**k for k, c in enumerate(coefficients)) for x in range(21)
+        ]
+        lines.append(" ".join(map(str, values)))
+
+    return "\n".join(lines) + "\n"
+
+
+PIPES = {
+    frozenset({(1, 0), (-1, 0)}): "-",
+    frozenset({(0, 1), (0, -1)}): "|",
+    frozenset({(0, -1), (1, 0)}): "L",
+    frozenset({(0, 1), (-1, 0)}): "7",
+    frozenset({(0, -1), (-1, 0)}): "J",
+    frozenset({(0, 1), (1, 0)}): "F",
+}
+
+
+def random_tree(rng: random.Random, cells: set) -> list[tuple]:
+    # randomized Prim's algorithm on a set of grid cells
+    start = rng.choice(sorted(cells))
+    in_tree = {start}
+    frontier = [(start, n) for n in grid_neighbours(start) if n in cells]
+    edges = []
+
+    while frontier:
+        a, b = frontier.pop(rng.randrange(len(frontier)))
+        if b in in_tree:
+            continue
+        in_tree.add(b)
+        edges.append((a, b))
+        frontier.extend((b, n) for n in grid_neighbours(b) if n in cells and n not in in_tree)
+
+    return edges
+
+
+def grid_neighbours(cell: tuple[int, int]) -> list[tuple[int, int]]:
+    x, y = cell
+    return [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
+
+
+@generator(10)
+def pipe_maze(rng: random.Random, scale: float) -> str:
+    side = scaled_side(140, scale) // 2 * 2
+    half = side // 2
+
+    # grow a random connected blob of 2x2 blocks
+    seed = (half // 2, half // 2)
+    blob = {seed}
+    border = grid_neighbours(seed)
+    while len(blob) < 0.6 * half * half:
+        cell = border.pop(rng.randrange(len(border)))
+        x, y = cell
+        if cell in blob or not (0 <= x < half and 0 <= y < half):
+            continue
+        blob.add(cell)
+        border.extend(grid_neighbours(cell))
+
+    # Walking around a spanning tree of the blocks gives a single loop through every cell of the blob:
+    # every block is a small square loop, a tree edge opens the two facing sides and joins the loops.
+    links = defaultdict(set)
+
+    def connect(a, b):
+        links[a].add(b)
+        links[b].add(a)
+
+    def disconnect(a, b):
+        links[a].discard(b)
+        links[b].discard(a)
+
+    for bx, by in blob:
+        x, y = 2 * bx, 2 * by
+        connect((x, y), (x + 1, y))
+        connect((x, y + 1), (x + 1, y + 1))
+        connect((x, y), (x, y + 1))
+        connect((x + 1, y), (x + 1, y + 1))
+
+    for (ax, ay), (bx, by) in random_tree(rng, blob):
+        (ax, ay), (bx, by) = sorted([(ax, ay), (bx, by)])
+        x, y = 2 * ax, 2 * ay
+        if bx > ax:
+            disconnect((x + 1, y), (x + 1, y + 1))
+            disconnect((x + 2, y), (x + 2, y + 1))
+            connect((x + 1, y), (x + 2, y))
+            connect((x + 1, y + 1), (x + 2, y + 1))
+        else:
+            disconnect((x, y + 1), (x + 1, y + 1))
+            disconnect((x, y + 2), (x + 1, y + 2))
+            connect((x, y + 1), (x, y + 2))
+            connect((x + 1, y + 1), (x + 1, y + 2))
+
+    grid = [[rng.choice("|-LJ7F.") for _ in range(side)] for _ in range(side)]
+    for (x, y), neighbours in links.items():
+        grid[y][x] = PIPES[frozenset((nx - x, ny - y) for nx, ny in neighbours)]
+
+    start_x, start_y = rng.choice(sorted(links))
+    grid[start_y][start_x] = "S"
+
+    # junk pipes next to S must not look like they connect to it
+    for nx, ny in grid_neighbours((start_x, start_y)):
+        if 0 <= nx < side and 0 <= ny < side and (nx, ny) not in links[(start_x, start_y)]:
+            pipe = grid[ny][nx]
+            for shape, char in PIPES.items():
+                if char == pipe and (start_x - nx, start_y - ny) in shape:
+                    grid[ny][nx] = "."
+
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+@generator(11)
+def galaxy_image(rng: random.Random, scale: float) -> str:
+    side = scaled_side(140, scale)
+
+    empty_rows = {y for y in range(side) if rng.random() < 0.06}
+    empty_columns = {x for x in range(side) if rng.random() < 0.06}
+
+    lines = []
+    for y in range(side):
+        row = [
+            "#"
+            if y not in empty_rows and x not in empty_columns and rng.random() < 0.025
+            else "."
+            for x in range(side)
+        ]
+        lines.append("".join(row))
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(12)
+def spring_records(rng: random.Random, scale: float) -> str:
+    lines = []
+
+    while len(lines) < scaled(1000, scale):
+        groups = [rng.randint(1, 4) for _ in range(rng.randint(1, 6))]
+
+        # lay out the groups with random gaps, then hide some of the springs
+        record = "." * rng.randint(0, 2)
+        for i, group in enumerate(groups):
+            record += "#" * group
+            record += "." * rng.randint(1 if i < len(groups) - 1 else 0, 2)
+
+        # the records of the real input are at most 20 long
+        if len(record) > 20:
+            continue
+
+        hidden = rng.uniform(0.3, 0.7)
+        record = "".join("?" if rng.random() < hidden else ch for ch in record)
+        lines.append(f"{record} {','.join(map(str, groups))}")
+
+    return "\n".join(lines) + "\n"
+
+
+def reflection_differences(rows: list[str], i: int) -> int:
+    # number of different cells when reflecting between the row i and i + 1
+    size = min(i + 1, len(rows) - i - 1)
+    return sum(
+        a != b
+        for k in range(size)
+        for a, b in zip(rows[i - k], rows[i + 1 + k])
+    )
+
+
+def mirror_differences(pattern: list[str]) -> list[int]:
+    columns = ["".join(column) for column in zip(*pattern)]
+    return [reflection_differences(pattern, i) for i in range(len(pattern) - 1)] + [
+        reflection_differences(columns, i) for i in range(len(columns) - 1)
+    ]
+
+
+def mirrored_pattern(rng: random.Random) -> list[str]:
+    # One perfect vertical mirror, and a horizontal mirror that is broken by a single smudge.
+    # The smudge is put in a column that the vertical mirror does not reach, so it keeps that one intact.
+    height = rng.randint(7, 17)
+    width = rng.randint(9, 17)
+
+    mirror_column = rng.randint(0, width // 2 - 2)
+    mirror_row = rng.randint(0, height - 2)
+
+    parent = {}
+
+    def find(cell):
+        while parent.get(cell, cell) != cell:
+            cell = parent[cell]
+        return cell
+
+    def union(a, b):
+        parent[find(a)] = find(b)
+
+    for y in range(height):
+        for x in range(width):
+            mirrored_x = 2 * mirror_column + 1 - x
+            if 0 <= mirrored_x < width:
+                union((x, y), (mirrored_x, y))
+            mirrored_y = 2 * mirror_row + 1 - y
+            if 0 <= mirrored_y < height:
+                union((x, y), (x, mirrored_y))
+
+    values = {}
+    grid = [
+        [values.setdefault(find((x, y)), rng.choice("#.")) for x in range(width)]
+        for y in range(height)
+    ]
+
+    reach = min(mirror_row + 1, height - mirror_row - 1)
+    smudge_y = rng.randint(mirror_row - reach + 1, mirror_row)
+    smudge_x = rng.randint(2 * mirror_column + 2, width - 1)
+    grid[smudge_y][smudge_x] = "#" if grid[smudge_y][smudge_x] == "." else "."
+
+    pattern = ["".join(row) for row in grid]
+    if rng.random() < 0.5:
+        pattern = ["".join(column) for column in zip(*pattern)]
+    return pattern
+
+
+@generator(13)
+def mirror_patterns(rng: random.Random, scale: float) -> str:
+    patterns = []
+
+    while len(patterns) < scaled(100, scale):
+        pattern = mirrored_pattern(rng)
+        # random cells can line up into extra mirrors, only keep patterns with one answer per part
+        differences = mirror_differences(pattern)
+        if differences.count(0) == 1 and differences.count(1) == 1:
+            patterns.append("\n".join(pattern))
+
+    return "\n\n".join(patterns) + "\n"
+
+
+@generator(14)
+def rock_platform(rng: random.Random, scale: float) -> str:
+    side = scaled_side(100, scale)
+    lines = [
+        "".join(rng.choices("O#.", weights=(0.2, 0.15, 0.65), k=side))
+        for _ in range(side)
+    ]
+    return "\n".join(lines) + "\n"
+
+
+@generator(15)
+def initialization_sequence(rng: random.Random, scale: float) -> str:
+    step_count = scaled(4000, scale)
+    labels = unique_names(rng, max(step_count // 8, 1), length=2)
+
+    steps = []
+    for _ in range(step_count):
+        label = rng.choice(labels)
+        if rng.random() < 0.6:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+        else:
+            steps.append(f"{label}-")
+
+    return ",".join(steps) + "\n"
+
+
+@generator(16)
+def mirror_contraption(rng: random.Random, scale: float) -> str:
+    side = scaled_side(110, scale)
+    lines = [
+        "".join(rng.choices(".|-/\\", weights=(0.9, 0.025, 0.025, 0.025, 0.025), k=side))
+        for _ in range(side)
+    ]
+    return "\n".join(lines) + "\n"
+
+
+@generator(17)
+def heat_loss_map(rng: random.Random, scale: float) -> str:
+    side = scaled_side(141, scale)
+    lines = ["".join(rng.choices("123456789", k=side)) for _ in range(side)]
+    return "\n".join(lines) + "\n"
+
+
+def skyline(rng: random.Random, columns: int, max_width: int, max_height: int) -> list[tuple[str, int]]:
+    # The outline of a histogram, a simple polygon: up the left side, along the stepped top edge,
+    # down the right side and back along the bottom. It always has 2 * columns + 2 edges.
+    heights = [rng.randint(1, max_height)]
+    for _ in range(columns - 1):
+        height = rng.randint(1, max_height)
+        while height == heights[-1]:
+            height = rng.randint(1, max_height)
+        heights.append(height)
+    widths = [rng.randint(1, max_width) for _ in range(columns)]
+
+    instructions = [("U", heights[0]), ("R", widths[0])]
+    for previous, height, width in zip(heights, heights[1:], widths[1:]):
+        instructions.append(("U" if height > previous else "D", abs(height - previous)))
+        instructions.append(("R", width))
+    instructions.append(("D", heights[-1]))
+    instructions.append(("L", sum(widths)))
+
+    return instructions
+
+
+@generator(18)
+def dig_plan(rng: random.Random, scale: float) -> str:
+    columns = scaled(350, scale)
+    largest = 0xFFFFF
+
+    visible = skyline(rng, columns, max_width=10, max_height=100)
+    # the second polygon is hidden in the colors, its edges have to fit into 5 hex digits
+    hidden = skyline(rng, columns, max_width=max(largest // columns, 1), max_height=largest)
+    direction_digits = {"R": 0, "D": 1, "L": 2, "U": 3}
+
+    lines = [
+        f"{direction} {count} (#{hidden_count:05x}{direction_digits[hidden_direction]})"
+        for (direction, count), (hidden_direction, hidden_count) in zip(visible, hidden)
+    ]
+    return "\n".join(lines) + "\n"
+
+
+@generator(19)
+def workflows_and_parts(rng: random.Random, scale: float) -> str:
+    workflow_count = scaled(550, scale)
+    names = iter(unique_names(rng, workflow_count - 1, exclude={"in"}))
+
+    # grow a tree of workflows breadth first, every workflow is referenced by exactly one rule
+    workflows = {}
+    pending = ["in"]
+    created = 1
+
+    def new_target() -> str:
+        nonlocal created
+        if created < workflow_count and rng.random() < 0.55:
+            created += 1
+            target = next(names)
+            pending.append(target)
+            return target
+        return rng.choice("AR")
+
+    while pending:
+        name = pending.pop(0)
+        rules = []
+        for _ in range(rng.randint(1, 3)):
+            category = rng.choice("xmas")
+            operator = rng.choice("<>")
+            rules.append(f"{category}{operator}{rng.randint(1, 4000)}:{new_target()}")
+        # the last rule has no condition
+        rules.append(new_target())
+        workflows[name] = rules
+
+    workflow_lines = [f"{name}{{{','.join(rules)}}}" for name, rules in workflows.items()]
+    rng.shuffle(workflow_lines)
+
+    part_lines = [
+        "{" + ",".join(f"{c}={rng.randint(1, 4000)}" for c in "xmas") + "}"
+        for _ in range(scaled(200, scale))
+    ]
+
+    return "\n".join(workflow_lines) + "\n\n" + "\n".join(part_lines) + "\n"
+
+
+@generator(20)
+def pulse_modules(rng: random.Random, scale: float) -> str:
+    # The well known shape of the real input: 12 bit binary counters made of flip-flops.
+    # When a counter reaches its period, the conjunction watching it resets it and sends a
+    # high pulse through an inverter to "kl", which feeds "rx".
+    counter_count = scaled(4, scale)
+    bits = 12
+
+    names = iter(unique_names(rng, counter_count * (bits + 2), exclude={"kl", "rx"}))
+
+    lines = []
+    broadcast_targets = []
+    inverters = []
+
+    for _ in range(counter_count):
+        period = rng.randint(2**(bits - 1) + 1, 2**bits - 1) | 1
+        flip_flops = [next(names) for _ in range(bits)]
+        hub = next(names)
+        inverter = next(names)
+        broadcast_targets.append(flip_flops[0])
+        inverters.append(inverter)
+
+        hub_targets = [inverter]
+        for i, flip_flop in enumerate(flip_flops):
+            targets = [flip_flops[i + 1]] if i + 1 < bits else []
+            if period >> i & 1:
+                targets.append(hub)
+            if i == 0 or not period >> i & 1:
+                hub_targets.append(flip_flop)
+            # the top bit is always set, so every flip-flop has a target
+            lines.append(f"%{flip_flop} -> {', '.join(targets)}")
+
+        lines.append(f"&{hub} -> {', '.join(hub_targets)}")
+        lines.append(f"&{inverter} -> kl")
+
+    lines.append(f"broadcaster -> {', '.join(broadcast_targets)}")
+    lines.append("&kl -> rx")
+
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+@generator(21)
+def garden(rng: random.Random, scale: float) -> str:
+    side = scaled_side(131, scale) // 2 * 2 + 1
+    middle = side // 2
+
+    grid = [
+        ["#" if rng.random() < 0.1 else "." for _ in range(side)] for _ in range(side)
+    ]
+    # like in the real input, the row and the column of the start are free
+    for i in range(side):
+        grid[middle][i] = "."
+        grid[i][middle] = "."
+    grid[middle][middle] = "S"
+
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+@generator(22)
+def brick_snapshot(rng: random.Random, scale: float) -> str:
+    brick_count = scaled(1200, scale)
+    footprint = scaled_side(10, scale, minimum=3)
+    max_z = max(brick_count // 3, 10)
+
+    occupied = set()
+    lines = []
+
+    while len(lines) < brick_count:
+        length = rng.randint(1, 4)
+        axis = rng.choice("xyz")
+        x1, y1, z1 = rng.randrange(footprint), rng.randrange(footprint), rng.randint(1, max_z)
+        x2, y2, z2 = x1, y1, z1
+        if axis == "x":
+            x2 = min(x1 + length - 1, footprint - 1)
+        elif axis == "y":
+            y2 = min(y1 + length - 1, footprint - 1)
+        else:
+            z2 = z1 + length - 1
+
+        cells = {
+            (x, y, z)
+            for x in range(x1, x2 + 1)
+            for y in range(y1, y2 + 1)
+            for z in range(z1, z2 + 1)
+        }
+        if cells & occupied:
+            continue
+
+        occupied |= cells
+        lines.append(f"{x1},{y1},{z1}~{x2},{y2},{z2}")
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(23)
+def hiking_trails(rng: random.Random, scale: float) -> str:
+    # A 6x6 lattice of junctions joined by corridors, like the real input. Slopes next to the junctions
+    # only allow going right or down, so part 1 sees a directed graph, part 2 ignores them.
+    # The number of paths explodes with the size of the lattice, so only the corridors grow with the scale.
+    junctions_per_side = 6
+    spacing = max(round((scaled_side(141, scale) - 3) / (junctions_per_side - 1)), 4)
+    side = spacing * (junctions_per_side - 1) + 3
+
+    grid = [["#"] * side for _ in range(side)]
+    positions = [1 + spacing * i for i in range(junctions_per_side)]
+
+    for y in positions:
+        for x in range(1, side - 1):
+            grid[y][x] = "."
+    for x in positions:
+        for y in range(1, side - 1):
+            grid[y][x] = "."
+
+    for y in positions:
+        for x in positions:
+            if x + 1 < side - 1:
+                grid[y][x + 1] = ">"
+                grid[y][x + spacing - 1] = ">"
+            if y + 1 < side - 1:
+                grid[y + 1][x] = "v"
+                grid[y + spacing - 1][x] = "v"
+
+    grid[0][1] = "."
+    grid[side - 1][side - 2] = "."
+
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+@generator(24)
+def hailstones(rng: random.Random, scale: float) -> str:
+    # every hailstone meets the rock at some point in time, so part 2 has an answer
+    rock_position = [rng.randint(220_000_000_000_000, 380_000_000_000_000) for _ in range(3)]
+    rock_velocity = [rng.randint(-200, 200) for _ in range(3)]
+
+    lines = []
+    times = set()
+    while len(lines) < scaled(300, scale):
+        time = rng.randint(10_000_000_000, 200_000_000_000)
+        if time in times:
+            continue
+        times.add(time)
+
+        velocity = []
+        for v in rock_velocity:
+            hail_v = v
+            while hail_v == v or hail_v == 0:
+                hail_v = v + rng.randint(-400, 400)
+            velocity.append(hail_v)
+
+        position = [p + time * (v - hv) for p, v, hv in zip(rock_position, rock_velocity, velocity)]
+        lines.append(
+            ", ".join(map(str, position)) + " @ " + ", ".join(map(str, velocity))
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(25)
+def wiring_diagram(rng: random.Random, scale: float) -> str:
+    # Two well connected halves joined by exactly three wires.
+    # Each half is a ring where every component is connected to its next two components,
+    # so cutting fewer than four wires never splits a half.
+    sizes = [scaled(750, scale, minimum=5), scaled(700, scale, minimum=5)]
+    names = unique_names(rng, sum(sizes), length=3)
+    halves = [names[: sizes[0]], names[sizes[0]:]]
+
+    edges = set()
+    for half in halves:
+        n = len(half)
+        for i in range(n):
+            edges.add(frozenset((half[i], half[(i + 1) % n])))
+            edges.add(frozenset((half[i], half[(i + 2) % n])))
+        for _ in range(n):
+            a, b = rng.sample(half, 2)
+            edges.add(frozenset((a, b)))
+
+    left = rng.sample(halves[0], 3)
+    right = rng.sample(halves[1], 3)
+    edges |= {frozenset(pair) for pair in zip(left, right)}
+
+    wires = defaultdict(list)
+    for edge in edges:
+        a, b = rng.sample(sorted(edge), 2)
+        wires[a].append(b)
+
+    lines = [f"{name}: {' '.join(others)}" for name, others in wires.items()]
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
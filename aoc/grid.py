@@ -0,0 +1,166 @@
+"""Compact 2D board for the grid puzzles.
+
+The cells are single bytes in one flat bytearray, addressed by integer indices instead of (x, y) tuples.
+The board is surrounded by a one cell wide border filled with a sentinel byte, so stepping from any
+real cell in any of the 8 directions gives a valid index, and checking for the sentinel replaces the
+bounds checks. Pick a sentinel that does not occur in the puzzle, or one that behaves like a wall.
+
+    grid = Grid.from_file("input.txt", border="#")
+    start = grid.find("S")
+    for offset in grid.offsets:
+        if grid.cells[start + offset] == ord("."):
+            ...
+"""
+
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Union
+
+from aoc.inputs import InputFile
+
+Position = Union[int, tuple[int, int]]
+
+
+class Grid:
+    width: int
+    height: int
+    # distance between two vertically adjacent cells in the flat array
+    stride: int
+    cells: bytearray
+    border: int
+
+    def __init__(self, width: int, height: int, border: str = " ", fill: str = "."):
+        self.width = width
+        self.height = height
+        self.stride = width + 2
+        self.border = ord(border)
+
+        self.cells = bytearray(border.encode()) * (self.stride * (height + 2))
+        for y in range(height):
+            start = self.index(0, y)
+            self.cells[start : start + width] = fill.encode() * width
+
+        # offsets of the neighbours, in clockwise order starting with up
+        self.up = -self.stride
+        self.right = 1
+        self.down = self.stride
+        self.left = -1
+        self.offsets = (self.up, self.right, self.down, self.left)
+        self.diagonal_offsets = (
+            self.up + self.left,
+            self.up + self.right,
+            self.down + self.right,
+            self.down + self.left,
+        )
+        self.all_offsets = self.offsets + self.diagonal_offsets
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[Union[str, bytes]], border: str = " ") -> "Grid":
+        rows = [line.encode() if isinstance(line, str) else bytes(line) for line in lines]
+        rows = [row.rstrip(b"\r\n") for row in rows]
+        while rows and not rows[-1]:
+            rows.pop()
+
+        width = len(rows[0]) if rows else 0
+        grid = cls(width, len(rows), border=border)
+
+        for y, row in enumerate(rows):
+            if len(row) != width:
+                raise ValueError(f"Row {y} is {len(row)} long, expected {width}")
+            start = grid.index(0, y)
+            grid.cells[start : start + width] = row
+
+        return grid
+
+    @classmethod
+    def from_text(cls, text: str, border: str = " ") -> "Grid":
+        return cls.from_lines(text.splitlines(), border=border)
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path], border: str = " ") -> "Grid":
+        with InputFile(path) as data:
+            return cls.from_lines(data.lines(), border=border)
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def coords(self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.stride)
+        return x - 1, y - 1
+
+    def _to_index(self, position: Position) -> int:
+        if isinstance(position, tuple):
+            return self.index(*position)
+        return position
+
+    def __getitem__(self, position: Position) -> str:
+        return chr(self.cells[self._to_index(position)])
+
+    def __setitem__(self, position: Position, value: str):
+        self.cells[self._to_index(position)] = ord(value)
+
+    def __contains__(self, position: tuple[int, int]) -> bool:
+        x, y = position
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def is_border(self, index: int) -> bool:
+        x, y = self.coords(index)
+        return not (0 <= x < self.width and 0 <= y < self.height)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return (self.width, self.height, self.cells) == (other.width, other.height, other.cells)
+
+    def copy(self) -> "Grid":
+        result = Grid.__new__(Grid)
+        result.__dict__.update(self.__dict__)
+        result.cells = self.cells[:]
+        return result
+
+    def row(self, y: int) -> memoryview:
+        # zero-copy view of a row, without the border
+        start = self.index(0, y)
+        return memoryview(self.cells)[start : start + self.width]
+
+    def column(self, x: int) -> memoryview:
+        # zero-copy strided view of a column, without the border
+        start = self.index(x, 0)
+        return memoryview(self.cells)[start : start + self.height * self.stride : self.stride]
+
+    def row_indices(self, y: int) -> range:
+        start = self.index(0, y)
+        return range(start, start + self.width)
+
+    def column_indices(self, x: int) -> range:
+        start = self.index(x, 0)
+        return range(start, start + self.height * self.stride, self.stride)
+
+    def indices(self) -> Iterator[int]:
+        # every cell inside the border, row by row
+        for y in range(self.height):
+            yield from self.row_indices(y)
+
+    def find(self, char: str) -> int:
+        value = ord(char)
+        for y in range(self.height):
+            x = self.row(y).tobytes().find(value)
+            if x != -1:
+                return self.index(x, y)
+        raise ValueError(f"'{char}' is not in the grid")
+
+    def find_all(self, char: str) -> list[int]:
+        value = ord(char)
+        return [i for i in self.indices() if self.cells[i] == value]
+
+    def neighbours(self, index: int) -> list[int]:
+        return [index + offset for offset in self.offsets]
+
+    def lines(self) -> list[str]:
+        return [self.row(y).tobytes().decode() for y in range(self.height)]
+
+    def __str__(self) -> str:
+        return "\n".join(self.lines())
+
+    def __repr__(self) -> str:
+        return f"Grid({self.width}x{self.height})"
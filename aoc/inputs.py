@@ -0,0 +1,145 @@
+"""Puzzle inputs, found next to the solution instead of in the working directory.
+
+    with open_input(__file__, filename) as data:
+        for line in data.text_lines():
+            ...
+
+    for line in read_lines(__file__, filename):
+        ...
+
+Relative names are resolved against the folder of the module passed in, absolute paths are used as
+they are. Files of MMAP_THRESHOLD bytes or more are memory-mapped, smaller ones are read in one go.
+Either way `lines()` and `view()` hand out memoryviews of the data without copying it, and
+`text_lines()` decodes one line at a time, so a big input is never turned into one huge str.
+
+The memoryviews point into the mapping, do not keep them after the file is closed - turn them into
+bytes, str or numbers first. A mapping that still has views when it is closed is left to the
+garbage collector.
+
+Huge inputs are processed in pieces: `line_ranges()` cuts a byte range into pieces that end on
+line breaks, so every piece can go to a process of its own, and `release()` hands the pages of the
+mapping that are done with back to the OS, so the resident memory does not grow with the file.
+"""
+
+import mmap
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Optional, Union
+
+PathLike = Union[str, Path]
+
+MMAP_THRESHOLD = 1 << 20
+
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
+
+
+def resolve(module_file: PathLike, filename: PathLike) -> Path:
+    # path of the input, relative names are relative to the folder of the module
+    path = Path(filename)
+    if path.is_absolute():
+        return path
+    return Path(module_file).resolve().parent / path
+
+
+class InputFile:
+    def __init__(self, path: PathLike):
+        self.path = Path(path)
+        self._map: Optional[mmap.mmap] = None
+
+        with open(self.path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            # empty files cannot be mapped
+            if size >= MMAP_THRESHOLD and size > 0:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self.data: Union[bytes, mmap.mmap] = self._map
+            else:
+                self.data = f.read()
+
+        self._view = memoryview(self.data)
+
+    @property
+    def is_mapped(self) -> bool:
+        return self._map is not None
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def view(self, start: int = 0, stop: Optional[int] = None) -> memoryview:
+        return self._view[start:stop]
+
+    def lines(self, start: int = 0, stop: Optional[int] = None) -> Iterator[memoryview]:
+        # the lines without their line breaks, like bytes.splitlines() for "\n" and "\r\n"
+        # start has to be the start of a line, the range should end after a line break
+        data = self.data
+        view = self._view
+        end = len(data) if stop is None else stop
+
+        while start < end:
+            line_end = data.find(b"\n", start, end)
+            if line_end == -1:
+                line_end = end
+            next_start = line_end + 1
+
+            if line_end > start and data[line_end - 1] == CARRIAGE_RETURN:
+                line_end -= 1
+
+            yield view[start:line_end]
+            start = next_start
+
+    def line_ranges(self, size: int, start: int = 0, stop: Optional[int] = None) -> Iterator[tuple[int, int]]:
+        # consecutive (start, stop) ranges of about size bytes covering [start, stop), each one ends
+        # after a line break (or at stop), a line longer than size makes its range longer
+        data = self.data
+        end = len(data) if stop is None else stop
+        size = max(size, 1)
+
+        while start < end:
+            range_end = end
+            if start + size < end:
+                line_break = data.find(b"\n", start + size - 1, end)
+                if line_break != -1:
+                    range_end = line_break + 1
+            yield start, range_end
+            start = range_end
+
+    def release(self, start: int, stop: int):
+        # the pages of the mapping in [start, stop) are not needed any more, they are read again if they are
+        if self._map is None or not hasattr(mmap, "MADV_DONTNEED"):
+            return
+        start -= start % mmap.PAGESIZE
+        if stop > start:
+            self._map.madvise(mmap.MADV_DONTNEED, start, stop - start)
+
+    def text_lines(self) -> Iterator[str]:
+        for line in self.lines():
+            yield str(line, "utf-8")
+
+    def text(self) -> str:
+        return str(self._view, "utf-8")
+
+    def close(self):
+        self._view.release()
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # views of the mapping are still around, it is closed when they are gone
+                pass
+
+    def __enter__(self) -> "InputFile":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_input(module_file: PathLike, filename: PathLike = "input.txt") -> InputFile:
+    return InputFile(resolve(module_file, filename))
+
+
+def read_lines(module_file: PathLike, filename: PathLike = "input.txt") -> Iterator[str]:
+    # the decoded lines of the input one by one, the file is closed when they run out
+    with open_input(module_file, filename) as data:
+        yield from data.text_lines()
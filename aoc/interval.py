@@ -0,0 +1,238 @@
+"""Integer ranges and the algebra the range puzzles need.
+
+Every range is half-open, [start, stop), like range(). The work done by the operations depends on the
+number of ranges, never on the size of the values in them.
+
+- Interval: one range, split at a value, intersect, shift
+- IntervalSet: a union of disjoint ranges, with union, intersection, difference and measure
+- PiecewiseLinearMap: shifts values by a fixed offset inside some ranges, identity elsewhere;
+  maps whole interval sets at once and composes with another map
+- Box: an N-dimensional product of intervals, split along an axis and measured by its volume
+"""
+
+import bisect
+import math
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True, order=True)
+class Interval:
+    start: int
+    stop: int
+
+    @classmethod
+    def from_length(cls, start: int, length: int) -> "Interval":
+        return cls(start, start + length)
+
+    @classmethod
+    def closed(cls, first: int, last: int) -> "Interval":
+        # the inclusive range first..last
+        return cls(first, last + 1)
+
+    @property
+    def length(self) -> int:
+        return max(self.stop - self.start, 0)
+
+    def is_empty(self) -> bool:
+        return self.stop <= self.start
+
+    def __contains__(self, value: int) -> bool:
+        return self.start <= value < self.stop
+
+    def intersect(self, other: "Interval") -> "Interval":
+        start = max(self.start, other.start)
+        return Interval(start, max(min(self.stop, other.stop), start))
+
+    def split(self, at: int) -> tuple["Interval", "Interval"]:
+        # the values below `at` and the rest, either can be empty
+        at = min(max(at, self.start), self.stop)
+        return Interval(self.start, at), Interval(at, self.stop)
+
+    def shift(self, offset: int) -> "Interval":
+        return Interval(self.start + offset, self.stop + offset)
+
+
+class IntervalSet:
+    # sorted, disjoint, non-touching, non-empty intervals
+    intervals: list[Interval]
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        self.intervals = []
+
+        for interval in sorted(i for i in intervals if not i.is_empty()):
+            last = self.intervals[-1] if self.intervals else None
+            if last is not None and interval.start <= last.stop:
+                self.intervals[-1] = Interval(last.start, max(last.stop, interval.stop))
+            else:
+                self.intervals.append(interval)
+
+    def __iter__(self) -> Iterator[Interval]:
+        return iter(self.intervals)
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def __bool__(self) -> bool:
+        return bool(self.intervals)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.intervals == other.intervals
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({self.intervals})"
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect.bisect_right(self.intervals, value, key=lambda interval: interval.start) - 1
+        return i >= 0 and value in self.intervals[i]
+
+    def measure(self) -> int:
+        return sum(interval.length for interval in self.intervals)
+
+    def min(self) -> int:
+        if not self.intervals:
+            raise ValueError("min() of an empty IntervalSet")
+        return self.intervals[0].start
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        return IntervalSet([*self.intervals, *other.intervals])
+
+    def intersect(self, other: "IntervalSet") -> "IntervalSet":
+        result = []
+        i = j = 0
+
+        while i < len(self.intervals) and j < len(other.intervals):
+            a, b = self.intervals[i], other.intervals[j]
+            common = a.intersect(b)
+            if not common.is_empty():
+                result.append(common)
+            # drop the interval that ends first, it can not overlap anything later
+            if a.stop < b.stop:
+                i += 1
+            else:
+                j += 1
+
+        return IntervalSet(result)
+
+    def difference(self, other: "IntervalSet") -> "IntervalSet":
+        result = []
+        j = 0
+
+        for interval in self.intervals:
+            start = interval.start
+            while j < len(other.intervals) and other.intervals[j].stop <= start:
+                j += 1
+            k = j
+            while k < len(other.intervals) and other.intervals[k].start < interval.stop:
+                hole = other.intervals[k]
+                if hole.start > start:
+                    result.append(Interval(start, hole.start))
+                start = max(start, hole.stop)
+                k += 1
+            if start < interval.stop:
+                result.append(Interval(start, interval.stop))
+
+        return IntervalSet(result)
+
+    __or__ = union
+    __and__ = intersect
+    __sub__ = difference
+
+
+class PiecewiseLinearMap:
+    # sorted, disjoint (interval, offset) pieces, values outside of them map to themselves
+    pieces: list[tuple[Interval, int]]
+
+    def __init__(self, pieces: Iterable[tuple[Interval, int]] = ()):
+        self.pieces = sorted((p for p in pieces if not p[0].is_empty()), key=lambda p: p[0])
+        self._starts = [interval.start for interval, _ in self.pieces]
+
+        for (a, _), (b, _) in zip(self.pieces, self.pieces[1:]):
+            if b.start < a.stop:
+                raise ValueError(f"Overlapping pieces {a} and {b}")
+
+    def __repr__(self) -> str:
+        return f"PiecewiseLinearMap({self.pieces})"
+
+    def _piece_at(self, value: int) -> Optional[tuple[Interval, int]]:
+        i = bisect.bisect_right(self._starts, value) - 1
+        if i >= 0 and value in self.pieces[i][0]:
+            return self.pieces[i]
+        return None
+
+    def __call__(self, value: int) -> int:
+        piece = self._piece_at(value)
+        return value if piece is None else value + piece[1]
+
+    def split(self, interval: Interval) -> list[tuple[Interval, int]]:
+        # cut the interval along the pieces, with the offset that applies to each part
+        result = []
+        start = interval.start
+
+        i = max(bisect.bisect_right(self._starts, start) - 1, 0)
+        while start < interval.stop and i < len(self.pieces):
+            piece, offset = self.pieces[i]
+            if piece.stop <= start:
+                i += 1
+                continue
+            if piece.start >= interval.stop:
+                break
+            if piece.start > start:
+                result.append((Interval(start, piece.start), 0))
+                start = piece.start
+            stop = min(piece.stop, interval.stop)
+            result.append((Interval(start, stop), offset))
+            start = stop
+            i += 1
+
+        if start < interval.stop:
+            result.append((Interval(start, interval.stop), 0))
+
+        return result
+
+    def image(self, values: IntervalSet) -> IntervalSet:
+        return IntervalSet(
+            part.shift(offset) for interval in values for part, offset in self.split(interval)
+        )
+
+    def then(self, other: "PiecewiseLinearMap") -> "PiecewiseLinearMap":
+        # the map that applies self first and other after it
+        pieces = []
+
+        # where self shifts the values, other acts on the shifted values
+        for interval, offset in self.pieces:
+            for part, other_offset in other.split(interval.shift(offset)):
+                pieces.append((part.shift(-offset), offset + other_offset))
+
+        # elsewhere only other acts
+        domain = IntervalSet(interval for interval, _ in self.pieces)
+        for interval, offset in other.pieces:
+            for part in IntervalSet([interval]) - domain:
+                pieces.append((part, offset))
+
+        return PiecewiseLinearMap(p for p in pieces if p[1] != 0)
+
+
+@dataclass(frozen=True)
+class Box:
+    sides: tuple[Interval, ...]
+
+    def is_empty(self) -> bool:
+        return any(side.is_empty() for side in self.sides)
+
+    def volume(self) -> int:
+        return math.prod(side.length for side in self.sides)
+
+    def intersect(self, other: "Box") -> "Box":
+        return Box(tuple(a.intersect(b) for a, b in zip(self.sides, other.sides)))
+
+    def split(self, axis: int, at: int) -> tuple["Box", "Box"]:
+        # the part below `at` along the axis and the rest, either can be empty
+        below, above = self.sides[axis].split(at)
+        return self._with_side(axis, below), self._with_side(axis, above)
+
+    def _with_side(self, axis: int, side: Interval) -> "Box":
+        return Box(self.sides[:axis] + (side,) + self.sides[axis + 1 :])
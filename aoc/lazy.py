@@ -0,0 +1,43 @@
+"""Deferred imports of heavy, optional dependencies.
+
+    nx = lazy_import("networkx")
+
+binds a placeholder that imports networkx on the first attribute access. Importing the solution
+costs nothing, and a missing library only fails the code path that needs it.
+Use string annotations ("nx.Graph") for types of the lazy module, they are not evaluated.
+"""
+
+import importlib
+from types import ModuleType
+
+
+class LazyModule:
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            try:
+                self._module = importlib.import_module(self._name)
+            except ImportError as e:
+                raise ModuleNotFoundError(
+                    f"This solution needs '{self._name}', install it to run it", name=self._name
+                ) from e
+        return self._module
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._module is not None
+
+    def __getattr__(self, attr: str):
+        # only called for attributes the placeholder itself does not have
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    return LazyModule(name)
@@ -0,0 +1,123 @@
+"""Memory of the running solutions, beyond what tracemalloc sees.
+
+tracemalloc only traces the Python allocator. The resident set size (RSS) is the memory the OS
+actually gives the process - interpreter, C extensions and fragmentation included - and it is what
+gets a process killed. The precise numbers come from /proc on Linux: /proc/<pid>/status has the
+current RSS (VmRSS) and its peak (VmHWM), and writing 5 to /proc/self/clear_refs resets the peak,
+so every part gets its own. Elsewhere the peak comes from getrusage and covers the whole life of
+the process, and the RSS of other processes is not available.
+"""
+
+import re
+import sys
+import threading
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+try:
+    import resource
+except ImportError:
+    # Windows
+    resource = None
+
+STATUS_FIELD = re.compile(r"^(VmRSS|VmHWM):\s+(\d+) kB$", re.M)
+
+
+def _status(pid: Optional[int]) -> dict[str, int]:
+    path = Path("/proc") / ("self" if pid is None else str(pid)) / "status"
+    try:
+        text = path.read_text()
+    except OSError:
+        return {}
+    return {name: int(kilobytes) * 1024 for name, kilobytes in STATUS_FIELD.findall(text)}
+
+
+def supported() -> bool:
+    # can the RSS of the worker processes be read
+    return "VmRSS" in _status(None)
+
+
+def rss(pid: Optional[int] = None) -> Optional[int]:
+    # current resident set size of the process in bytes, None if it is gone or it cannot be read
+    return _status(pid).get("VmRSS")
+
+
+def reset_peak_rss() -> bool:
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss() -> Optional[int]:
+    # highest resident set size of this process since the last reset, in bytes
+    peak = _status(None).get("VmHWM")
+    if peak is not None or resource is None:
+        return peak
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class PeakSnapshot:
+    """Snapshot of the traced allocations close to the peak of a part, while tracemalloc is on.
+
+    A background thread checks the traced memory every few milliseconds and takes a new snapshot
+    whenever it has grown by a quarter since the last one. The last snapshot shows where the memory
+    was allocated near the peak, not only what survived until the end of the part.
+    """
+
+    def __init__(self, interval: float = 0.01, growth: float = 1.25, minimum: int = 1 << 16):
+        self.interval = interval
+        self.growth = growth
+        self.minimum = minimum
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self._taken_at = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def check(self):
+        current = tracemalloc.get_traced_memory()[0]
+        if current >= self.minimum and current >= self._taken_at * self.growth:
+            self.snapshot = tracemalloc.take_snapshot()
+            self._taken_at = current
+
+    def top(self, limit: int = 5) -> list[str]:
+        # the lines that allocated the most memory in the snapshot, largest first
+        if self.snapshot is None:
+            return []
+
+        snapshot = self.snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, threading.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            ]
+        )
+
+        lines = []
+        for stat in snapshot.statistics("lineno")[:limit]:
+            frame = stat.traceback[0]
+            filename = "/".join(Path(frame.filename).parts[-2:])
+            lines.append(
+                f"{filename}:{frame.lineno}: {stat.size / 2**20:.1f} MiB in {stat.count} blocks"
+            )
+        return lines
+
+    def __enter__(self) -> "PeakSnapshot":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        # the part may have ended before the thread noticed its peak
+        self.check()
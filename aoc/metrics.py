@@ -0,0 +1,103 @@
+"""Operation counts of the hot loops, to compare algorithms by the work they do.
+
+    pops = metrics.counter("search.pops")
+    for ...:
+        pops.inc()
+
+Get the counters and histograms once, outside of the loops. When metrics are disabled (the default,
+AOC_METRICS=1 enables them) every call returns a shared null object whose methods do nothing, so an
+instrumented loop only pays for an empty method call. Loops tight enough to notice even that can
+count in a local variable and add the total once at the end.
+
+The runner resets the metrics before every part and stores what was recorded next to the answer.
+"""
+
+import math
+import os
+from typing import Optional, Union
+
+
+def enabled() -> bool:
+    return os.environ.get("AOC_METRICS", "0") == "1"
+
+
+class Counter:
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: int = 1):
+        self.value += amount
+
+    def snapshot(self) -> int:
+        return self.value
+
+
+class Histogram:
+    # count, sum, min, max and power of two buckets of the observed values
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        # bucket k holds the values in (2^(k-1), 2^k], bucket 0 holds 1 and below
+        self.buckets: dict[int, int] = {}
+
+    def observe(self, value: float):
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+        bucket = (math.ceil(value) - 1).bit_length() if value > 1 else 0
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.total / self.count if self.count else None,
+            "buckets": {f"<={2**k}": n for k, n in sorted(self.buckets.items())},
+        }
+
+
+class NullCounter:
+    def inc(self, amount: int = 1):
+        pass
+
+
+class NullHistogram:
+    def observe(self, value: float):
+        pass
+
+
+NULL_COUNTER = NullCounter()
+NULL_HISTOGRAM = NullHistogram()
+
+_registry: dict[str, Union[Counter, Histogram]] = {}
+
+
+def _get(name: str, kind: type):
+    metric = _registry.get(name)
+    if metric is None:
+        metric = _registry[name] = kind()
+    elif not isinstance(metric, kind):
+        raise TypeError(f"Metric '{name}' is a {type(metric).__name__}, not a {kind.__name__}")
+    return metric
+
+
+def counter(name: str) -> Union[Counter, NullCounter]:
+    return _get(name, Counter) if enabled() else NULL_COUNTER
+
+
+def histogram(name: str) -> Union[Histogram, NullHistogram]:
+    return _get(name, Histogram) if enabled() else NULL_HISTOGRAM
+
+
+def snapshot() -> dict:
+    return {name: metric.snapshot() for name, metric in sorted(_registry.items())}
+
+
+def reset():
+    _registry.clear()
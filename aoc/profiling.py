@@ -0,0 +1,265 @@
+"""Profile a single part of a solution.
+
+Two profilers are available:
+
+- cprofile: deterministic, every call is recorded. Writes a .pstats file (for pstats, snakeviz, ...)
+  and a collapsed-stack file derived from the call graph of the stats.
+- sample: a background thread records the stack of the solution every few milliseconds. Much
+  lower overhead, so the timings are closer to reality, but only a collapsed-stack file is written.
+
+The collapsed-stack files have one "frame;frame;frame count" line per stack, ready for flamegraph.pl,
+speedscope or inferno. For cprofile the count is in microseconds, for sample it is the number of samples.
+"""
+
+import cProfile
+import contextlib
+import io
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable, Optional
+
+from aoc.days import ROOT, Day, day_context, load_module
+
+PROFILERS = ("cprofile", "sample")
+
+DEFAULT_DIRECTORY = ROOT / "profiles"
+
+# (file, line, function name), the key of the functions in pstats
+FunctionKey = tuple[str, int, str]
+
+
+@dataclass
+class ProfileReport:
+    day: int
+    part: int
+    profiler: str
+    answer: Any = None
+    wall_time: float = 0.0
+    error: Optional[str] = None
+    files: list[Path] = field(default_factory=list)
+    # (self, total, calls or None, function label), the top rows sorted by self
+    top: list[tuple[float, float, Optional[int], str]] = field(default_factory=list)
+    # unit of the self and total columns
+    unit: str = "s"
+
+    def summary(self) -> str:
+        title = f"day {self.day:02d} part {self.part} ({self.profiler})"
+        if self.error is not None:
+            return f"{title}: {self.error}"
+
+        lines = [f"{title}: answer {self.answer}, {self.wall_time:.3f} s"]
+        lines.extend(f"  wrote {path}" for path in self.files)
+
+        if self.top:
+            lines.append(f"  {'self':>10}  {'total':>10}  {'calls':>9}  function")
+            for own, total, calls, label in self.top:
+                lines.append(
+                    f"  {format_amount(own, self.unit):>10}  {format_amount(total, self.unit):>10}"
+                    f"  {'-' if calls is None else calls:>9}  {label}"
+                )
+
+        return "\n".join(lines)
+
+
+def format_amount(value: float, unit: str) -> str:
+    return f"{value:.3f}s" if unit == "s" else f"{value:.0f}"
+
+
+def label(function: FunctionKey) -> str:
+    # same layout as pstats, with the file name only: main.py:47(enter_light)
+    filename, line, name = function
+    if filename == "~":
+        return name
+    return f"{Path(filename).name}:{line}({name})"
+
+
+def is_profiler(function: FunctionKey) -> bool:
+    # Profile.disable() is recorded too, it is not part of the solution
+    return "_lsprof.Profiler" in function[2]
+
+
+def collapsed_from_stats(stats: dict, min_time: float = 1e-6) -> Counter:
+    """Approximate the stacks from the caller -> callee times recorded by cProfile.
+
+    cProfile only keeps one level of callers, so the time of a function is shared among the paths
+    leading to it in proportion to the time its callers spent calling it. Recursion is cut at the
+    first repeated function of a path.
+    """
+    children = defaultdict(list)
+    for function, (_, _, _, _, callers) in stats.items():
+        for caller, (_, _, _, cumulative) in callers.items():
+            children[caller].append((function, cumulative))
+
+    stacks = Counter()
+
+    def walk(function: FunctionKey, path: list[str], on_path: set, share: float):
+        _, _, own, cumulative, _ = stats[function]
+
+        path.append(label(function))
+        on_path.add(function)
+
+        if own * share >= min_time:
+            stacks[";".join(path)] += own * share
+
+        for callee, time_from_here in children[function]:
+            callee_total = stats[callee][3]
+            if callee in on_path or callee_total <= 0:
+                continue
+            callee_share = share * time_from_here / callee_total
+            if callee_total * callee_share >= min_time:
+                walk(callee, path, on_path, callee_share)
+
+        path.pop()
+        on_path.discard(function)
+
+    roots = [
+        function
+        for function, values in stats.items()
+        if not values[4] and not is_profiler(function)
+    ]
+    for root in roots:
+        walk(root, [], set(), 1.0)
+
+    return stacks
+
+
+def write_collapsed(stacks: Counter, path: Path, scale: float = 1.0):
+    with open(path, "w") as f:
+        for stack, value in sorted(stacks.items()):
+            count = round(value * scale)
+            if count > 0:
+                f.write(f"{stack} {count}\n")
+
+
+def run_with_cprofile(func: Callable, directory: Path, name: str, report: ProfileReport, top: int):
+    profiler = cProfile.Profile()
+
+    try:
+        profiler.enable()
+        report.answer = func()
+    finally:
+        profiler.disable()
+
+        stats_path = directory / f"{name}.pstats"
+        profiler.dump_stats(stats_path)
+
+        stats = pstats.Stats(profiler, stream=io.StringIO()).stats
+        collapsed_path = directory / f"{name}.collapsed"
+        write_collapsed(collapsed_from_stats(stats), collapsed_path, scale=1_000_000)
+
+        report.files = [stats_path, collapsed_path]
+        rows = sorted(
+            ((f, values) for f, values in stats.items() if not is_profiler(f)),
+            key=lambda item: item[1][2],
+            reverse=True,
+        )[:top]
+        report.top = [(own, total, calls, label(f)) for f, (_, calls, own, total, _) in rows]
+
+
+class Sampler:
+    # samples the stacks of one thread below the frame running `root`
+    def __init__(self, root: Callable, interval: float):
+        self.root_code = root.__code__
+        self.interval = interval
+        self.thread_id = threading.get_ident()
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self._record(frame)
+
+    def _record(self, frame: FrameType):
+        path = []
+        while frame is not None:
+            code = frame.f_code
+            path.append(label((code.co_filename, code.co_firstlineno, code.co_name)))
+            if code is self.root_code:
+                self.stacks[";".join(reversed(path))] += 1
+                return
+            frame = frame.f_back
+        # outside of the solution, eg. before it started
+
+    def __enter__(self) -> "Sampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+
+def run_with_sampler(
+    func: Callable, directory: Path, name: str, report: ProfileReport, top: int, interval: float
+):
+    sampler = Sampler(func, interval)
+
+    try:
+        with sampler:
+            report.answer = func()
+    finally:
+        collapsed_path = directory / f"{name}.collapsed"
+        write_collapsed(sampler.stacks, collapsed_path)
+        report.files = [collapsed_path]
+
+        own = Counter()
+        total = Counter()
+        for stack, count in sampler.stacks.items():
+            frames = stack.split(";")
+            own[frames[-1]] += count
+            for frame in set(frames):
+                total[frame] += count
+
+        report.unit = "samples"
+        report.top = [(count, total[frame], None, frame) for frame, count in own.most_common(top)]
+
+
+def profile_part(
+    day: Day,
+    part: int,
+    profiler: str = "cprofile",
+    directory: Path = DEFAULT_DIRECTORY,
+    top: int = 15,
+    interval: float = 0.005,
+) -> ProfileReport:
+    report = ProfileReport(day.number, part, profiler)
+
+    if profiler not in PROFILERS:
+        raise ValueError(f"Unknown profiler '{profiler}', expected one of {PROFILERS}")
+
+    try:
+        module = load_module(day)
+    except Exception as e:
+        report.error = f"import failed: {type(e).__name__}: {e}"
+        return report
+
+    func = getattr(module, f"part_{part}", None)
+    if func is None:
+        report.error = "not implemented"
+        return report
+
+    directory.mkdir(parents=True, exist_ok=True)
+    name = f"{day.name}-part-{part}"
+
+    start = time.perf_counter()
+    try:
+        with day_context(day), contextlib.redirect_stdout(io.StringIO()):
+            if profiler == "cprofile":
+                run_with_cprofile(func, directory, name, report, top)
+            else:
+                run_with_sampler(func, directory, name, report, top, interval)
+    except Exception as e:
+        report.error = f"{type(e).__name__}: {e}"
+    finally:
+        report.wall_time = time.perf_counter() - start
+
+    return report
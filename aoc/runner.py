@@ -0,0 +1,318 @@
+import contextlib
+import io
+import json
+import multiprocessing
+import multiprocessing.connection
+import os
+import time
+import tracemalloc
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+from aoc import answers, memory, metrics
+from aoc.days import Day, day_context, load_module
+
+PARTS = (1, 2)
+
+# how often the memory of the workers is checked against the limit, in seconds
+WATCH_INTERVAL = 0.01
+
+
+@dataclass
+class PartResult:
+    day: int
+    part: int
+    answer: Any = None
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    # peak of the memory traced by tracemalloc while the part was running, in bytes
+    peak_memory: Optional[int] = None
+    # peak resident set size of the process while the part was running, in bytes
+    peak_rss: Optional[int] = None
+    # the lines that had allocated the most memory near the traced peak
+    top_allocations: Optional[list[str]] = None
+    error: Optional[str] = None
+    # the answer came from the answer store, the solution did not run
+    cached: bool = False
+    # counters and histograms recorded by the solution, when AOC_METRICS=1
+    metrics: Optional[dict] = None
+
+    def to_json(self) -> dict:
+        result = asdict(self)
+        result["answer"] = json_answer(self.answer)
+        return result
+
+
+def json_answer(answer: Any) -> Any:
+    # answers are mostly ints, but keep anything else JSON friendly
+    if not isinstance(answer, (int, float, str, type(None))):
+        return repr(answer)
+    return answer
+
+
+def run_part(day: Day, part: int, measure_memory: bool = True, allocations: bool = False) -> PartResult:
+    mode = answers.answer_cache_mode()
+    if mode == answers.OFF:
+        return solve_part(day, part, measure_memory, allocations)
+
+    start = time.perf_counter()
+    keys = (answers.input_hash(day), answers.source_hash(day))
+    store = answers.default_store()
+
+    if mode == answers.USE:
+        found, answer = store.get(day.number, part, *keys)
+        if found:
+            return PartResult(
+                day.number,
+                part,
+                answer=answer,
+                wall_time=time.perf_counter() - start,
+                cached=True,
+            )
+
+    result = solve_part(day, part, measure_memory, allocations)
+
+    # None is what the unfinished parts return, there is nothing worth remembering in them
+    if result.error is None and result.answer is not None:
+        store.put(day.number, part, *keys, result.answer, result.wall_time)
+
+    return result
+
+
+def solve_part(day: Day, part: int, measure_memory: bool = True, allocations: bool = False) -> PartResult:
+    result = PartResult(day.number, part)
+
+    try:
+        module = load_module(day)
+    except Exception as e:
+        result.error = f"import failed: {type(e).__name__}: {e}"
+        return result
+
+    func = getattr(module, f"part_{part}", None)
+    if func is None:
+        result.error = "not implemented"
+        return result
+
+    # the solutions like to print debug output, keep it out of the report
+    output = io.StringIO()
+
+    if measure_memory:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+    # a thread polls tracemalloc for the snapshots, it slows the part down, so only on request
+    allocations = allocations and measure_memory
+    peak_snapshot = memory.PeakSnapshot() if allocations else contextlib.nullcontext()
+
+    metrics.reset()
+    memory.reset_peak_rss()
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        with day_context(day), contextlib.redirect_stdout(output), peak_snapshot:
+            result.answer = func()
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    finally:
+        result.wall_time = time.perf_counter() - wall_start
+        result.cpu_time = time.process_time() - cpu_start
+        result.peak_rss = memory.peak_rss()
+        if measure_memory:
+            result.peak_memory = tracemalloc.get_traced_memory()[1]
+            if allocations:
+                result.top_allocations = peak_snapshot.top()
+            tracemalloc.stop()
+        if metrics.enabled():
+            result.metrics = metrics.snapshot()
+
+    return result
+
+
+def default_worker_count() -> int:
+    return os.cpu_count() or 1
+
+
+def collect_result(future: Future, day: Day, part: int) -> PartResult:
+    try:
+        return future.result()
+    except Exception as e:
+        # the worker process died (eg. killed by the OS), the pool reports it here
+        return PartResult(day.number, part, error=f"{type(e).__name__}: {e}")
+
+
+def run_part_in_child(
+    connection: multiprocessing.connection.Connection,
+    day: Day,
+    part: int,
+    measure_memory: bool,
+    allocations: bool,
+):
+    connection.send(run_part(day, part, measure_memory, allocations))
+    connection.close()
+
+
+def run_isolated(
+    tasks: list[tuple[Day, int]],
+    measure_memory: bool,
+    workers: int,
+    memory_limit: int,
+    allocations: bool = False,
+) -> list[PartResult]:
+    # Every part runs in a process of its own, at most `workers` at a time. The parent checks the
+    # resident memory of the running ones and kills any that goes over the limit; the other parts
+    # are not affected, unlike a process pool which breaks when one of its workers is killed.
+    results: dict[int, PartResult] = {}
+    waiting = list(reversed(range(len(tasks))))
+    running = {}
+
+    while waiting or running:
+        while waiting and len(running) < max(workers, 1):
+            index = waiting.pop()
+            day, part = tasks[index]
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(
+                target=run_part_in_child, args=(sender, day, part, measure_memory, allocations), daemon=True
+            )
+            process.start()
+            sender.close()
+            running[index] = (process, receiver, time.perf_counter())
+
+        multiprocessing.connection.wait(
+            [receiver for _, receiver, _ in running.values()], timeout=WATCH_INTERVAL
+        )
+
+        for index, (process, receiver, started) in list(running.items()):
+            day, part = tasks[index]
+
+            if receiver.poll():
+                try:
+                    results[index] = receiver.recv()
+                except EOFError:
+                    process.join()
+                    results[index] = PartResult(
+                        day.number, part, error=f"worker exited with code {process.exitcode}"
+                    )
+            else:
+                current = memory.rss(process.pid)
+                if current is None or current <= memory_limit:
+                    continue
+                process.kill()
+                results[index] = PartResult(
+                    day.number,
+                    part,
+                    wall_time=time.perf_counter() - started,
+                    peak_rss=current,
+                    error=f"killed: {current / 2**20:.1f} MiB resident, over the limit of {memory_limit / 2**20:.1f} MiB",
+                )
+
+            process.join()
+            receiver.close()
+            del running[index]
+
+    return [results[index] for index in range(len(tasks))]
+
+
+def run_days(
+    days: list[Day],
+    parts: tuple[int, ...] = PARTS,
+    measure_memory: bool = True,
+    workers: int = 1,
+    memory_limit: Optional[int] = None,
+    allocations: bool = False,
+) -> list[PartResult]:
+    # allocations lists the lines behind the peak of traced memory, it needs measure_memory
+    tasks = [(day, part) for day in days for part in parts]
+
+    if memory_limit is not None:
+        return run_isolated(tasks, measure_memory, workers, memory_limit, allocations)
+
+    if workers <= 1 or len(tasks) <= 1:
+        return [run_part(day, part, measure_memory, allocations) for day, part in tasks]
+
+    # Every part is an independent task, so the two parts of a slow day run side by side too.
+    # Futures are collected in submission order, the report does not depend on which part finishes first.
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+        futures = [
+            executor.submit(run_part, day, part, measure_memory, allocations) for day, part in tasks
+        ]
+        return [
+            collect_result(future, day, part)
+            for future, (day, part) in zip(futures, tasks)
+        ]
+
+
+def format_table(results: list[PartResult], elapsed: Optional[float] = None) -> str:
+    header = ("day", "part", "answer", "wall [s]", "cpu [s]", "traced [MiB]", "rss [MiB]")
+
+    rows = []
+    for r in results:
+        answer = r.error if r.error is not None else str(r.answer)
+        if r.cached:
+            answer += " (cached)"
+        peak = "-" if r.peak_memory is None else f"{r.peak_memory / 2**20:.1f}"
+        rss = "-" if r.peak_rss is None else f"{r.peak_rss / 2**20:.1f}"
+        rows.append(
+            (
+                f"{r.day:02d}",
+                str(r.part),
+                answer,
+                f"{r.wall_time:.3f}",
+                f"{r.cpu_time:.3f}",
+                peak,
+                rss,
+            )
+        )
+
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    # answers are left aligned, the numbers are right aligned
+    align = ["<", "<", "<", ">", ">", ">", ">"]
+
+    lines = []
+    for row in [header, *rows]:
+        lines.append(
+            "  ".join(f"{cell:{a}{w}}" for cell, a, w in zip(row, align, widths))
+        )
+    lines.insert(1, "  ".join("-" * w for w in widths))
+
+    total_wall = sum(r.wall_time for r in results)
+    total_cpu = sum(r.cpu_time for r in results)
+    summary = f"total: {total_wall:.3f} s wall, {total_cpu:.3f} s cpu"
+    if elapsed is not None:
+        summary += f", {elapsed:.3f} s elapsed"
+    lines.append(summary)
+
+    return "\n".join(lines)
+
+
+def format_metrics(results: list[PartResult]) -> str:
+    lines = []
+
+    for r in results:
+        if not r.metrics:
+            continue
+        lines.append(f"day {r.day:02d} part {r.part}")
+        for name, value in r.metrics.items():
+            if isinstance(value, dict):
+                # histograms
+                mean = "-" if value["mean"] is None else f"{value['mean']:.1f}"
+                value = f"count {value['count']}, mean {mean}, min {value['min']}, max {value['max']}"
+            lines.append(f"  {name}: {value}")
+
+    return "\n".join(lines)
+
+
+def format_allocations(results: list[PartResult]) -> str:
+    lines = []
+
+    for r in results:
+        if not r.top_allocations:
+            continue
+        lines.append(f"day {r.day:02d} part {r.part}")
+        lines.extend(f"  {allocation}" for allocation in r.top_allocations)
+
+    return "\n".join(lines)
+
+
+def format_json(results: list[PartResult]) -> str:
+    return json.dumps([r.to_json() for r in results], indent=2)
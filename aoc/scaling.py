@@ -0,0 +1,236 @@
+"""Empirical complexity of the solutions.
+
+Every part runs on generated inputs of growing size - scale s, 2s, 4s, ... - and the slope of
+log(time) over log(input size in bytes) estimates the exponent of its running time: about 1 for
+linear, 2 for quadratic. A part is flagged when the slope is worse than its declared target.
+
+Each measurement runs in a child process that is killed after a timeout, so a part that explodes
+does not hang the benchmark. The inputs are parsed from scratch every time.
+"""
+
+import contextlib
+import io
+import math
+import multiprocessing
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from aoc import generators
+from aoc.days import Day, day_context, load_module
+
+# parts added without a declared target should grow linearly
+DEFAULT_TARGET = 1.0
+
+# Declared exponent of every part, compared with the slope measured on the generated inputs.
+# n is the size of the input; the grids grow in both directions, so their side is sqrt(n).
+TARGETS: dict[tuple[int, int], float] = {
+    # one pass over the input, or over the lines, numbers or cells parsed from it
+    **{(day, part): 1.0 for day in range(1, 26) for part in (1, 2)},
+    # the distance of every pair of galaxies, and the galaxies grow with the image
+    (11, 1): 2.0,
+    (11, 2): 2.0,
+    # the brute force is exponential in the unknown springs of a record. The records do not get
+    # longer with the scale, but a larger input is more likely to hold the few records that take
+    # most of the time, which measures about 1.3
+    (12, 1): 1.5,
+    # the spin cycles until the platform repeats grow with its size, and each one moves every rock
+    (14, 2): 2.0,
+    # a beam from each of the sqrt(n) edge tiles crosses a share of the grid, n^1.5 in theory;
+    # the generated contraptions measure 2.3 to 2.4, within the tolerance of 2.3
+    (16, 2): 2.3,
+    # every falling brick is checked against the settled bricks below it
+    (22, 1): 2.0,
+    (22, 2): 2.0,
+    # the paths of every pair of hailstones are intersected
+    (24, 1): 2.0,
+    # networkx.minimum_edge_cut runs a maximum flow from one node to each of the others
+    (25, 1): 2.0,
+}
+
+# the slope may exceed the target by this much before the part is flagged, timings are noisy
+TOLERANCE = 0.3
+
+# parts too slow to start from the default scale
+START_SCALES: dict[tuple[int, int], float] = {
+    # the brute force tries every arrangement of the unknown springs
+    (12, 1): 0.02,
+}
+
+# points faster than this are dominated by overhead and left out of the fit
+MIN_FIT_TIME = 0.002
+
+
+@dataclass
+class ScalingPoint:
+    scale: float
+    # size of the generated input in bytes
+    size: int
+    # fastest of the timed runs
+    seconds: float
+
+
+@dataclass
+class ScalingResult:
+    day: int
+    part: int
+    target: float
+    points: list[ScalingPoint] = field(default_factory=list)
+    slope: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.day:02d}/{self.part}"
+
+    @property
+    def too_slow(self) -> bool:
+        return self.slope is not None and self.slope > self.target + TOLERANCE
+
+
+def target(day: int, part: int) -> float:
+    return TARGETS.get((day, part), DEFAULT_TARGET)
+
+
+def fit_slope(points: list[ScalingPoint]) -> Optional[float]:
+    # least squares slope of log(seconds) over log(size)
+    usable = [p for p in points if p.seconds >= MIN_FIT_TIME and p.size > 0]
+    if len(usable) < 2:
+        return None
+
+    xs = [math.log(p.size) for p in usable]
+    ys = [math.log(p.seconds) for p in usable]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if variance == 0:
+        return None
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+
+def _time_part(connection, day: Day, part: int, path: Path, repeat: int):
+    # runs in the child process, sends the fastest time or the error
+    try:
+        func = getattr(load_module(day), f"part_{part}", None)
+        if func is None:
+            connection.send(("error", "not implemented"))
+            return
+
+        timings = []
+        with day_context(day), contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func(str(path))
+                timings.append(time.perf_counter() - start)
+
+        connection.send(("ok", min(timings)))
+    except Exception as e:
+        connection.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        connection.close()
+
+
+def time_part(day: Day, part: int, path: Path, repeat: int, timeout: float) -> float:
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_time_part, args=(sender, day, part, path, repeat), daemon=True
+    )
+    process.start()
+    sender.close()
+
+    try:
+        if not receiver.poll(timeout):
+            process.kill()
+            raise TimeoutError(f"no answer within {timeout:.0f} s")
+        try:
+            status, value = receiver.recv()
+        except EOFError:
+            raise RuntimeError(f"worker exited with code {process.exitcode}") from None
+    finally:
+        process.join()
+        receiver.close()
+
+    if status == "error":
+        raise RuntimeError(value)
+    return value
+
+
+def measure_scaling(
+    day: Day,
+    part: int,
+    directory: Path,
+    start_scale: Optional[float] = None,
+    steps: int = 5,
+    repeat: int = 3,
+    max_time: float = 2.0,
+    seed: int = 0,
+) -> ScalingResult:
+    result = ScalingResult(day.number, part, target(day.number, part))
+    scale = start_scale if start_scale is not None else START_SCALES.get((day.number, part), 0.25)
+
+    for _ in range(steps):
+        path = directory / f"{day.name}-scale-{scale:g}.txt"
+        if not path.exists():
+            path.write_text(generators.generate(day.number, scale=scale, seed=seed))
+
+        try:
+            # a part twice as slow as allowed for the whole step still gets an answer
+            seconds = time_part(day, part, path, repeat, timeout=max(10 * max_time, 10.0))
+        except (RuntimeError, TimeoutError) as e:
+            if len(result.points) < 2:
+                result.error = f"scale {scale:g}: {e}"
+                return result
+            # the points so far still tell how the part grows
+            break
+
+        result.points.append(ScalingPoint(scale, path.stat().st_size, seconds))
+
+        # the next input would take at least twice as long
+        if seconds > max_time:
+            break
+        scale *= 2
+
+    result.slope = fit_slope(result.points)
+    return result
+
+
+def format_report(results: list[ScalingResult]) -> str:
+    header = ("day", "part", "points", "size [B]", "time [s]", "slope", "target", "")
+
+    rows = []
+    for r in results:
+        if r.error is not None:
+            rows.append((f"{r.day:02d}", str(r.part), "-", "-", "-", "-", f"{r.target:.1f}", r.error))
+            continue
+
+        first, last = r.points[0], r.points[-1]
+        rows.append(
+            (
+                f"{r.day:02d}",
+                str(r.part),
+                str(len(r.points)),
+                f"{first.size}-{last.size}",
+                f"{first.seconds:.4f}-{last.seconds:.4f}",
+                "-" if r.slope is None else f"{r.slope:.2f}",
+                f"{r.target:.1f}",
+                "WORSE THAN TARGET" if r.too_slow else ("too fast to fit" if r.slope is None else ""),
+            )
+        )
+
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    align = ["<", "<", ">", ">", ">", ">", ">", "<"]
+
+    lines = [
+        "  ".join(f"{cell:{a}{w}}" for cell, a, w in zip(row, align, widths)).rstrip()
+        for row in [header, *rows]
+    ]
+    lines.insert(1, "  ".join("-" * w for w in widths).rstrip())
+
+    return "\n".join(lines)
+
+
+def as_json(results: list[ScalingResult]) -> list[dict]:
+    return [{**asdict(r), "too_slow": r.too_slow} for r in results]
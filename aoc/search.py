@@ -0,0 +1,120 @@
+"""Shortest paths over integer-encoded states.
+
+The caller encodes its search state (position, direction, ...) into an int and supplies a successor
+function, which yields (next state, step cost) pairs. The costs must not be negative.
+
+    cost = shortest_path([start], successors, lambda state: state == goal)
+    costs = shortest_distances([start], successors)  # every reachable state
+
+With a heuristic the search is A*. The heuristic must never overestimate the remaining cost, and to
+get the optimal answer from the first goal popped it must be consistent - a lower bound of the cost
+that also holds step by step, like the Manhattan distance with costs of at least 1 per cell.
+"""
+
+import heapq
+from collections.abc import Callable, Iterable
+from typing import Optional
+
+from aoc import metrics
+from aoc.grid import Grid
+
+Successors = Callable[[int], Iterable[tuple[int, int]]]
+
+
+def shortest_path(
+    starts: Iterable[int],
+    successors: Successors,
+    is_goal: Callable[[int], bool],
+    heuristic: Optional[Callable[[int], int]] = None,
+) -> Optional[int]:
+    # cost of the cheapest path from any of the starts to a goal, None if no goal is reachable
+    best = {}
+    heap = []
+
+    for state in starts:
+        best[state] = 0
+        heap.append((heuristic(state) if heuristic else 0, 0, state))
+    heapq.heapify(heap)
+
+    # counted in locals, the loop is too hot even for the no-op metrics
+    pushes = len(heap)
+    pops = 0
+    stale = 0
+
+    try:
+        while heap:
+            _, cost, state = heapq.heappop(heap)
+            pops += 1
+
+            if cost > best[state]:
+                # a cheaper path to this state was found after this one was pushed
+                stale += 1
+                continue
+
+            if is_goal(state):
+                return cost
+
+            for next_state, step_cost in successors(state):
+                next_cost = cost + step_cost
+                if next_cost < best.get(next_state, next_cost + 1):
+                    best[next_state] = next_cost
+                    estimate = next_cost + heuristic(next_state) if heuristic else next_cost
+                    heapq.heappush(heap, (estimate, next_cost, next_state))
+                    pushes += 1
+
+        return None
+    finally:
+        record_work(pushes, pops, stale, len(best))
+
+
+def shortest_distances(starts: Iterable[int], successors: Successors) -> dict[int, int]:
+    # cost of the cheapest path from any of the starts to every reachable state
+    best = {}
+    heap = []
+
+    for state in starts:
+        best[state] = 0
+        heap.append((0, state))
+    heapq.heapify(heap)
+
+    pushes = len(heap)
+    pops = 0
+    stale = 0
+
+    while heap:
+        cost, state = heapq.heappop(heap)
+        pops += 1
+
+        if cost > best[state]:
+            stale += 1
+            continue
+
+        for next_state, step_cost in successors(state):
+            next_cost = cost + step_cost
+            if next_cost < best.get(next_state, next_cost + 1):
+                best[next_state] = next_cost
+                heapq.heappush(heap, (next_cost, next_state))
+                pushes += 1
+
+    record_work(pushes, pops, stale, len(best))
+
+    return best
+
+
+def record_work(pushes: int, pops: int, stale: int, states: int):
+    metrics.counter("search.pushes").inc(pushes)
+    metrics.counter("search.pops").inc(pops)
+    # pops of states that had been reached on a cheaper path since they were pushed
+    metrics.counter("search.stale_pops").inc(stale)
+    metrics.counter("search.states_reached").inc(states)
+
+
+def manhattan(grid: Grid, goal: int) -> Callable[[int], int]:
+    # Manhattan distance of a grid index from the goal index, as a heuristic
+    goal_x, goal_y = grid.coords(goal)
+
+    def distance(index: int) -> int:
+        x, y = grid.coords(index)
+        return abs(x - goal_x) + abs(y - goal_y)
+
+    return distance
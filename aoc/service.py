@@ -0,0 +1,311 @@
+"""Local solver service, so other tools can call the solutions without starting Python every time.
+
+    python -m aoc serve --port 8023
+    curl -s localhost:8023/solve -d '{"day": 17, "part": 1, "input": "2413432311323\\n..."}'
+
+A small HTTP/1.1 server on asyncio, on a TCP port or a Unix socket, with two endpoints:
+
+- GET /health: the days and the number of workers
+- POST /solve: a JSON object with the day, the part and the input text. The response is a JSON
+  object with the answer, the time the solution took, the time the request took and whether the
+  answer came from the answer store. 400 for a bad request, 500 when the solution raised,
+  504 when it did not finish within the timeout.
+
+The solutions run in worker processes that import every day once, when the service starts. A worker
+that runs over the timeout is killed and replaced, the other requests are not affected. Answers are
+stored in the answer store keyed by the hash of the input text, so a repeated input is answered
+without running the solution again (see aoc.answers for AOC_ANSWER_CACHE). The parsed inputs are not
+cached, the workers parse every request from scratch.
+"""
+
+import asyncio
+import contextlib
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from aoc import answers, batch
+from aoc.days import Day, discover_days, load_module
+from aoc.runner import PARTS, json_answer
+
+# requests bigger than this are refused, the real inputs are a few dozen KiB
+MAX_BODY = 64 * 2**20
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    504: "Gateway Timeout",
+}
+
+
+class BadRequest(Exception):
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def preload_days() -> dict[int, Day]:
+    days = {}
+    for day in discover_days():
+        days[day.number] = day
+        # a day that cannot be imported reports the error when it is asked for
+        with contextlib.suppress(Exception):
+            load_module(day)
+    return days
+
+
+def solve_text(day: Day, part: int, text: str) -> batch.BatchResult:
+    # the parts read their input from a file
+    with tempfile.TemporaryDirectory(prefix="aoc-service-") as directory:
+        path = Path(directory) / "input.txt"
+        path.write_text(text)
+        (result,) = batch.solve_file(day, path, (part,))
+    return result
+
+
+def worker_main(connection: multiprocessing.connection.Connection):
+    # runs in the worker process until the service closes the pipe
+    # every request is a new input, caching its parse would only grow the memory and the cache folder
+    os.environ["AOC_PARSE_CACHE"] = "0"
+    days = preload_days()
+
+    while True:
+        try:
+            day_number, part, text = connection.recv()
+        except EOFError:
+            return
+        connection.send(solve_text(days[day_number], part, text))
+
+
+class Worker:
+    def __init__(self):
+        self.connection, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=worker_main, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+
+    def call(self, day: int, part: int, text: str) -> batch.BatchResult:
+        # blocks until the worker answers, runs in a thread of the service
+        self.connection.send((day, part, text))
+        return self.connection.recv()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+class SolverService:
+    def __init__(self, workers: int = 1, timeout: float = 30.0, store: Optional[answers.AnswerStore] = None):
+        self.worker_count = max(workers, 1)
+        self.timeout = timeout
+        self.store = store
+        self.days: dict[int, Day] = {}
+        self._source_hashes: dict[int, str] = {}
+        self._idle: Optional[asyncio.Queue] = None
+        self._workers: list[Worker] = []
+        self._threads = ThreadPoolExecutor(max_workers=self.worker_count)
+
+    async def start(self):
+        # import the days here first, the forked workers inherit them
+        self.days = preload_days()
+        if self.store is None:
+            self.store = answers.default_store()
+        self._source_hashes = {
+            number: answers.source_hash(day) for number, day in self.days.items()
+        }
+
+        self._idle = asyncio.Queue()
+        for _ in range(self.worker_count):
+            self._add_worker(Worker())
+
+    def _add_worker(self, worker: Worker):
+        self._workers.append(worker)
+        self._idle.put_nowait(worker)
+
+    def _replace(self, worker: Worker):
+        worker.kill()
+        self._workers.remove(worker)
+        self._add_worker(Worker())
+
+    async def close(self):
+        for worker in self._workers:
+            worker.kill()
+        self._workers.clear()
+        self._threads.shutdown(wait=False, cancel_futures=True)
+
+    async def solve(self, day: int, part: int, text: str, timeout: Optional[float] = None) -> tuple[int, dict]:
+        start = time.perf_counter()
+        response = {"day": day, "part": part, "answer": None, "time": None, "cached": False, "error": None}
+
+        mode = answers.answer_cache_mode()
+        keys = (answers.text_hash(text), self._source_hashes[day])
+
+        if mode == answers.USE:
+            found, answer = self.store.get(day, part, *keys)
+            if found:
+                response.update(answer=json_answer(answer), cached=True)
+                response["elapsed"] = time.perf_counter() - start
+                return 200, response
+
+        timeout = self.timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        # waiting for a free worker does not count against the timeout
+        worker = await self._idle.get()
+
+        try:
+            result = await asyncio.wait_for(
+                loop.run_in_executor(self._threads, worker.call, day, part, text), timeout
+            )
+        except asyncio.TimeoutError:
+            self._replace(worker)
+            response["error"] = f"no answer within {timeout:g} s"
+            response["elapsed"] = time.perf_counter() - start
+            return 504, response
+        except (EOFError, OSError) as e:
+            # the worker died, eg. killed by the OS
+            self._replace(worker)
+            response["error"] = f"worker died: {type(e).__name__}: {e}"
+            response["elapsed"] = time.perf_counter() - start
+            return 500, response
+
+        self._idle.put_nowait(worker)
+
+        response.update(answer=json_answer(result.answer), time=result.time, error=result.error)
+        response["elapsed"] = time.perf_counter() - start
+
+        if result.error is not None:
+            return 500, response
+
+        if mode != answers.OFF and result.answer is not None:
+            self.store.put(day, part, *keys, result.answer, result.time)
+
+        return 200, response
+
+    async def route(self, method: str, target: str, body: bytes) -> tuple[int, dict]:
+        if target == "/health":
+            if method != "GET":
+                raise BadRequest("use GET", 405)
+            return 200, {"status": "ok", "days": sorted(self.days), "workers": self.worker_count}
+
+        if target == "/solve":
+            if method != "POST":
+                raise BadRequest("use POST", 405)
+            day, part, text, timeout = self.parse_solve_request(body)
+            return await self.solve(day, part, text, timeout)
+
+        raise BadRequest(f"no such endpoint: {target}", 404)
+
+    def parse_solve_request(self, body: bytes) -> tuple[int, int, str, Optional[float]]:
+        try:
+            request = json.loads(body)
+        except ValueError as e:
+            raise BadRequest(f"the body is not valid JSON: {e}") from None
+        if not isinstance(request, dict):
+            raise BadRequest("the body has to be a JSON object")
+
+        day, part, text = request.get("day"), request.get("part"), request.get("input")
+        timeout = request.get("timeout")
+
+        if day not in self.days:
+            raise BadRequest(f"no solution for day {day!r}")
+        if part not in PARTS:
+            raise BadRequest(f"part has to be one of {PARTS}, got {part!r}")
+        if not isinstance(text, str):
+            raise BadRequest("input has to be the text of the puzzle input")
+        if timeout is not None and (not isinstance(timeout, (int, float)) or timeout <= 0):
+            raise BadRequest("timeout has to be a positive number of seconds")
+
+        return day, part, text, timeout
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # one request per connection
+        try:
+            try:
+                method, target, body = await read_request(reader)
+                status, payload = await self.route(method, target, body)
+            except BadRequest as e:
+                status, payload = e.status, {"error": str(e)}
+
+            await write_response(writer, status, payload)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def read_request(reader: asyncio.StreamReader) -> tuple[str, str, bytes]:
+    request_line = (await reader.readline()).decode("latin-1").split()
+    if len(request_line) != 3:
+        raise BadRequest("malformed request line")
+    method, target, _ = request_line
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise BadRequest("malformed Content-Length") from None
+    if length > MAX_BODY:
+        raise BadRequest(f"the body is larger than {MAX_BODY} bytes", 413)
+
+    body = await reader.readexactly(length)
+    return method, target.split("?", 1)[0], body
+
+
+async def write_response(writer: asyncio.StreamWriter, status: int, payload: dict):
+    body = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n"
+        "\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+    # a worker forked while the connection was open holds the socket too, closing it here would
+    # not end the response
+    if writer.can_write_eof():
+        writer.write_eof()
+
+
+async def serve(
+    host: str = "127.0.0.1",
+    port: int = 8023,
+    unix_socket: Optional[Path] = None,
+    workers: int = 1,
+    timeout: float = 30.0,
+):
+    service = SolverService(workers, timeout)
+    await service.start()
+
+    if unix_socket is not None:
+        server = await asyncio.start_unix_server(service.handle_connection, path=unix_socket)
+        address = str(unix_socket)
+    else:
+        server = await asyncio.start_server(service.handle_connection, host, port)
+        address = f"http://{host}:{port}"
+
+    print(f"serving {len(service.days)} days with {service.worker_count} worker(s) on {address}", flush=True)
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
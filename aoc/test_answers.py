@@ -0,0 +1,42 @@
+from fractions import Fraction
+
+from aoc.answers import AnswerStore, aoc_imports, source_files
+from aoc.days import ROOT, get_day
+
+
+def test_store_round_trip(tmp_path):
+    store = AnswerStore(tmp_path / "answers.sqlite")
+
+    assert store.get(24, 2, "input", "source") == (False, None)
+
+    store.put(24, 2, "input", "source", Fraction(3, 1), 0.5)
+    assert store.get(24, 2, "input", "source") == (True, Fraction(3, 1))
+    assert store.get(24, 2, "input", "other source") == (False, None)
+
+    store.put(24, 2, "input", "source", 42, 0.5)
+    assert store.get(24, 2, "input", "source") == (True, 42)
+
+
+def test_source_files_follow_aoc_imports():
+    files = source_files(get_day(24))
+
+    assert ROOT / "day-24" / "main.py" in files
+    assert ROOT / "day-24" / "linalg.py" in files
+    assert ROOT / "aoc" / "cache.py" in files
+    # imported by aoc.cache
+    assert ROOT / "aoc" / "days.py" in files
+
+
+def test_source_files_follow_modules_imported_from_the_package():
+    # from aoc import metrics
+    files = source_files(get_day(12))
+
+    assert ROOT / "aoc" / "metrics.py" in files
+    assert ROOT / "aoc" / "__init__.py" in files
+
+
+def test_imported_names_that_are_not_modules_are_skipped(tmp_path):
+    path = tmp_path / "main.py"
+    path.write_text("from aoc import metrics\nfrom aoc.cache import parsed_input\n")
+
+    assert aoc_imports(path) == {"aoc", "aoc.metrics", "aoc.cache"}
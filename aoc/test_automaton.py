@@ -0,0 +1,39 @@
+import pytest
+
+from aoc.automaton import Automaton
+
+WORDS = {b"one": 1, b"two": 2, b"eight": 8, b"1": 1, b"2": 2, b"8": 8}
+
+
+def test_first_match_in_either_direction():
+    forward = Automaton(WORDS)
+    backward = Automaton({word[::-1]: value for word, value in WORDS.items()})
+
+    assert forward.find_first(b"xtwone3") == 2
+    assert backward.find_first(reversed(b"xtwone3")) == 1
+    assert forward.find_first(memoryview(b"abc8eightwo")) == 8
+    assert backward.find_first(reversed(memoryview(b"abceightwo"))) == 2
+    assert forward.find_first(b"nothing here") is None
+    assert forward.find_first(b"") is None
+
+
+def test_match_through_a_failure_link():
+    # "eigh" is not followed by "t", the scan carries on from the "h" of "hone"
+    automaton = Automaton({b"eight": 8, b"hone": 1})
+    assert automaton.find_first(b"eighone") == 1
+    # "on" is inside "hone" and ends first
+    automaton = Automaton({b"eight": 8, b"hone": 1, b"on": 5})
+    assert automaton.find_first(b"eighone") == 5
+
+
+def test_suffix_pattern_ends_with_the_longer_one():
+    automaton = Automaton({b"abcd": "long", b"cd": "suffix"})
+    assert automaton.find_first(b"xabcd") == "long"
+    assert automaton.find_first(b"xbcd") == "suffix"
+
+
+def test_invalid_patterns():
+    with pytest.raises(ValueError):
+        Automaton({b"": 1})
+    with pytest.raises(ValueError):
+        Automaton({b"a": None})
@@ -0,0 +1,50 @@
+import pytest
+
+from aoc.batch import find_inputs, run_batch
+from aoc.days import get_day
+
+RACES = "Time:      7  15   30\nDistance:  9  40  200\n"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    # keep the pickles of the parsed inputs out of the repository's cache
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path / "cache"))
+
+
+def test_find_inputs_matches_each_file_once(tmp_path):
+    (tmp_path / "b.txt").write_text("")
+    (tmp_path / "a.txt").write_text("")
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "c.txt").write_text("")
+
+    found = find_inputs([str(tmp_path / "*.txt"), str(tmp_path / "a.txt")])
+    assert found == [tmp_path / "a.txt", tmp_path / "b.txt"]
+
+    found = find_inputs([str(tmp_path / "**" / "*.txt")])
+    assert found == [tmp_path / "a.txt", tmp_path / "b.txt", tmp_path / "nested" / "c.txt"]
+
+
+def test_run_batch_passes_the_paths_to_the_parts(tmp_path):
+    sample = tmp_path / "sample.txt"
+    sample.write_text(RACES)
+
+    results = list(run_batch(get_day(6), [sample], workers=1))
+
+    assert [(r.file, r.part, r.answer, r.error) for r in results] == [
+        (str(sample), 1, 288, None),
+        (str(sample), 2, 71503, None),
+    ]
+    assert results[0].size == len(RACES)
+    assert results[0].to_json()["mb_per_s"] > 0
+
+
+def test_run_batch_reports_errors_per_part(tmp_path):
+    broken = tmp_path / "broken.txt"
+    broken.write_text("no races here\n")
+
+    results = list(run_batch(get_day(6), [broken], parts=(2,), workers=1))
+
+    assert len(results) == 1
+    assert results[0].answer is None
+    assert results[0].error.startswith("ValueError")
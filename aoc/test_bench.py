@@ -0,0 +1,53 @@
+import json
+
+from aoc.bench import (
+    BASELINE_VERSION,
+    IMPORT_MARKER,
+    BenchResult,
+    load_baseline,
+    parse_import_times,
+    percentile,
+    save_baseline,
+)
+
+IMPORT_TIME_OUTPUT = f"""\
+import time: self [us] | cumulative | imported package
+import time:       500 |        500 | encodings
+{IMPORT_MARKER}
+import time:      4189 |       4189 |     _hashlib
+import time:       695 |       4884 |   hashlib
+import time:       512 |      5396 | aoc.cache
+import time:       860 |        860 | aoc.lazy
+"""
+
+
+def test_parse_import_times_counts_top_level_imports_after_the_marker():
+    assert parse_import_times(IMPORT_TIME_OUTPUT) == (5396 + 860) / 1_000_000
+
+
+def test_percentile():
+    assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+    assert percentile([3.0, 1.0, 2.0], 95) == 3.0
+    assert percentile([1.0], 95) == 1.0
+
+
+def test_save_baseline_keeps_the_parts_that_did_not_run(tmp_path):
+    path = tmp_path / "baseline.json"
+    save_baseline([BenchResult(11, 1, 5, 0.1, 0.2), BenchResult(12, 1, 5, 0.3, 0.4)], path)
+    save_baseline([BenchResult(12, 1, 5, 0.5, 0.6), BenchResult(12, 2, error="boom")], path)
+
+    assert load_baseline(path) == {
+        "11/1": {"runs": 5, "median": 0.1, "p95": 0.2},
+        "12/1": {"runs": 5, "median": 0.5, "p95": 0.6},
+    }
+
+    save_baseline([BenchResult(13, 2, 5, 0.7, 0.8)], path, replace=True)
+    assert load_baseline(path) == {"13/2": {"runs": 5, "median": 0.7, "p95": 0.8}}
+
+
+def test_save_baseline_drops_an_old_version(tmp_path):
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps({"version": BASELINE_VERSION - 1, "parts": {"11/1": {"median": 1.0}}}))
+
+    save_baseline([BenchResult(12, 1, 5, 0.5, 0.6)], path)
+    assert load_baseline(path) == {"12/1": {"runs": 5, "median": 0.5, "p95": 0.6}}
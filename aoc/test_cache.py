@@ -0,0 +1,113 @@
+import pytest
+
+from aoc import cache
+from aoc.cache import parsed_input
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "cache"
+    monkeypatch.setenv("AOC_CACHE_DIR", str(directory))
+    monkeypatch.delenv("AOC_PARSE_CACHE", raising=False)
+    cache.clear_memory()
+    yield directory
+    cache.clear_memory()
+
+
+def make_parser(version: int, calls: list):
+    @parsed_input(version=version)
+    def parse(filename):
+        calls.append(filename)
+        with open(filename) as f:
+            return {"lines": f.read().splitlines()}
+
+    return parse
+
+
+@pytest.fixture
+def puzzle(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("a\nb\n")
+    return str(path)
+
+
+def test_miss_then_hit(puzzle, cache_dir):
+    calls = []
+    parse = make_parser(1, calls)
+
+    assert parse(puzzle) == {"lines": ["a", "b"]}
+    assert parse(puzzle) == {"lines": ["a", "b"]}
+    assert len(calls) == 1
+    assert len(list((cache_dir / "parsed").glob("*.pickle"))) == 1
+
+    # a new process only has the pickle on disk
+    cache.clear_memory()
+    assert parse(puzzle) == {"lines": ["a", "b"]}
+    assert len(calls) == 1
+
+
+def test_version_bump_parses_again(puzzle):
+    calls = []
+
+    make_parser(1, calls)(puzzle)
+    make_parser(1, calls)(puzzle)
+    assert len(calls) == 1
+
+    make_parser(2, calls)(puzzle)
+    assert len(calls) == 2
+
+
+def test_changed_content_at_the_same_path_parses_again(puzzle):
+    calls = []
+    parse = make_parser(1, calls)
+
+    assert parse(puzzle) == {"lines": ["a", "b"]}
+    with open(puzzle, "w") as f:
+        f.write("c\nd\ne\n")
+    assert parse(puzzle) == {"lines": ["c", "d", "e"]}
+    assert len(calls) == 2
+
+
+def test_turned_off(puzzle, cache_dir, monkeypatch):
+    monkeypatch.setenv("AOC_PARSE_CACHE", "0")
+    calls = []
+    parse = make_parser(1, calls)
+
+    parse(puzzle)
+    parse(puzzle)
+    assert len(calls) == 2
+    assert not cache_dir.exists()
+    assert not cache._memory
+
+
+def test_every_hit_is_a_fresh_copy(puzzle):
+    parse = make_parser(1, [])
+
+    first = parse(puzzle)
+    first["lines"].append("changed")
+    second = parse(puzzle)
+    assert second == {"lines": ["a", "b"]}
+
+    second["lines"].clear()
+    assert parse(puzzle) == {"lines": ["a", "b"]}
+
+
+def test_memory_keeps_the_most_recent_results(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "MEMORY_ENTRIES", 2)
+    monkeypatch.setattr(cache, "DIGEST_ENTRIES", 2)
+    calls = []
+    parse = make_parser(1, calls)
+
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"input-{i}.txt"
+        path.write_text(f"{i}\n")
+        paths.append(str(path))
+        assert parse(str(path)) == {"lines": [str(i)]}
+
+    assert len(cache._memory) == 2
+    assert len(cache._digests) == 2
+
+    # the older results come back from disk
+    assert parse(paths[0]) == {"lines": ["0"]}
+    assert len(calls) == 5
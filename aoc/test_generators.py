@@ -0,0 +1,71 @@
+import pytest
+
+from aoc.batch import solve_file
+from aoc.days import get_day, load_module
+from aoc.generators import GENERATORS, generate, mirror_differences, write
+from aoc.runner import PARTS
+
+# day 21's part 2 and day 23's part 2 take from seconds to minutes whatever the scale
+SLOW_PARTS = {(21, 1), (21, 2), (23, 2)}
+
+
+@pytest.mark.parametrize("day", range(1, 26))
+def test_every_day_has_a_generator(day):
+    assert day in GENERATORS
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS))
+def test_same_seed_same_input(day):
+    assert generate(day, scale=0.05, seed=7) == generate(day, scale=0.05, seed=7)
+    assert generate(day, scale=0.05, seed=7).endswith("\n")
+
+
+def test_input_grows_with_scale():
+    small = generate(2, scale=1)
+    large = generate(2, scale=10)
+    assert 9 < len(large.splitlines()) / len(small.splitlines()) < 11
+
+
+def test_mirror_patterns_have_one_answer_per_part():
+    for pattern in generate(13, scale=0.2).strip().split("\n\n"):
+        differences = mirror_differences(pattern.splitlines())
+        assert differences.count(0) == 1
+        assert differences.count(1) == 1
+
+
+@pytest.mark.parametrize("day", [1, 2])
+def test_write_matches_generate(tmp_path, day):
+    # day 1 is streamed into the file, day 2 is written in one go
+    path = tmp_path / "input.txt"
+    write(day, path, scale=3, seed=5)
+    assert path.read_text() == generate(day, scale=3, seed=5)
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS))
+def test_parts_solve_the_generated_input(tmp_path, monkeypatch, day):
+    parts = [part for part in PARTS if (day, part) not in SLOW_PARTS]
+    if not parts:
+        pytest.skip("too slow")
+    if day == 25:
+        pytest.importorskip("networkx")
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "input.txt"
+    write(day, path, scale=0.05, seed=1)
+
+    results = solve_file(get_day(day), path, parts)
+
+    # day 10 has no part 2
+    assert all(r.error in (None, "not implemented") for r in results), [r.error for r in results]
+    assert any(r.answer is not None for r in results)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_cube_games_are_possible_and_impossible(tmp_path, monkeypatch, seed):
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "input.txt"
+    write(2, path, seed=seed)
+
+    games = load_module(get_day(2)).parse_games(str(path))
+    possible = [red <= 12 and green <= 13 and blue <= 14 for _, (red, green, blue) in games]
+    # part 1 sees plenty of both
+    assert 0.25 < sum(possible) / len(games) < 0.9
@@ -0,0 +1,68 @@
+import pytest
+
+from aoc.grid import Grid
+
+SAMPLE = """\
+#.#
+..S
+"""
+
+
+def test_from_text():
+    grid = Grid.from_text(SAMPLE, border="@")
+
+    assert (grid.width, grid.height) == (3, 2)
+    assert grid[0, 0] == "#"
+    assert grid[2, 1] == "S"
+    assert grid.lines() == ["#.#", "..S"]
+    assert str(grid) == SAMPLE.strip()
+
+
+def test_index_and_coords():
+    grid = Grid.from_text(SAMPLE)
+
+    for y in range(grid.height):
+        for x in range(grid.width):
+            assert grid.coords(grid.index(x, y)) == (x, y)
+
+    assert grid.find("S") == grid.index(2, 1)
+    assert grid.find_all(".") == [grid.index(1, 0), grid.index(0, 1), grid.index(1, 1)]
+
+
+def test_border_around_every_cell():
+    grid = Grid.from_text(SAMPLE, border="@")
+
+    corner = grid.index(0, 0)
+    assert [grid[corner + offset] for offset in grid.offsets] == ["@", ".", ".", "@"]
+    assert grid[corner + grid.up + grid.left] == "@"
+    assert grid.is_border(corner + grid.left)
+    assert not grid.is_border(corner)
+    assert (3, 0) not in grid
+
+
+def test_views_share_the_cells():
+    grid = Grid.from_text(SAMPLE)
+
+    row = grid.row(1)
+    column = grid.column(2)
+    assert row.tobytes() == b"..S"
+    assert column.tobytes() == b"#S"
+
+    grid[2, 1] = "O"
+    assert row.tobytes() == b"..O"
+    assert column.tobytes() == b"#O"
+
+
+def test_copy_is_independent():
+    grid = Grid.from_text(SAMPLE)
+    copy = grid.copy()
+
+    assert copy == grid
+    copy[0, 0] = "."
+    assert copy != grid
+    assert grid[0, 0] == "#"
+
+
+def test_rows_must_have_the_same_length():
+    with pytest.raises(ValueError):
+        Grid.from_lines(["...", ".."])
@@ -0,0 +1,65 @@
+import pytest
+
+from aoc import inputs
+from aoc.inputs import InputFile, open_input, read_lines, resolve
+
+TEXT = b"first\r\nsecond\n\nlast"
+
+
+@pytest.fixture(params=[False, True], ids=["read", "mapped"])
+def input_path(request, tmp_path, monkeypatch):
+    if request.param:
+        monkeypatch.setattr(inputs, "MMAP_THRESHOLD", 1)
+    path = tmp_path / "input.txt"
+    path.write_bytes(TEXT)
+    return path
+
+
+def test_relative_names_are_next_to_the_module(tmp_path):
+    module = tmp_path / "day-01" / "main.py"
+
+    assert resolve(module, "input.txt") == tmp_path / "day-01" / "input.txt"
+    assert resolve(module, tmp_path / "other.txt") == tmp_path / "other.txt"
+
+
+def test_lines_are_views_without_line_breaks(input_path):
+    with InputFile(input_path) as data:
+        assert data.is_mapped == (inputs.MMAP_THRESHOLD == 1)
+        lines = [bytes(line) for line in data.lines()]
+        assert bytes(data.view(0, 5)) == b"first"
+
+    assert lines == TEXT.splitlines()
+
+
+def test_text_lines_match_splitlines(input_path):
+    with open_input(input_path.parent / "main.py") as data:
+        assert list(data.text_lines()) == TEXT.decode().splitlines()
+        assert data.text() == TEXT.decode()
+
+    assert list(read_lines(input_path.parent / "main.py", input_path.name)) == TEXT.decode().splitlines()
+
+
+def test_line_ranges_split_on_line_breaks(input_path):
+    with InputFile(input_path) as data:
+        ranges = list(data.line_ranges(4))
+        assert ranges == [(0, 7), (7, 14), (14, 19)]
+
+        lines = [bytes(line) for start, stop in ranges for line in data.lines(start, stop)]
+        assert lines == TEXT.splitlines()
+
+        # the released pages are read again from the file
+        data.release(0, len(data))
+        assert bytes(data.view(0, 5)) == b"first"
+
+        assert list(data.line_ranges(100)) == [(0, len(TEXT))]
+        assert list(data.line_ranges(4, start=7, stop=14)) == [(7, 14)]
+
+
+def test_empty_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(inputs, "MMAP_THRESHOLD", 0)
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+
+    # an empty file cannot be mapped, it is read instead
+    with InputFile(path) as data:
+        assert list(data.lines()) == []
@@ -0,0 +1,84 @@
+import pytest
+
+from aoc.interval import Box, Interval, IntervalSet, PiecewiseLinearMap
+
+
+def test_interval():
+    interval = Interval(3, 8)
+
+    assert interval.length == 5
+    assert Interval.closed(3, 7) == interval
+    assert Interval.from_length(3, 5) == interval
+    assert 3 in interval and 7 in interval and 8 not in interval
+
+    assert interval.split(5) == (Interval(3, 5), Interval(5, 8))
+    assert interval.split(1) == (Interval(3, 3), Interval(3, 8))
+    assert interval.split(10) == (Interval(3, 8), Interval(8, 8))
+
+    assert interval.intersect(Interval(6, 12)) == Interval(6, 8)
+    assert interval.intersect(Interval(10, 12)).is_empty()
+    assert interval.intersect(Interval(10, 12)).length == 0
+
+
+def test_interval_set_merges():
+    s = IntervalSet([Interval(5, 7), Interval(0, 2), Interval(2, 3), Interval(6, 9), Interval(4, 4)])
+
+    assert list(s) == [Interval(0, 3), Interval(5, 9)]
+    assert s.measure() == 7
+    assert s.min() == 0
+    assert 2 in s and 3 not in s and 8 in s
+
+
+def test_interval_set_operations():
+    a = IntervalSet([Interval(0, 10), Interval(20, 30)])
+    b = IntervalSet([Interval(5, 25), Interval(28, 40)])
+
+    assert a | b == IntervalSet([Interval(0, 40)])
+    assert a & b == IntervalSet([Interval(5, 10), Interval(20, 25), Interval(28, 30)])
+    assert a - b == IntervalSet([Interval(0, 5), Interval(25, 28)])
+    assert b - a == IntervalSet([Interval(10, 20), Interval(30, 40)])
+    assert (a - a).measure() == 0
+
+
+def test_piecewise_linear_map():
+    mapping = PiecewiseLinearMap([(Interval(10, 20), 100), (Interval(30, 35), -30)])
+
+    assert mapping(5) == 5
+    assert mapping(10) == 110
+    assert mapping(19) == 119
+    assert mapping(32) == 2
+
+    image = mapping.image(IntervalSet([Interval(15, 33)]))
+    assert image == IntervalSet([Interval(0, 3), Interval(20, 30), Interval(115, 120)])
+
+    with pytest.raises(ValueError):
+        PiecewiseLinearMap([(Interval(0, 10), 1), (Interval(5, 15), 2)])
+
+
+def test_composition_matches_applying_one_by_one():
+    first = PiecewiseLinearMap([(Interval(10, 20), 5), (Interval(40, 50), -35)])
+    second = PiecewiseLinearMap([(Interval(0, 12), 100), (Interval(18, 30), -18)])
+
+    combined = first.then(second)
+
+    for value in range(-5, 60):
+        assert combined(value) == second(first(value))
+
+    values = IntervalSet([Interval(0, 60)])
+    assert combined.image(values) == second.image(first.image(values))
+
+
+def test_box():
+    box = Box((Interval.closed(1, 4000), Interval.closed(1, 10)))
+
+    assert box.volume() == 40000
+
+    below, above = box.split(1, 4)
+    assert below.volume() == 12000
+    assert above.volume() == 28000
+
+    empty, whole = box.split(0, 0)
+    assert empty.is_empty() and empty.volume() == 0
+    assert whole == box
+
+    assert box.intersect(Box((Interval(0, 2), Interval(5, 100)))).volume() == 6
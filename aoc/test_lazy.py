@@ -0,0 +1,24 @@
+import sys
+
+import pytest
+
+from aoc.lazy import lazy_import
+
+
+def test_imports_on_first_use():
+    sys.modules.pop("colorsys", None)
+
+    colorsys = lazy_import("colorsys")
+    assert "colorsys" not in sys.modules
+    assert not colorsys.is_loaded
+
+    assert colorsys.rgb_to_hsv(1, 0, 0) == (0, 1, 1)
+    assert "colorsys" in sys.modules
+    assert colorsys.is_loaded
+
+
+def test_missing_module_fails_on_use():
+    missing = lazy_import("surely_not_installed_anywhere")
+
+    with pytest.raises(ModuleNotFoundError, match="surely_not_installed_anywhere"):
+        missing.anything
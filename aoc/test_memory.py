@@ -0,0 +1,85 @@
+import tracemalloc
+
+import pytest
+
+from aoc import memory
+from aoc.days import Day
+from aoc.runner import run_days
+
+SOLUTION = """
+def part_1():
+    return 42
+
+
+def part_2():
+    hog = []
+    while True:
+        hog.append(bytearray(1 << 20))
+"""
+
+
+def test_peak_snapshot_sees_memory_that_was_freed():
+    tracemalloc.start()
+    try:
+        with memory.PeakSnapshot(interval=60, minimum=1 << 19) as snapshot:
+            data = [bytearray(1 << 10) for _ in range(1000)]
+            # the thread would only check once a minute
+            snapshot.check()
+            del data
+        top = snapshot.top(limit=1)
+    finally:
+        tracemalloc.stop()
+
+    assert len(top) == 1
+    assert "aoc/test_memory.py" in top[0]
+
+
+@pytest.mark.skipif(not memory.supported(), reason="needs /proc")
+def test_peak_rss_is_reset():
+    memory.reset_peak_rss()
+    before = memory.peak_rss()
+
+    data = bytearray(64 << 20)
+    data[:: 1 << 12] = b"x" * len(data[:: 1 << 12])
+    peak = memory.peak_rss()
+    del data
+
+    assert peak - before >= 60 << 20
+    assert memory.reset_peak_rss()
+    assert memory.peak_rss() < peak
+
+
+@pytest.mark.skipif(not memory.supported(), reason="needs /proc")
+def test_memory_limit_kills_only_the_greedy_part(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_ANSWER_CACHE", "0")
+    path = tmp_path / "day-98"
+    path.mkdir()
+    (path / "main.py").write_text(SOLUTION)
+    day = Day(98, path)
+
+    results = run_days([day], measure_memory=False, workers=2, memory_limit=200 << 20)
+
+    assert results[0].answer == 42
+    assert results[0].error is None
+    assert results[0].peak_rss is not None
+    assert results[1].error.startswith("killed")
+
+
+def test_allocations_only_on_request(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_ANSWER_CACHE", "0")
+    path = tmp_path / "day-97"
+    path.mkdir()
+    # kept after the part returns, so the snapshot taken at the end sees it
+    (path / "main.py").write_text(
+        "KEEP = []\n\ndef part_1():\n    KEEP[:] = [bytearray(1 << 10) for _ in range(4096)]\n    return len(KEEP)\n"
+    )
+    day = Day(97, path)
+
+    (plain,) = run_days([day], (1,))
+    assert plain.answer == 4096
+    assert plain.peak_memory > 4 << 20
+    assert plain.top_allocations is None
+
+    (listed,) = run_days([day], (1,), allocations=True)
+    assert listed.answer == 4096
+    assert listed.top_allocations
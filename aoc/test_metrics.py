@@ -0,0 +1,67 @@
+import pytest
+
+from aoc import metrics
+from aoc.days import get_day, load_module
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_disabled_metrics_record_nothing(monkeypatch):
+    monkeypatch.delenv("AOC_METRICS", raising=False)
+
+    metrics.counter("pops").inc()
+    metrics.histogram("sizes").observe(10)
+
+    assert metrics.counter("pops") is metrics.NULL_COUNTER
+    assert metrics.snapshot() == {}
+
+
+def test_counters_and_histograms(monkeypatch):
+    monkeypatch.setenv("AOC_METRICS", "1")
+
+    pops = metrics.counter("pops")
+    pops.inc()
+    pops.inc(4)
+    assert metrics.counter("pops") is pops
+
+    sizes = metrics.histogram("sizes")
+    for value in (1, 2, 3, 4, 5, 100):
+        sizes.observe(value)
+
+    assert metrics.snapshot() == {
+        "pops": 5,
+        "sizes": {
+            "count": 6,
+            "sum": 115,
+            "min": 1,
+            "max": 100,
+            "mean": 115 / 6,
+            "buckets": {"<=1": 1, "<=2": 1, "<=4": 2, "<=8": 1, "<=128": 1},
+        },
+    }
+
+    with pytest.raises(TypeError):
+        metrics.histogram("pops")
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_day_12_counts_on_both_parts(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_METRICS", "1")
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path / "cache"))
+    day = load_module(get_day(12))
+    path = tmp_path / "input.txt"
+    path.write_text("???.###. 1,1,3\n.??..??...?##. 1,1,3\n")
+
+    assert day.part_1(str(path)) == 1 + 4
+    assert metrics.snapshot()["count_possible_combinations.calls"] > 2
+
+    metrics.reset()
+    day.part_2(str(path))
+    assert set(metrics.snapshot()) == {"count_arrangements.cache_hits", "count_arrangements.cache_misses"}
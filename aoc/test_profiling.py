@@ -0,0 +1,80 @@
+from aoc.days import Day
+from aoc.profiling import collapsed_from_stats, profile_part
+
+SOLUTION = """
+import time
+
+
+def slow(n):
+    return sum(i * i for i in range(n))
+
+
+def part_1():
+    end = time.perf_counter() + 0.1
+    total = 0
+    while time.perf_counter() < end:
+        total += slow(1000)
+    return 42
+"""
+
+
+def test_collapsed_stacks_share_time_by_caller():
+    root = ("main.py", 1, "part_1")
+    a = ("main.py", 10, "a")
+    b = ("main.py", 20, "b")
+    leaf = ("main.py", 30, "leaf")
+
+    # (primitive calls, calls, own time, cumulative time, callers)
+    stats = {
+        root: (1, 1, 1.0, 10.0, {}),
+        a: (1, 1, 1.0, 4.0, {root: (1, 1, 1.0, 4.0)}),
+        b: (1, 1, 1.0, 5.0, {root: (1, 1, 1.0, 5.0)}),
+        leaf: (2, 2, 7.0, 7.0, {a: (1, 1, 3.0, 3.0), b: (1, 1, 4.0, 4.0)}),
+    }
+
+    stacks = collapsed_from_stats(stats)
+
+    assert stacks == {
+        "main.py:1(part_1)": 1.0,
+        "main.py:1(part_1);main.py:10(a)": 1.0,
+        "main.py:1(part_1);main.py:10(a);main.py:30(leaf)": 3.0,
+        "main.py:1(part_1);main.py:20(b)": 1.0,
+        "main.py:1(part_1);main.py:20(b);main.py:30(leaf)": 4.0,
+    }
+
+
+def make_day(tmp_path) -> Day:
+    path = tmp_path / "day-99"
+    path.mkdir()
+    (path / "main.py").write_text(SOLUTION)
+    return Day(99, path)
+
+
+def test_cprofile(tmp_path):
+    day = make_day(tmp_path)
+
+    report = profile_part(day, 1, "cprofile", directory=tmp_path / "profiles", top=5)
+
+    assert report.error is None
+    assert report.answer == 42
+    assert [p.name for p in report.files] == ["day-99-part-1.pstats", "day-99-part-1.collapsed"]
+    assert all(p.exists() for p in report.files)
+    assert any("(slow)" in label for _, _, _, label in report.top)
+    assert "part_1" in report.summary()
+
+
+def test_sampling(tmp_path):
+    day = make_day(tmp_path)
+
+    report = profile_part(day, 1, "sample", directory=tmp_path / "profiles", interval=0.001)
+
+    assert report.error is None
+    lines = report.files[0].read_text().splitlines()
+    assert lines
+    assert all(line.startswith("main.py:9(part_1)") for line in lines)
+
+
+def test_missing_part(tmp_path):
+    day = make_day(tmp_path)
+
+    assert profile_part(day, 2, directory=tmp_path).error == "not implemented"
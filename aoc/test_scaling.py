@@ -0,0 +1,52 @@
+import pytest
+
+from aoc.days import get_day
+from aoc.generators import GENERATORS
+from aoc.runner import PARTS
+from aoc.scaling import TARGETS, ScalingPoint, ScalingResult, fit_slope, measure_scaling
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    # keep the pickles of the parsed inputs out of the repository's cache
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path / "cache"))
+
+
+def test_fit_slope_of_a_power_law():
+    points = [ScalingPoint(scale, 1000 * scale, 0.01 * scale**2) for scale in (1, 2, 4, 8)]
+
+    assert abs(fit_slope(points) - 2) < 1e-9
+
+
+def test_fit_slope_ignores_points_too_fast_to_time():
+    points = [ScalingPoint(1, 1000, 0.0001), ScalingPoint(2, 2000, 0.0001)]
+
+    assert fit_slope(points) is None
+
+
+def test_too_slow_compares_to_the_target():
+    result = ScalingResult(11, 2, target=1.0, slope=1.9)
+    assert result.too_slow
+
+    result = ScalingResult(11, 2, target=2.0, slope=1.9)
+    assert not result.too_slow
+
+
+def test_measure_scaling_doubles_the_input(tmp_path):
+    result = measure_scaling(get_day(9), 1, tmp_path, start_scale=0.1, steps=3, repeat=1)
+
+    assert result.error is None
+    assert [p.scale for p in result.points] == [0.1, 0.2, 0.4]
+    assert result.points[0].size < result.points[1].size < result.points[2].size
+
+
+def test_measure_scaling_reports_errors(tmp_path):
+    result = measure_scaling(get_day(10), 2, tmp_path, steps=2)
+
+    assert result.error == "scale 0.25: not implemented"
+    assert result.slope is None
+
+
+def test_every_part_declares_a_target():
+    assert {(day, part) for day in GENERATORS for part in PARTS} <= set(TARGETS)
+    assert TARGETS[(11, 2)] == TARGETS[(24, 1)] == 2.0
@@ -0,0 +1,46 @@
+from aoc.grid import Grid
+from aoc.search import manhattan, shortest_distances, shortest_path
+
+GRAPH = {
+    0: [(1, 4), (2, 1)],
+    1: [(3, 1)],
+    2: [(1, 2), (3, 5)],
+    3: [],
+    4: [(0, 1)],
+}
+
+
+def successors(state):
+    return GRAPH[state]
+
+
+def test_shortest_path():
+    assert shortest_path([0], successors, lambda state: state == 3) == 4
+    assert shortest_path([0], successors, lambda state: state == 0) == 0
+    assert shortest_path([2, 4], successors, lambda state: state == 3) == 3
+
+
+def test_shortest_distances():
+    assert shortest_distances([0], successors) == {0: 0, 1: 3, 2: 1, 3: 4}
+    assert shortest_distances([2, 4], successors) == {0: 1, 1: 2, 2: 0, 3: 3, 4: 0}
+
+
+def test_shortest_path_unreachable():
+    assert shortest_path([0], successors, lambda state: state == 4) is None
+
+
+def test_a_star_on_a_grid():
+    grid = Grid.from_text("....\n.##.\n.#..\n....", border="#")
+    start = grid.index(0, 0)
+    goal = grid.index(2, 2)
+
+    def grid_successors(index):
+        for offset in grid.offsets:
+            if grid[index + offset] == ".":
+                yield index + offset, 1
+
+    is_goal = lambda index: index == goal
+
+    assert shortest_path([start], grid_successors, is_goal) == 6
+    assert shortest_path([start], grid_successors, is_goal, heuristic=manhattan(grid, goal)) == 6
+    assert manhattan(grid, goal)(start) == 4
@@ -0,0 +1,114 @@
+import asyncio
+import json
+
+import pytest
+
+from aoc.answers import AnswerStore
+from aoc.days import get_day
+from aoc.service import SolverService
+
+RACES = "Time:      7  15   30\nDistance:  9  40  200\n"
+CARD = "Card 1: {} 48 83 86 17 | 83 86  6 31 17  9 48 53\n"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "cache"
+    monkeypatch.setenv("AOC_CACHE_DIR", str(directory))
+    monkeypatch.setenv("AOC_ANSWER_CACHE", "1")
+    monkeypatch.delenv("AOC_PARSE_CACHE", raising=False)
+    return directory
+
+
+async def request(socket, method: str, target: str, payload=None) -> tuple[int, dict]:
+    reader, writer = await asyncio.open_unix_connection(socket)
+    body = b"" if payload is None else json.dumps(payload).encode()
+    writer.write(f"{method} {target} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+
+    response = await reader.read()
+    writer.close()
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    status = int(head.split()[1])
+    return status, json.loads(body)
+
+
+def run_service(tmp_path, client, timeout: float = 30.0):
+    socket = tmp_path / "aoc.sock"
+
+    async def main():
+        service = SolverService(workers=1, timeout=timeout, store=AnswerStore(tmp_path / "answers.sqlite"))
+        await service.start()
+        server = await asyncio.start_unix_server(service.handle_connection, path=socket)
+        try:
+            async with server:
+                return await client(socket)
+        finally:
+            await service.close()
+
+    return asyncio.run(main())
+
+
+def test_solve_and_serve_the_repeat_from_the_store(tmp_path):
+    async def client(socket):
+        first = await request(socket, "POST", "/solve", {"day": 6, "part": 1, "input": RACES})
+        second = await request(socket, "POST", "/solve", {"day": 6, "part": 1, "input": RACES})
+        other_part = await request(socket, "POST", "/solve", {"day": 6, "part": 2, "input": RACES})
+        return first, second, other_part
+
+    (status, first), (_, second), (_, other_part) = run_service(tmp_path, client)
+
+    assert status == 200
+    assert (first["answer"], first["cached"], first["error"]) == (288, False, None)
+    assert first["time"] > 0
+    assert (second["answer"], second["cached"]) == (288, True)
+    assert (other_part["answer"], other_part["cached"]) == (71503, False)
+
+
+def test_bad_requests(tmp_path):
+    async def client(socket):
+        return [
+            await request(socket, "POST", "/solve", {"day": 99, "part": 1, "input": ""}),
+            await request(socket, "POST", "/solve", {"day": 6, "part": 3, "input": ""}),
+            await request(socket, "POST", "/solve", {"day": 6, "part": 1}),
+            await request(socket, "GET", "/solve"),
+            await request(socket, "GET", "/nowhere"),
+            await request(socket, "POST", "/solve", {"day": 6, "part": 1, "input": "no races\n"}),
+        ]
+
+    statuses = [status for status, _ in run_service(tmp_path, client)]
+    assert statuses == [400, 400, 400, 405, 404, 500]
+
+
+def test_timeout_replaces_the_worker(tmp_path):
+    # the longest hike of the real input takes seconds
+    text = (get_day(23).path / "input.txt").read_text()
+
+    async def client(socket):
+        slow = await request(socket, "POST", "/solve", {"day": 23, "part": 2, "input": text, "timeout": 0.2})
+        health = await request(socket, "GET", "/health")
+        after = await request(socket, "POST", "/solve", {"day": 6, "part": 2, "input": RACES})
+        return slow, health, after
+
+    (status, slow), (_, health), (_, after) = run_service(tmp_path, client)
+
+    assert status == 504
+    assert slow["answer"] is None
+    assert health["workers"] == 1
+    assert after["answer"] == 71503
+
+
+def test_distinct_inputs_do_not_fill_the_parse_cache(tmp_path, cache_dir):
+    # day 4 parses through @parsed_input, every card below is a new input
+    async def client(socket):
+        return [
+            await request(socket, "POST", "/solve", {"day": 4, "part": 1, "input": CARD.format(n)})
+            for n in range(1, 21)
+        ]
+
+    responses = run_service(tmp_path, client)
+
+    # 4 matches, 5 when n is one of the numbers you have
+    assert [body["answer"] for _, body in responses] == [16 if n in (6, 9) else 8 for n in range(1, 21)]
+    assert not list(cache_dir.glob("parsed/*"))
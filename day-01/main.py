@@ -1,5 +1,21 @@
+import multiprocessing
+import os
+import sys
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from typing import Optional
 
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc.automaton import Automaton
+from aoc.inputs import InputFile, resolve
+from aoc.lazy import lazy_import
+
+# only needed by the vectorized part 1
+np = lazy_import("numpy")
 
 DIGITS_SPELLED_OUT_WITH_LETTERS = [
     "one",
@@ -25,48 +41,115 @@ def convert_digit_to_value(digit: str) -> int:
         return DIGITS_SPELLED_OUT_WITH_LETTERS.index(digit) + 1
 
 
-def read_input():
-    # read in every line of input.txt
-    path = Path(__file__).parent / "input.txt"
-    lines = path.read_text().splitlines()
+# no digit contains another one, so the first match to end is the first digit of the line
+FIRST_DIGIT = Automaton({digit.encode(): convert_digit_to_value(digit) for digit in EVERY_DIGIT})
+# scans the line from its end, the spelled out digits are reversed
+LAST_DIGIT = Automaton({digit[::-1].encode(): convert_digit_to_value(digit) for digit in EVERY_DIGIT})
+
+
+# the input is summed in chunks of this size, each one in a process of its own
+CHUNK_SIZE = 64 << 20
+# a chunk hands the pages it has read back to the OS after this many bytes, so the memory stays flat
+RELEASE_EVERY = 8 << 20
+# the vectorized part 1 works on pieces of this size, its arrays take a few times the size of a piece
+VECTOR_PIECE = 1 << 20
+
+NOT_DIGITS = bytes(sorted(set(range(256)) - set(b"0123456789")))
+
+# sums the calibration values of the lines in a byte range of the input
+PieceSum = Callable[[InputFile, int, int], int]
+
+
+def numeric_calibration_value(line: memoryview) -> int:
+    digits = line.tobytes().translate(None, NOT_DIGITS)
+    return int(digits[:1] + digits[-1:])
+
+
+def calibration_value(line: memoryview) -> int:
+    # one pass forward to the first digit, one pass backward to the last, overlaps like "eightwo" included
+    return FIRST_DIGIT.find_first(line) * 10 + LAST_DIGIT.find_first(reversed(line))
+
+
+def numeric_sum(data: InputFile, start: int, stop: int) -> int:
+    return sum(map(numeric_calibration_value, data.lines(start, stop)))
+
+
+def numeric_sum_vectorized(data: InputFile, start: int, stop: int) -> int:
+    return sum(
+        numeric_piece_sum_vectorized(data, piece_start, piece_stop)
+        for piece_start, piece_stop in data.line_ranges(VECTOR_PIECE, start, stop)
+    )
+
+
+def numeric_piece_sum_vectorized(data: InputFile, start: int, stop: int) -> int:
+    # part 1 without a loop over the lines: the first digit of a line is the first digit position
+    # at or after its start, the last one the last digit position before its line break. Only the
+    # positions of the digits and of the line breaks are stored, not an index per byte.
+    buffer = np.frombuffer(data.view(start, stop), dtype=np.uint8)
+    if len(buffer) == 0:
+        return 0
+
+    line_ends = np.flatnonzero(buffer == ord("\n"))
+    if buffer[-1] != ord("\n"):
+        line_ends = np.append(line_ends, len(buffer))
+    line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+
+    # the bytes below "0" wrap around and are larger than 9 too
+    digits = np.flatnonzero((buffer - ord("0")) <= 9)
+    first = np.searchsorted(digits, line_starts)
+    last = np.searchsorted(digits, line_ends) - 1
+
+    if (first > last).any():
+        line = int(np.argmax(first > last))
+        raise ValueError(f"No digits in line {line + 1} of the piece at byte {start}")
+
+    tens = (buffer[digits[first]] - ord("0")).sum(dtype=np.int64)
+    ones = (buffer[digits[last]] - ord("0")).sum(dtype=np.int64)
+    return int(tens * 10 + ones)
+
 
-    return lines
+def spelled_sum(data: InputFile, start: int, stop: int) -> int:
+    return sum(map(calibration_value, data.lines(start, stop)))
 
 
-def part_1():
-    lines = read_input()
+def sum_chunk(path: str, start: int, stop: int, piece_sum: PieceSum) -> int:
+    # sum of the calibration values of the lines in [start, stop), start is the start of a line
+    total = 0
 
-    sum = 0
+    with InputFile(path) as data:
+        for piece_start, piece_stop in data.line_ranges(RELEASE_EVERY, start, stop):
+            total += piece_sum(data, piece_start, piece_stop)
+            data.release(piece_start, piece_stop)
 
-    for line in lines:
-        digits = list(filter(str.isdigit, line))
-        first_digit = digits[0]
-        last_digit = digits[-1]
-        number = int(f"{first_digit}{last_digit}")
-        sum += number
+    return total
 
-    return sum
 
+def calibration_sum(filename: str, piece_sum: PieceSum, workers: Optional[int] = None) -> int:
+    path = str(resolve(__file__, filename))
+    with InputFile(path) as data:
+        chunks = list(data.line_ranges(CHUNK_SIZE))
 
-def part_2():
-    lines = read_input()
+    workers = min(workers or os.cpu_count() or 1, len(chunks))
+    # the worker processes of the runner are daemons, they cannot start processes of their own
+    if workers <= 1 or multiprocessing.current_process().daemon:
+        return sum(sum_chunk(path, start, stop, piece_sum) for start, stop in chunks)
 
-    sum = 0
+    starts, stops = zip(*chunks)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(sum_chunk, repeat(path), starts, stops, repeat(piece_sum)))
 
-    for line in lines:
-        digits_in_line = list(filter(line.__contains__, EVERY_DIGIT))
 
-        first_digit = min(digits_in_line, key=line.find)
-        last_digit = max(digits_in_line, key=line.rfind)
+def part_1(filename: str = "input.txt"):
+    return calibration_sum(filename, numeric_sum)
 
-        first_digit_value = convert_digit_to_value(first_digit)
-        last_digit_value = convert_digit_to_value(last_digit)
 
-        number = first_digit_value * 10 + last_digit_value
+def part_1_vectorized(filename: str = "input.txt"):
+    # same answer as part_1, needs numpy
+    return calibration_sum(filename, numeric_sum_vectorized)
 
-        sum += number
 
-    return sum
+def part_2(filename: str = "input.txt"):
+    return calibration_sum(filename, spelled_sum)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,119 @@
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc import inputs
+from aoc.days import get_day, load_module
+from aoc.generators import generate
+
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+DIGIT = re.compile(r"\d")
+# a lookahead finds the overlapping ones too
+SPELLED_DIGIT = re.compile(r"(?=(\d|" + "|".join(WORDS) + "))")
+
+# one digit lines, digits hidden in words, overlapping words, a digit at either end
+DOCUMENT = """1abc2
+pqr3stu8vwx
+treb7uchet
+5
+xtwone3four
+7twone
+eighthree8
+oneight9sevenine
+zoneight234
+9qbtwonexsgrtlk
+"""
+
+
+@pytest.fixture(scope="module")
+def day():
+    return load_module(get_day(1))
+
+
+def reference_sum(text: str, spelled: bool) -> int:
+    total = 0
+    for line in text.splitlines():
+        digits = SPELLED_DIGIT.findall(line) if spelled else DIGIT.findall(line)
+        values = [int(digit) if digit.isdigit() else WORDS.index(digit) + 1 for digit in digits]
+        total += values[0] * 10 + values[-1]
+    return total
+
+
+def documents():
+    generated = generate(1, scale=0.05, seed=3)
+    return {
+        "sample": DOCUMENT,
+        "crlf": DOCUMENT.replace("\n", "\r\n"),
+        "no final line break": DOCUMENT.rstrip("\n"),
+        "generated": generated,
+        "generated crlf": generated.replace("\n", "\r\n"),
+    }
+
+
+@pytest.fixture(params=list(documents()))
+def document(request, tmp_path):
+    text = documents()[request.param]
+    path = tmp_path / "input.txt"
+    path.write_bytes(text.encode())
+    return str(path), text
+
+
+def test_line_values(day):
+    assert day.calibration_value(memoryview(b"xtwone3four")) == 24
+    assert day.calibration_value(memoryview(b"7twone")) == 71
+    assert day.calibration_value(memoryview(b"5")) == 55
+    assert day.numeric_calibration_value(memoryview(b"treb7uchet")) == 77
+
+
+def test_parts_match_the_reference(day, document):
+    path, text = document
+
+    assert day.part_1(path) == reference_sum(text, spelled=False)
+    assert day.part_2(path) == reference_sum(text, spelled=True)
+
+
+def test_vectorized_part_1_matches_part_1(day, document):
+    pytest.importorskip("numpy")
+    path, _ = document
+
+    assert day.part_1_vectorized(path) == day.part_1(path)
+
+
+@pytest.mark.parametrize("piece_sum", ["numeric_sum", "numeric_sum_vectorized", "spelled_sum"])
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1000])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_chunks_cut_in_the_middle_of_lines(day, document, monkeypatch, piece_sum, chunk_size, workers):
+    # chunks and released pieces end wherever their size says, line_ranges moves them to the next line break
+    if piece_sum == "numeric_sum_vectorized":
+        pytest.importorskip("numpy")
+    path, text = document
+    monkeypatch.setattr(day, "CHUNK_SIZE", chunk_size)
+    monkeypatch.setattr(day, "RELEASE_EVERY", 5)
+    monkeypatch.setattr(day, "VECTOR_PIECE", 3)
+    # map the small files too, so their pages are released
+    monkeypatch.setattr(inputs, "MMAP_THRESHOLD", 1)
+
+    expected = reference_sum(text, spelled=piece_sum == "spelled_sum")
+    assert day.calibration_sum(path, getattr(day, piece_sum), workers) == expected
+
+
+def test_line_without_digits(day, tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("1abc2\nnothing\n")
+
+    with pytest.raises(ValueError):
+        day.part_1(str(path))
+
+
+def test_vectorized_line_without_digits(day, tmp_path):
+    pytest.importorskip("numpy")
+    path = tmp_path / "input.txt"
+    path.write_text("1abc2\nnothing\n")
+
+    with pytest.raises(ValueError, match="line 2"):
+        day.part_1_vectorized(str(path))
@@ -1,70 +1,178 @@
-from collections import defaultdict
-from operator import itemgetter
-
-
-def parse_input():
-    with open("input.txt") as f:
-        lines = f.readlines()
-        games = []
-        for line in lines:
-            line = line.strip()
-            before_colon, after_colon = line.split(":")
-
-            game = {}
-            game["id"] = int(before_colon.split(" ")[1])
-            game["reveals"] = []
-
-            for reveal in after_colon.split(";"):
-                reveal = reveal.strip()
-                reveal_dict = defaultdict(int)
-                for cube in reveal.split(","):
-                    cube = cube.strip()
-                    count, color = cube.split(" ")
-                    reveal_dict[color] = int(count)
-
-                game["reveals"].append(reveal_dict)
-            games.append(game)
-        return games
-
-
-def part_1():
-    max_red = 12
-    max_green = 13
-    max_blue = 14
-
-    games = parse_input()
-
-    sum = 0
-
-    for game in games:
-        if all(
-            [
-                reveal["red"] <= max_red
-                and reveal["green"] <= max_green
-                and reveal["blue"] <= max_blue
-                for reveal in game["reveals"]
-            ]
-        ):
-            sum += game["id"]
-
-    return sum
-
-
-def part_2():
-    games = parse_input()
-
-    sum = 0
-
-    for game in games:
-        min_red_required = max(map(itemgetter("red"), game["reveals"]))
-        min_green_required = max(map(itemgetter("green"), game["reveals"]))
-        min_blue_required = max(map(itemgetter("blue"), game["reveals"]))
-
-        power = min_red_required * min_green_required * min_blue_required
-
-        sum += power
-
-    return sum
+import sys
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc.cache import parsed_input
+from aoc.inputs import open_input
+from aoc.lazy import lazy_import
+
+# only needed by the game log of the what-if queries, the parts are plain Python
+np = lazy_import("numpy")
+
+COLORS = ("red", "green", "blue")
+COLUMNS = {color: i for i, color in enumerate(COLORS)}
+
+# id of a game and the most red, green and blue cubes any of its reveals showed
+Game = tuple[int, tuple[int, int, int]]
+
+# the limit index keeps a table of id sums while it has at most this many cells
+MAX_TABLE_CELLS = 1 << 22
+
+
+@dataclass
+class GameLog:
+    # one row per reveal, in the order of the games: game id, then the red, green and blue cubes
+    reveals: "np.ndarray"
+    # index of the first reveal of every game
+    offsets: "np.ndarray"
+
+    @cached_property
+    def game_ids(self) -> "np.ndarray":
+        return self.reveals[self.offsets, 0]
+
+    @cached_property
+    def maxima(self) -> "np.ndarray":
+        # the most cubes of each colour any reveal of the game showed: one row per colour, one
+        # column per game, so every colour is a contiguous array
+        return np.ascontiguousarray(np.maximum.reduceat(self.reveals[:, 1:], self.offsets, axis=0).T)
+
+    def possible(self, red: int, green: int, blue: int) -> "np.ndarray":
+        # mask of the games that could be played with this many cubes in the bag, the maxima are
+        # computed once, every other what-if query only compares them
+        return (self.maxima[0] <= red) & (self.maxima[1] <= green) & (self.maxima[2] <= blue)
+
+    def id_sum(self, red: int, green: int, blue: int) -> int:
+        return int(self.game_ids.sum(where=self.possible(red, green, blue)))
+
+    @cached_property
+    def index(self) -> "LimitIndex":
+        return LimitIndex(self)
+
+
+class LimitIndex:
+    """Answers "which games are possible with (red, green, blue) cubes" from the maxima of the games.
+
+    Only the distinct maxima of every colour matter, a limit between two of them selects the same
+    games as the smaller one. The id sums live in a 3-D table over the ranks of those values, where
+    cell (r, g, b) holds the sum of the ids of every game whose maxima are at most the values of
+    rank r, g and b: a histogram of the games summed up along each axis. An id sum is then one
+    lookup. The ids themselves come from the games sorted by their red maximum, the limit on red
+    is a prefix of them and only that prefix is compared against green and blue.
+
+    When the table would have more than MAX_TABLE_CELLS cells, id sums add up the id lists instead.
+    """
+
+    def __init__(self, log: GameLog):
+        maxima = log.maxima
+        ids = log.game_ids
+
+        self.values = [np.unique(row) for row in maxima]
+        shape = tuple(len(values) for values in self.values)
+
+        self.sums = None
+        if np.prod(shape, dtype=np.int64) <= MAX_TABLE_CELLS:
+            ranks = tuple(np.searchsorted(values, row) for values, row in zip(self.values, maxima))
+            sums = np.zeros(shape, dtype=np.int64)
+            np.add.at(sums, ranks, ids)
+            for axis in range(3):
+                np.cumsum(sums, axis=axis, out=sums)
+            self.sums = sums
+
+        order = np.argsort(maxima[0], kind="stable")
+        self.sorted_maxima = maxima[:, order]
+        self.sorted_ids = ids[order]
+
+    def _ranks(self, limits: "np.ndarray") -> "np.ndarray":
+        # rank of the largest distinct maximum within each limit, -1 if every game is over it
+        return np.stack(
+            [np.searchsorted(values, limits[..., i], side="right") - 1 for i, values in enumerate(self.values)]
+        )
+
+    def id_sum(self, red: int, green: int, blue: int) -> int:
+        if self.sums is None:
+            return sum(self.ids(red, green, blue))
+
+        ranks = self._ranks(np.array((red, green, blue)))
+        if (ranks < 0).any():
+            return 0
+        return int(self.sums[tuple(ranks)])
+
+    def id_sums(self, limits: "np.ndarray") -> "np.ndarray":
+        # id sums of many queries at once, one (red, green, blue) row per query
+        limits = np.asarray(limits).reshape(-1, 3)
+        if self.sums is None:
+            return np.array([self.id_sum(*row) for row in limits.tolist()], dtype=np.int64)
+
+        ranks = self._ranks(limits)
+        answers = self.sums[tuple(np.maximum(ranks, 0))]
+        return np.where((ranks < 0).any(axis=0), 0, answers)
+
+    def ids(self, red: int, green: int, blue: int) -> list[int]:
+        # ids of the possible games, in increasing order
+        count = np.searchsorted(self.sorted_maxima[0], red, side="right")
+        maxima = self.sorted_maxima[:, :count]
+        mask = (maxima[1] <= green) & (maxima[2] <= blue)
+        return np.sort(self.sorted_ids[:count][mask]).tolist()
+
+
+def parse_game(line: str) -> tuple[int, list[list[int]]]:
+    # "Game 12: 3 blue, 4 red; 1 red, 2 green" -> 12, [[4, 0, 3], [1, 2, 0]]
+    before_colon, after_colon = line.strip().split(":")
+    game_id = int(before_colon.split(" ")[1])
+
+    reveals = []
+    for reveal in after_colon.split(";"):
+        counts = [0, 0, 0]
+        for cube in reveal.split(","):
+            count, color = cube.split()
+            counts[COLUMNS[color]] = int(count)
+        reveals.append(counts)
+
+    return game_id, reveals
+
+
+@parsed_input(version=1)
+def parse_games(filename: str) -> list[Game]:
+    games = []
+    with open_input(__file__, filename) as data:
+        for line in data.text_lines():
+            game_id, reveals = parse_game(line)
+            games.append((game_id, tuple(map(max, zip(*reveals)))))
+    return games
+
+
+@parsed_input(version=2)
+def parse_input(filename: str) -> GameLog:
+    rows = []
+    offsets = []
+
+    with open_input(__file__, filename) as data:
+        for line in data.text_lines():
+            game_id, reveals = parse_game(line)
+            offsets.append(len(rows))
+            rows.extend([game_id, *counts] for counts in reveals)
+
+    return GameLog(
+        np.array(rows, dtype=np.int64).reshape(-1, 4),
+        np.array(offsets, dtype=np.int64),
+    )
+
+
+def part_1(filename: str = "input.txt"):
+    return sum(
+        game_id
+        for game_id, (red, green, blue) in parse_games(filename)
+        if red <= 12 and green <= 13 and blue <= 14
+    )
+
+
+def part_2(filename: str = "input.txt"):
+    # the fewest cubes that make a game possible are its maxima
+    return sum(red * green * blue for _, (red, green, blue) in parse_games(filename))
 
 
 if __name__ == "__main__":
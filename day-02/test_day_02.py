@@ -0,0 +1,98 @@
+import itertools
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc.days import get_day, load_module
+from aoc.generators import generate
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture(scope="module")
+def day():
+    return load_module(get_day(2))
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path / "cache"))
+
+
+def game_maxima(text: str) -> dict[int, tuple[int, int, int]]:
+    # game id -> most red, green and blue cubes of any reveal, straight from the text
+    games = {}
+    for line in text.splitlines():
+        game, reveals = line.split(":")
+        most = {"red": 0, "green": 0, "blue": 0}
+        for cube in reveals.replace(";", ",").split(","):
+            count, color = cube.split()
+            most[color] = max(most[color], int(count))
+        games[int(game.split()[1])] = (most["red"], most["green"], most["blue"])
+    return games
+
+
+def brute_force_ids(games, red: int, green: int, blue: int) -> list[int]:
+    return sorted(game_id for game_id, (r, g, b) in games.items() if r <= red and g <= green and b <= blue)
+
+
+def random_log(day, tmp_path, seed: int):
+    text = generate(2, scale=0.3, seed=seed)
+    path = tmp_path / f"games-{seed}.txt"
+    path.write_text(text)
+    return day.parse_input(str(path)), game_maxima(text)
+
+
+def limits(games, seed: int) -> list[tuple[int, int, int]]:
+    # every distinct maximum and its neighbours, plus a few random ones
+    values = sorted({value + step for maxima in games.values() for value in maxima for step in (-1, 0, 1)})
+    rng = random.Random(seed)
+    return [tuple(rng.choice(values) for _ in range(3)) for _ in range(200)] + [(0, 0, 0), (99, 99, 99)]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_limit_index_matches_brute_force(day, tmp_path, seed):
+    log, games = random_log(day, tmp_path, seed)
+    queries = limits(games, seed)
+
+    expected_ids = [brute_force_ids(games, *query) for query in queries]
+    assert [log.index.ids(*query) for query in queries] == expected_ids
+    assert [log.index.id_sum(*query) for query in queries] == [sum(ids) for ids in expected_ids]
+    assert log.index.id_sums(np.array(queries)).tolist() == [sum(ids) for ids in expected_ids]
+
+
+def test_limit_index_without_table(day, tmp_path, monkeypatch):
+    monkeypatch.setattr(day, "MAX_TABLE_CELLS", 0)
+    log, games = random_log(day, tmp_path, 7)
+    queries = limits(games, 7)
+
+    assert log.index.sums is None
+    expected = [sum(brute_force_ids(games, *query)) for query in queries]
+    assert [log.index.id_sum(*query) for query in queries] == expected
+    assert log.index.id_sums(np.array(queries)).tolist() == expected
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_game_log_matches_the_parsed_games(day, tmp_path, seed):
+    log, games = random_log(day, tmp_path, seed)
+    parsed = day.parse_games(str(tmp_path / f"games-{seed}.txt"))
+
+    assert parsed == list(games.items())
+    assert log.game_ids.tolist() == [game_id for game_id, _ in parsed]
+    assert log.maxima.T.tolist() == [list(maxima) for _, maxima in parsed]
+    for red, green, blue in itertools.product((0, 5, 12, 13, 14, 20), repeat=3):
+        assert log.id_sum(red, green, blue) == sum(brute_force_ids(games, red, green, blue))
+
+
+def test_parts_on_the_game_log(day, tmp_path):
+    # the parts in plain Python give the same answers as the game log
+    log, _ = random_log(day, tmp_path, 5)
+    path = str(tmp_path / "games-5.txt")
+
+    assert day.part_1(path) == log.id_sum(red=12, green=13, blue=14)
+    assert day.part_2(path) == int(log.maxima.prod(axis=0).sum())
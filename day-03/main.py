@@ -1,131 +1,174 @@
-from operator import attrgetter
-
-
-def read_input():
-    # read input.txt into a 140x140 matrix
-    with open("input.txt", "r") as f:
-        data = f.readlines()
-        data = [list(x.strip()) for x in data]
-        return data
-
-
-DATA = read_input()
-WIDTH = len(DATA[0])
-HEIGHT = len(DATA)
-
-
-def get_value_at(x: int, y: int) -> str:
-    if 0 <= x < WIDTH and 0 <= y < HEIGHT:
-        return DATA[y][x]
-    else:
-        return "."
-
-
-class NumberWrapper:
-    # compare by identity, not by value,
-    # because the same "engine part number" can appear multiple times in the grid
-    def __init__(self, value: int):
-        self.value = value
-
-    def __eq__(self, other):
-        return self is other
-
-    def __hash__(self):
-        return hash(id(self))
-
-
-def build_numbers_map() -> dict[tuple[int, int], NumberWrapper]:
-    # build a map of coordinates to numbers
-    # key: (x, y) tuple
-    # value: number at that coordinate, with a wrapper because we need to compare these numbers by identity
-    # if there's a multi-digit number at a coordinate, store that number to all the coordinates it covers
-    numbers_map = {}
-
-    for y in range(HEIGHT):
-        x = 0
-        while x < WIDTH:
-            value = get_value_at(x, y)
-            if value.isdigit():
-                i = 1
-                while get_value_at(x + i, y).isdigit():
-                    i += 1
-                number = NumberWrapper(
-                    int("".join([get_value_at(x + j, y) for j in range(i)]))
-                )
-                for j in range(i):
-                    numbers_map[(x + j, y)] = number
-                x += i
-            else:
-                x += 1
-
-    return numbers_map
-
-
-def build_symbols_map() -> dict[tuple[int, int], str]:
-    # build a map of coordinates to symbols
-    # key: (x, y) tuple
-    # value: symbol at that coordinate
-    symbols_map = {}
-    for y in range(HEIGHT):
-        for x in range(WIDTH):
-            value = get_value_at(x, y)
-            if not value.isdigit() and value != ".":
-                symbols_map[(x, y)] = value
-
-    return symbols_map
-
-
-def part_1():
-    numbers_map = build_numbers_map()
-    symbols_map = build_symbols_map()
-
-    numbers_adjacent_to_symbols = set()
-
-    # iterate over symbols and check if there is any adjacent number (even diagonally)
-    # if there is, add that number to the set
-    for x, y in symbols_map:
-        adjacent_coords = [
-            (x - 1, y - 1),
-            (x, y - 1),
-            (x + 1, y - 1),
-            (x - 1, y),
-            (x + 1, y),
-            (x - 1, y + 1),
-            (x, y + 1),
-            (x + 1, y + 1),
-        ]
-        for coord in adjacent_coords:
-            if coord in numbers_map:
-                numbers_adjacent_to_symbols.add(numbers_map[coord])
-
-    return sum(map(attrgetter("value"), numbers_adjacent_to_symbols))
-
-def part_2():
-    numbers_map = build_numbers_map()
-    symbols_map = build_symbols_map()
-
-    # iterate over '*' symbols and check if it is adjecent to exactly 2 numbers
-    sum = 0
-    for x, y in symbols_map:
-        if symbols_map[(x, y)] != "*":
-            continue
-
-        adjacent_coords = [
-            (x - 1, y - 1),
-            (x, y - 1),
-            (x + 1, y - 1),
-            (x - 1, y),
-            (x + 1, y),
-            (x - 1, y + 1),
-            (x, y + 1),
-            (x + 1, y + 1),
+import re
+import sys
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc.grid import Grid
+from aoc.inputs import open_input, resolve
+from aoc.lazy import lazy_import
+
+# only needed by the vectorized parts
+np = lazy_import("numpy")
+
+NUMBER = re.compile(rb"\d+")
+GEAR = re.compile(rb"\*")
+# deleting these from a slice of a row leaves only the symbols
+NOT_SYMBOLS = b"0123456789."
+EMPTY = ord(".")
+
+# the pages of a mapped input are handed back to the OS after this many bytes
+RELEASE_EVERY = 8 << 20
+
+# start, end (exclusive) and value of a number in a padded row
+Number = tuple[int, int, int]
+
+
+def read_rows(filename: str) -> Iterator[bytes]:
+    # the rows of the schematic one by one, with an empty cell on both sides
+    with open_input(__file__, filename) as data:
+        for start, stop in data.line_ranges(RELEASE_EVERY):
+            for line in data.lines(start, stop):
+                yield b"." + bytes(line) + b"."
+            data.release(start, stop)
+
+
+def find_numbers(row: bytes) -> list[Number]:
+    return [(match.start(), match.end(), int(match.group())) for match in NUMBER.finditer(row)]
+
+
+def adjacent_numbers(numbers: list[Number], starts: list[int], x: int) -> Iterator[int]:
+    # values of the numbers of a row that touch column x or its two neighbours
+    i = bisect_right(starts, x + 1)
+    # the numbers do not overlap, only the last ones starting before x + 2 can reach back to x - 1
+    while i > 0 and numbers[i - 1][1] >= x:
+        yield numbers[i - 1][2]
+        i -= 1
+
+
+def scan_schematic(rows: Iterable[bytes]) -> Iterator[tuple[list[int], list[int]]]:
+    # Streams the schematic with a window of three rows. Once the row below a row has arrived, that
+    # row is done: yields the part numbers and the gear ratios in it, then the window moves down.
+    # Only the three rows and their numbers are kept, the height of the schematic does not matter.
+    window: list[bytes] = []
+    numbers: list[list[Number]] = []
+
+    def done(middle: int) -> tuple[list[int], list[int]]:
+        row = window[middle]
+        neighbours = [window[i] for i in (middle - 1, middle, middle + 1) if 0 <= i < len(window)]
+
+        part_numbers = [
+            value
+            for start, end, value in numbers[middle]
+            if any(other[start - 1 : end + 1].translate(None, NOT_SYMBOLS) for other in neighbours)
         ]
-        adjacent_numbers = {numbers_map[coord] for coord in adjacent_coords if coord in numbers_map}
-        if len(adjacent_numbers) == 2:
-            one, two = adjacent_numbers
-            sum += one.value * two.value
 
-    return sum
+        gear_ratios = []
+        nearby = [numbers[i] for i in (middle - 1, middle, middle + 1) if 0 <= i < len(window)]
+        starts = [[start for start, _, _ in row_numbers] for row_numbers in nearby]
+        for gear in GEAR.finditer(row):
+            x = gear.start()
+            values = [
+                value
+                for row_numbers, row_starts in zip(nearby, starts)
+                for value in adjacent_numbers(row_numbers, row_starts, x)
+            ]
+            if len(values) == 2:
+                gear_ratios.append(values[0] * values[1])
+
+        return part_numbers, gear_ratios
+
+    for row in rows:
+        window.append(row)
+        numbers.append(find_numbers(row))
+
+        if len(window) == 2:
+            yield done(0)
+        elif len(window) == 3:
+            yield done(1)
+            del window[0], numbers[0]
+
+    # the last row has no row below it
+    if window:
+        yield done(len(window) - 1)
+
+
+def read_grid(filename: str) -> tuple[Grid, "np.ndarray"]:
+    # the whole schematic, the border around it is empty space, and its cells as a flat uint8 array
+    grid = Grid.from_file(resolve(__file__, filename), border=".")
+    return grid, np.frombuffer(bytes(grid.cells), dtype=np.uint8)
+
+
+def label_numbers(cells: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    # Labels the runs of digits 1, 2, ... in reading order, 0 everywhere else, and computes the value
+    # of every label (values[0] is 0). The border is not a digit, so no run continues on the next row.
+    digits = (cells >= ord("0")) & (cells <= ord("9"))
+    starts = digits.copy()
+    starts[1:] &= ~digits[:-1]
+    labels = np.cumsum(starts, dtype=np.int64) * digits
+
+    positions = np.flatnonzero(digits)
+    run_labels = labels[positions]
+    # position of the last digit of every run, then the power of ten of every digit
+    ends = np.zeros(run_labels[-1] + 1 if len(positions) else 1, dtype=np.int64)
+    ends[run_labels] = positions
+    powers = 10 ** (ends[run_labels] - positions)
+    weighted = (cells[positions] - ord("0")).astype(np.int64) * powers
+
+    values = np.zeros(len(ends), dtype=np.int64)
+    if len(positions):
+        values[1:] = np.add.reduceat(weighted, np.flatnonzero(starts[positions]))
+    return labels, values
+
+
+def neighbourhood(grid: Grid, mask: "np.ndarray") -> "np.ndarray":
+    # the cells of the mask and their 8 neighbours (dilation with a 3x3 square), the mask has to be
+    # empty on the border
+    dilated = mask.copy()
+    inner = slice(grid.stride + 1, len(mask) - grid.stride - 1)
+    for offset in grid.all_offsets:
+        dilated[inner] |= mask[inner.start + offset : inner.stop + offset]
+    return dilated
+
+
+def part_1_vectorized(filename: str = "input.txt"):
+    grid, cells = read_grid(filename)
+    labels, values = label_numbers(cells)
+
+    symbols = (labels == 0) & (cells != EMPTY)
+    # a number is a part number if any of its digits is next to a symbol
+    is_part = np.zeros(len(values), dtype=bool)
+    is_part[labels[neighbourhood(grid, symbols)]] = True
+    return int(values[is_part].sum())
+
+
+def part_2_vectorized(filename: str = "input.txt"):
+    grid, cells = read_grid(filename)
+    labels, values = label_numbers(cells)
+
+    gears = np.flatnonzero(cells == ord("*"))
+    # labels of the 8 neighbours of every "*", one row per gear, sorted to count the distinct ones
+    around = np.sort(labels[gears[:, None] + np.array(grid.all_offsets)], axis=1)
+    distinct = (around != 0) & np.concatenate(
+        [np.ones((len(gears), 1), dtype=bool), around[:, 1:] != around[:, :-1]], axis=1
+    )
+    pairs = around[distinct.sum(axis=1) == 2]
+
+    # the larger label is the last one, the smaller one is the first that is not 0
+    first = np.where(pairs == 0, pairs.max(axis=1, keepdims=True), pairs).min(axis=1)
+    last = pairs.max(axis=1)
+    return int((values[first] * values[last]).sum())
+
+
+def part_1(filename: str = "input.txt"):
+    return sum(sum(part_numbers) for part_numbers, _ in scan_schematic(read_rows(filename)))
+
+
+def part_2(filename: str = "input.txt"):
+    return sum(sum(gear_ratios) for _, gear_ratios in scan_schematic(read_rows(filename)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc.days import get_day, load_module
+from aoc.generators import generate
+
+SAMPLE = """467..114..
+...*......
+..35..633.
+......#...
+617*......
+.....+.58.
+..592.....
+......755.
+...$.*....
+.664.598..
+"""
+
+# numbers on the first and the last row and against both edges, a "*" between three numbers that
+# is not a gear, a "*" next to a single number and a number next to nothing
+EDGES = """12...7
+*....#
+.3*4..
+..5..1
+8.....
+*...20
+9...*.
+"""
+
+
+@pytest.fixture(scope="module")
+def day():
+    return load_module(get_day(3))
+
+
+def scan(day, text: str) -> list[tuple[list[int], list[int]]]:
+    # the rows padded like read_rows does
+    return list(day.scan_schematic(b"." + row.encode() + b"." for row in text.splitlines()))
+
+
+def test_scan_schematic_row_by_row(day):
+    assert scan(day, EDGES) == [
+        ([12, 7], []),
+        ([], [12 * 3]),
+        ([3, 4], []),
+        ([5], []),
+        ([8], []),
+        ([20], [8 * 9]),
+        ([9], []),
+    ]
+
+
+def test_short_schematics(day):
+    assert scan(day, "") == []
+    assert scan(day, "1*2") == [([1, 2], [2])]
+    assert scan(day, "3.\n.#") == [([3], []), ([], [])]
+
+
+@pytest.mark.parametrize("text, answers", [(SAMPLE, (4361, 467835)), (EDGES, (68, 108))])
+def test_parts(day, tmp_path, text, answers):
+    path = tmp_path / "input.txt"
+    path.write_text(text)
+
+    assert (day.part_1(str(path)), day.part_2(str(path))) == answers
+
+
+@pytest.mark.parametrize(
+    "text",
+    [SAMPLE, EDGES, "1*2\n", "5\n", "..\n..\n"] + [generate(3, scale=0.1, seed=seed) for seed in range(5)],
+)
+def test_vectorized_parts_match_the_scan(day, tmp_path, text):
+    pytest.importorskip("numpy")
+    path = str(tmp_path / "input.txt")
+    with open(path, "w") as f:
+        f.write(text)
+
+    assert day.part_1_vectorized(path) == day.part_1(path)
+    assert day.part_2_vectorized(path) == day.part_2(path)
@@ -1,70 +1,126 @@
-def parse_input():
-    # read input txt
-    # each line looks line:
-    # Card (one or more whitespace) <id>: <list of winning numbers separated by one or more space> | <list of numbers separated by one or more space>
-    # For example: Card   4: 22 99 16 18 81  3 62 43  2 42 |  8 55 39 83 29 10 87 27 25 70 19 30 80 12  1 41 85 14 34 82 90 76  5 89 15
-    # return a list of dicts
-    # expected output for the example above:
-    # [
-    #   {
-    #     "id": "4",
-    #     "winning_numbers": ["22", "99", "16", "18", "81", "3", "62", "43", "2", "42"],
-    #     "numbers": ["8", "55", "39", "83", "29", "10", "87", "27", "25", "70", "19", "30", "80", "12", "1", "41", "85", "14", "34", "82", "90", "76", "5", "89", "15"]
-    #   }
-    # ]
-    with open("input.txt") as f:
-        lines = f.readlines()
-    lines = [line.strip() for line in lines]
+import sys
+from collections.abc import Iterable
+from functools import reduce
+from operator import or_
+from pathlib import Path
+
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc.cache import parsed_input
+from aoc.inputs import open_input
+from aoc.lazy import lazy_import
+
+# only needed by the vectorized parts
+np = lazy_import("numpy")
+
+# a card is a pair of bitmasks, bit n is set if n is one of its winning numbers / numbers you have
+Card = tuple[int, int]
+
+
+class Bits(dict):
+    # number as it is written -> its bit, filled as the numbers show up
+    def __missing__(self, token: str) -> int:
+        bit = self[token] = 1 << int(token)
+        return bit
+
+
+BITS = Bits()
+
+
+def bitmask(numbers: Iterable[str]) -> int:
+    return reduce(or_, map(BITS.__getitem__, numbers), 0)
+
+
+@parsed_input(version=2)
+def parse_input(filename: str) -> list[Card]:
+    # each line looks like:
+    # Card   4: 22 99 16 18 81  3 62 43  2 42 |  8 55 39 83 29 10 87 27 25 70 19 30 80 12  1 41 85 14 34 82 90 76  5 89 15
+    # the cards are in order of their ids, which are not needed
     cards = []
-    for line in lines:
-        card = {}
-        card["id"] = line.split(":")[0].split()[1]
-        card["winning_numbers"] = list(
-            map(int, line.split("|")[0].split(":")[1].split())
-        )
-        card["numbers"] = list(map(int, line.split("|")[1].split()))
-        cards.append(card)
+    with open_input(__file__, filename) as data:
+        for line in data.text_lines():
+            winning_numbers, numbers = line.split(":")[1].split("|")
+            cards.append((bitmask(winning_numbers.split()), bitmask(numbers.split())))
     return cards
 
 
-def part_1():
-    cards = parse_input()
+def match_counts(cards: list[Card]) -> list[int]:
+    # the numbers you have that are winning numbers: popcount of the AND of the masks
+    return [(winning_numbers & numbers).bit_count() for winning_numbers, numbers in cards]
+
 
-    sum_point = 0
+def points(matches: int) -> int:
+    return 1 << (matches - 1) if matches else 0
 
-    for card in cards:
-        good_numbers = [
-            number for number in card["numbers"] if number in card["winning_numbers"]
-        ]
-        if len(good_numbers) > 0:
-            sum_point += 2 ** (len(good_numbers) - 1)
 
-    return sum_point
+def count_copies(matches: list[int]) -> int:
+    # Every copy of a card wins one copy of each of the next `matches` cards. Instead of adding to
+    # all of them, the copies are added where the range starts and taken away where it ends, and a
+    # running sum collects them, so a card costs the same whatever its number of matches.
+    changes = [0] * (len(matches) + 1)
+    won = 0
+    total = 0
 
+    for index, n in enumerate(matches):
+        won += changes[index]
+        amount = 1 + won
+        total += amount
 
-def part_2():
-    cards = parse_input()
+        if n:
+            changes[index + 1] += amount
+            changes[min(index + n + 1, len(matches))] -= amount
 
-    wins = list(
-        map(
-            lambda card: len(
-                [
-                    number
-                    for number in card["numbers"]
-                    if number in card["winning_numbers"]
-                ]
-            ),
-            cards,
-        )
+    return total
+
+
+def part_1(filename: str = "input.txt"):
+    return sum(map(points, match_counts(parse_input(filename))))
+
+
+def part_2(filename: str = "input.txt"):
+    return count_copies(match_counts(parse_input(filename)))
+
+
+def pack_masks(masks: list[int], words: int) -> "np.ndarray":
+    # the masks as rows of 64 bit words, least significant word first
+    data = b"".join(mask.to_bytes(8 * words, "little") for mask in masks)
+    return np.frombuffer(data, dtype="<u8").reshape(len(masks), words)
+
+
+def popcount(words: "np.ndarray") -> "np.ndarray":
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+    # before numpy 2.0: count the bits of every byte with a lookup table
+    table = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+    return table[words.view(np.uint8)].reshape(*words.shape, 8).sum(axis=-1)
+
+
+def match_counts_vectorized(winning_numbers: "np.ndarray", numbers: "np.ndarray") -> "np.ndarray":
+    # one row of words per card, AND them and count the bits of all the words of a row
+    return popcount(winning_numbers & numbers).sum(axis=1, dtype=np.int64)
+
+
+def pack_cards(cards: list[Card]) -> tuple["np.ndarray", "np.ndarray"]:
+    # enough words for the largest number on any card, two of them for the usual numbers below 100
+    largest = max((max(card).bit_length() for card in cards), default=1)
+    words = max((largest + 63) // 64, 1)
+    return (
+        pack_masks([winning_numbers for winning_numbers, _ in cards], words),
+        pack_masks([numbers for _, numbers in cards], words),
     )
 
-    amount_by_cards = [1 for _ in range(len(cards))]
 
-    for index, n in enumerate(wins):
-        for j in range(index + 1, min(index + n + 1, len(cards))):
-            amount_by_cards[j] += amount_by_cards[index]
+def part_1_vectorized(filename: str = "input.txt"):
+    matches = match_counts_vectorized(*pack_cards(parse_input(filename)))
+    # 2 ** (matches - 1), and 0 for no matches
+    return int(((np.int64(1) << matches) >> 1).sum())
+
 
-    return sum(amount_by_cards)
+def part_2_vectorized(filename: str = "input.txt"):
+    # only the match counts are vectorized, the copies depend on the cards before them
+    matches = match_counts_vectorized(*pack_cards(parse_input(filename)))
+    return count_copies(matches.tolist())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,119 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc.days import get_day, load_module
+from aoc.generators import generate
+
+SAMPLE = """Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53
+Card 2: 13 32 20 16 61 | 61 30 68 82 17 32 24 19
+Card 3:  1 21 53 59 44 | 69 82 63 72 16 21 14  1
+Card 4: 41 92 73 84 69 | 59 84 76 51 58  5 54 83
+Card 5: 87 83 26 28 32 | 88 30 70 12 93 22 82 36
+Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11
+"""
+
+
+@pytest.fixture(scope="module")
+def day():
+    return load_module(get_day(4))
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path / "cache"))
+
+
+def random_cards(seed: int, count: int, largest: int) -> str:
+    # numbers up to largest, so the masks of the vectorized parts take several 64 bit words
+    rng = random.Random(seed)
+    lines = []
+    for card in range(1, count + 1):
+        winning_numbers = rng.sample(range(largest + 1), 5)
+        numbers = rng.sample(range(largest + 1), 8)
+        # most cards win something, some of them a lot
+        numbers[: rng.randint(0, 5)] = winning_numbers[: rng.randint(0, 5)]
+        numbers = list(dict.fromkeys(numbers))
+        lines.append(f"Card {card}: {' '.join(map(str, winning_numbers))} | {' '.join(map(str, numbers))}")
+    return "\n".join(lines) + "\n"
+
+
+def scalar_answers(text: str) -> tuple[int, int]:
+    # the puzzle as it is written: sets of numbers, and every copy won one by one
+    matches = []
+    for line in text.splitlines():
+        winning_numbers, numbers = line.split(":")[1].split("|")
+        matches.append(len(set(winning_numbers.split()) & set(numbers.split())))
+
+    copies = [1] * len(matches)
+    for card, n in enumerate(matches):
+        for won in range(card + 1, min(card + 1 + n, len(matches))):
+            copies[won] += copies[card]
+
+    return sum(2 ** (n - 1) for n in matches if n), sum(copies)
+
+
+def texts():
+    return {
+        "sample": SAMPLE,
+        "generated": generate(4, scale=0.5, seed=1),
+        "two words": random_cards(2, 60, largest=127),
+        "three words": random_cards(3, 60, largest=190),
+        "one card": "Card 1: 64 128 3 | 128 3 64\n",
+    }
+
+
+@pytest.fixture(params=list(texts()))
+def cards(request, tmp_path):
+    text = texts()[request.param]
+    path = tmp_path / "input.txt"
+    path.write_text(text)
+    return str(path), text
+
+
+def test_parts_match_the_scalar_version(day, cards):
+    path, text = cards
+    assert (day.part_1(path), day.part_2(path)) == scalar_answers(text)
+
+
+def test_vectorized_parts_match_the_scalar_version(day, cards):
+    pytest.importorskip("numpy")
+    path, text = cards
+    assert (day.part_1_vectorized(path), day.part_2_vectorized(path)) == scalar_answers(text)
+
+
+def test_masks_over_several_words(day, monkeypatch):
+    np = pytest.importorskip("numpy")
+    cards = [(day.bitmask(["1", "64", "130"]), day.bitmask(["64", "130", "191", "2"]))]
+
+    winning_numbers, numbers = day.pack_cards(cards)
+    assert winning_numbers.shape == (1, 3)
+    assert winning_numbers.tolist() == [[1 << 1, 1, 1 << 2]]
+    assert day.match_counts_vectorized(winning_numbers, numbers).tolist() == [2]
+
+    # without np.bitwise_count the bits are counted per byte
+    words = np.array([[0, 1 << 63, (1 << 64) - 1]], dtype=np.uint64)
+    expected = [[0, 1, 64]]
+    assert day.popcount(words).tolist() == expected
+    monkeypatch.delattr(np, "bitwise_count", raising=False)
+    assert day.popcount(words).tolist() == expected
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_running_sum_of_copies(day, seed):
+    rng = random.Random(seed)
+    matches = [rng.randint(0, 10) for _ in range(50)]
+    # the last cards win past the end of the table
+    matches[-3:] = [10, 10, 10]
+
+    copies = [1] * len(matches)
+    for card, n in enumerate(matches):
+        for won in range(card + 1, min(card + 1 + n, len(matches))):
+            copies[won] += copies[card]
+
+    assert day.count_copies(matches) == sum(copies)
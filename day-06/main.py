@@ -1,10 +1,21 @@
-# Time:        46828479
-# Distance:   347152214061471
-
+import sys
 from math import sqrt, ceil, floor
 from operator import mul
 from functools import reduce
+from pathlib import Path
+
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import open_input
+
 
+def read_input(filename: str) -> tuple[list[str], list[str]]:
+    # the numbers of the "Time:" and the "Distance:" lines, as text,
+    # because part 2 reads them with the spaces between the digits removed
+    with open_input(__file__, filename) as data:
+        time_line, distance_line, *_ = data.text_lines()
+    return time_line.split(":")[1].split(), distance_line.split(":")[1].split()
 
 
 def count_possible_solutions(time: int, distance: int) -> int:
@@ -19,23 +30,23 @@ def count_possible_solutions(time: int, distance: int) -> int:
     return last_good_integer - first_good_integer + 1
 
 
-def part_1():
-    times = [46, 82, 84, 79]
-    distances = [347, 1522, 1406, 1471]
+def part_1(filename: str = "input.txt"):
+    times, distances = read_input(filename)
 
     return reduce(
         mul,
         (
-            count_possible_solutions(time, distance)
+            count_possible_solutions(int(time), int(distance))
             for time, distance in zip(times, distances)
         ),
         1,
     )
 
 
-def part_2():
-    time = 46828479
-    distance = 347152214061471
+def part_2(filename: str = "input.txt"):
+    times, distances = read_input(filename)
+    time = int("".join(times))
+    distance = int("".join(distances))
     return count_possible_solutions(time, distance)
 
 
@@ -1,4 +1,12 @@
+import sys
 from itertools import groupby
+from pathlib import Path
+
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc.cache import parsed_input
+from aoc.inputs import open_input
 
 
 HAND_ORDER_BY_GROUPS = {
@@ -119,26 +127,27 @@ class JokerHand:
         return self._cards == other._cards
 
 
-def parse_input():
-    with open("input.txt", "r") as f:
-        return [((parts := line.split())[0], int(parts[1])) for line in f]
+@parsed_input(version=1)
+def parse_input(filename: str):
+    with open_input(__file__, filename) as data:
+        return [((parts := line.split())[0], int(parts[1])) for line in data.text_lines()]
 
 
-def part_1():
-    data = [(Hand(cards), bid) for cards, bid in parse_input()]
+def part_1(filename: str = "input.txt"):
+    data = [(Hand(cards), bid) for cards, bid in parse_input(filename)]
     sorted_data = sorted(data, key=lambda x: x[0])
     return sum([(index + 1) * bid for index, (hand, bid) in enumerate(sorted_data)])
 
 
-def part_2():
-    data = [(JokerHand(cards), bid) for cards, bid in parse_input()]
+def part_2(filename: str = "input.txt"):
+    data = [(JokerHand(cards), bid) for cards, bid in parse_input(filename)]
     sorted_data = sorted(data, key=lambda x: x[0])
     return sum([(index + 1) * bid for index, (hand, bid) in enumerate(sorted_data)])
 
 
 def debug():
     print("########### DEBUG ############")
-    data = [(Hand(cards), JokerHand(cards)) for cards, bid in parse_input()]
+    data = [(Hand(cards), JokerHand(cards)) for cards, bid in parse_input("input.txt")]
     for hand, joker_hand in data:
         if hand._groups != joker_hand._groups:
             print(f"{hand} {hand._groups} -> {joker_hand._groups}")
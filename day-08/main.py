@@ -1,17 +1,27 @@
+import sys
 from itertools import cycle
+from pathlib import Path
 
-STEP_LINE = "LRRLRLRRRLLRLRRRLRLLRLRLRRLRLRRLRRLRLRLLRRRLRRLLRRRLRRLRRRLRRLRLRLLRRLRLRRLLRRRLLLRRRLLLRRLRLRRLRLLRRRLRRLRRRLRRLLRRRLRRRLRRRLRLRRLRLRRRLRRRLRRLRLRRLLRRRLRRLLRRLRRLRLRLRRRLRLLRRRLRRLRRRLLRRLLLLLRRRLRRLLLRRRLRRRLRRLRLLLLLRLRRRLRRRLRLRRLLLLRLRRRLLRRRLRRRLRLRLRRLRRLRRLRLRLLLRLRRLRRLRRRLRRRLLRRRR"
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
+from aoc.cache import parsed_input
+from aoc.inputs import open_input
 
-def read_map():
-    # read input.txt from the 3rd line
-    # each line looks like this: "RBX = (TMF, KTP)"
+
+@parsed_input(version=2)
+def read_map(filename: str) -> tuple[str, dict]:
+    # the first line is the list of steps, the map starts on the 3rd line
+    # each line of the map looks like this: "RBX = (TMF, KTP)"
     # put each line into a dict, for the exmple above, it will be:
     # {"RBX": {"L": "TMF", "R": "KTP"}}
-    # return the dict
+    # return the steps and the dict
 
-    with open("input.txt") as f:
-        lines = f.readlines()[2:]
+    with open_input(__file__, filename) as data:
+        lines = data.text_lines()
+        step_line = next(lines).strip()
+        # skip the blank line after the steps
+        next(lines)
         result = {}
         for line in lines:
             line = line.strip()
@@ -19,7 +29,7 @@ def read_map():
             value = value[1:-1]
             value = value.split(", ")
             result[key] = {"L": value[0], "R": value[1]}
-        return result
+        return step_line, result
 
 
 def least_common_multiple(numbers: list[int]) -> int:
@@ -43,9 +53,9 @@ def least_common_multiple(numbers: list[int]) -> int:
     return result
 
 
-def part_1():
-    puzzle_map = read_map()
-    steps = cycle(STEP_LINE)
+def part_1(filename: str = "input.txt"):
+    step_line, puzzle_map = read_map(filename)
+    steps = cycle(step_line)
 
     current = "AAA"
     for i, step in enumerate(steps):
@@ -54,9 +64,9 @@ def part_1():
             return i + 1
 
 
-def part_2():
-    puzzle_map = read_map()
-    steps = cycle(STEP_LINE)
+def part_2(filename: str = "input.txt"):
+    step_line, puzzle_map = read_map(filename)
+    steps = cycle(step_line)
 
     def calculate_period(start: str) -> int:
         current = start
@@ -1,3 +1,13 @@
+import sys
+from pathlib import Path
+
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc.cache import parsed_input
+from aoc.inputs import open_input
+
+
 def get_diffs(numbers: list[int]) -> list[int]:
     return [b - a for a, b in zip(numbers, numbers[1:])]
 
@@ -36,19 +46,20 @@ def predict_previous_value_for_history(history: list[int]) -> int:
     return predicted_value
 
 
-def read_input() -> list[list[int]]:
-    with open("input.txt") as f:
-        return [list(map(int, line.split())) for line in f]
+@parsed_input(version=1)
+def read_input(filename: str) -> list[list[int]]:
+    with open_input(__file__, filename) as data:
+        return [list(map(int, line.split())) for line in data.text_lines()]
 
 
-def part_1():
-    histories = read_input()
+def part_1(filename: str = "input.txt"):
+    histories = read_input(filename)
     next_values = list(map(predict_next_value_for_history, histories))
     return sum(next_values)
 
 
-def part_2():
-    histories = read_input()
+def part_2(filename: str = "input.txt"):
+    histories = read_input(filename)
     previous_values = list(map(predict_previous_value_for_history, histories))
     return sum(previous_values)
 
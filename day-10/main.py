@@ -1,88 +1,83 @@
+import sys
 from collections import deque
 from pathlib import Path
 
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
-def get_neighbours(x: int, y: int, char: str) -> list[tuple[int, int]]:
-    if char == "." or char == "S":
-        return []
-    if char == "-":
-        return [(x + 1, y), (x - 1, y)]
-    if char == "|":
-        return [(x, y + 1), (x, y - 1)]
-    if char == "L":
-        return [(x, y - 1), (x + 1, y)]
-    if char == "7":
-        return [(x, y + 1), (x - 1, y)]
-    if char == "J":
-        return [(x, y - 1), (x - 1, y)]
-    if char == "F":
-        return [(x, y + 1), (x + 1, y)]
+from aoc.cache import parsed_input
+from aoc.grid import Grid
+from aoc.inputs import resolve
 
-    raise ValueError(f"Unknown character: {char}")
+# the two directions each pipe connects
+PIPES = {
+    "-": ("right", "left"),
+    "|": ("down", "up"),
+    "L": ("up", "right"),
+    "7": ("down", "left"),
+    "J": ("up", "left"),
+    "F": ("down", "right"),
+}
 
 
-def get_start_position(lines: list[str]) -> tuple[int, int]:
-    for y, line in enumerate(lines):
-        for x, char in enumerate(line):
-            if char == "S":
-                return (x, y)
-    raise ValueError("No start position found")
-
-
-def are_neighbours(
-    point_1: tuple[int, int],
-    point_2: tuple[int, int],
-    matrix: dict[tuple[int, int], list[tuple[int, int]]],
-) -> bool:
-    if point_1 not in matrix or point_2 not in matrix:
-        return False
-
-    for neigbour in matrix[point_1]:
-        if neigbour == point_2:
-            return True
-
-    for neigbour in matrix[point_2]:
-        if neigbour == point_1:
-            return True
-
-    return False
+def pipe_offsets(grid: Grid) -> list[tuple[int, ...]]:
+    # byte value -> offsets of the cells the pipe connects to, empty for ground
+    offsets = [()] * 256
+    for char, directions in PIPES.items():
+        offsets[ord(char)] = tuple(getattr(grid, d) for d in directions)
+    return offsets
 
 
+@parsed_input(version=2)
 def parse_input(filename: str) -> dict:
-    lines = Path(filename).read_text().splitlines()
-    width = len(lines[0])
-    height = len(lines)
+    # the border is ground, so pipes on the edge lead nowhere
+    grid = Grid.from_file(resolve(__file__, filename), border=".")
+
+    for i in grid.indices():
+        if grid[i] not in PIPES and grid[i] not in ".S":
+            raise ValueError(f"Unknown character: {grid[i]}")
+
+    start = grid.find("S")
+    offsets = pipe_offsets(grid)
+
+    # the start connects to the neighbours that connect back to it,
+    # replace it with the pipe that does the same
+    start_directions = {
+        direction
+        for direction in ("up", "right", "down", "left")
+        if -getattr(grid, direction) in offsets[grid.cells[start + getattr(grid, direction)]]
+    }
+    for char, directions in PIPES.items():
+        if set(directions) == start_directions:
+            grid[start] = char
+            break
+    else:
+        raise ValueError(f"Unknown neighbours: {start_directions}, start pos: {grid.coords(start)}")
 
-    neighbour_matrix = {
-        (x, y): get_neighbours(x, y, lines[y][x])
-        for y in range(height)
-        for x in range(width)
+    return {
+        "grid": grid,
+        "width": grid.width,
+        "height": grid.height,
+        "start": start,
+        "start_pos": grid.coords(start),
     }
 
-    start_pos = get_start_position(lines)
-    start_x, start_y = start_pos
 
-    start_position_neighbour_candidates = [
-        (start_x + 1, start_y),
-        (start_x - 1, start_y),
-        (start_x, start_y + 1),
-        (start_x, start_y - 1),
-    ]
-    neigbours = [
-        candidate
-        for candidate in start_position_neighbour_candidates
-        if are_neighbours(start_pos, candidate, neighbour_matrix)
-    ]
-    neighbour_matrix[start_pos] = neigbours
+def coordinate_view(
+    data: dict,
+) -> tuple[list[list[str]], dict[tuple[int, int], list[tuple[int, int]]]]:
+    # the lines and the (x, y) -> connected (x, y) neighbours map used by the sandboxes
+    grid = data["grid"]
+    offsets = pipe_offsets(grid)
 
-    return {
-        "lines": [list(line) for line in lines],
-        "matrix": neighbour_matrix,
-        "width": width,
-        "height": height,
-        "start_pos": start_pos,
+    lines = [list(line) for line in grid.lines()]
+    neighbour_matrix = {
+        grid.coords(i): [grid.coords(i + offset) for offset in offsets[grid.cells[i]]]
+        for i in grid.indices()
     }
 
+    return lines, neighbour_matrix
+
 
 def print_distances(distances: dict[tuple[int, int], int], width: int, height: int):
     for y in range(height):
@@ -93,37 +88,34 @@ def print_distances(distances: dict[tuple[int, int], int], width: int, height: i
         print()
 
 
-def part_1():
-    data = parse_input("input.txt")
+def part_1(filename: str = "input.txt"):
+    data = parse_input(filename)
 
-    neighbour_matrix = data["matrix"]
-    width = data["width"]
-    height = data["height"]
-    start_pos = data["start_pos"]
-
-    distances = {(x, y): -1 for x in range(width) for y in range(height)}
-    visited = {(x, y): False for x in range(width) for y in range(height)}
+    grid = data["grid"]
+    start = data["start"]
+    offsets = pipe_offsets(grid)
+    cells = grid.cells
 
-    distances[start_pos] = 0
-    visited[start_pos] = True
+    distances = [-1] * len(cells)
+    distances[start] = 0
 
-    queue = deque([start_pos])
+    queue = deque([start])
     while queue:
         current = queue.popleft()
-        visited[current] = True
 
-        for neighbour in neighbour_matrix[current]:
-            if not visited[neighbour]:
+        for offset in offsets[cells[current]]:
+            neighbour = current + offset
+            if distances[neighbour] == -1:
                 queue.append(neighbour)
                 distances[neighbour] = distances[current] + 1
 
-    return max(distances.values())
+    return max(distances)
 
 
 def sandbox():
     data = parse_input("input_sample.txt")
 
-    neighbour_matrix = data["matrix"]
+    _, neighbour_matrix = coordinate_view(data)
     width = data["width"]
     height = data["height"]
     start_pos = data["start_pos"]
@@ -153,8 +145,7 @@ def sandbox_2():
     data = parse_input("input.txt")
     # data = parse_input("input_sample_2.txt")
 
-    lines = data["lines"]
-    neighbour_matrix = data["matrix"]
+    lines, neighbour_matrix = coordinate_view(data)
     width = data["width"]
     height = data["height"]
     start_pos = data["start_pos"]
@@ -360,8 +351,7 @@ def sandbox_reddit():
     # data = parse_input("input.txt")
     data = parse_input("input_sample_2.txt")
 
-    lines = data["lines"]
-    neighbour_matrix = data["matrix"]
+    lines, neighbour_matrix = coordinate_view(data)
     width = data["width"]
     height = data["height"]
     start_pos = data["start_pos"]
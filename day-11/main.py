@@ -1,11 +1,18 @@
+import sys
 from pathlib import Path
 
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
-def expand_input():
+from aoc.inputs import read_lines
+
+
+def expand_input(filename: str) -> list[str]:
+    # the image with every empty row and column doubled
     rows_to_duplicate = []
     columns_to_duplicate = []
 
-    lines = Path("input.txt").read_text().splitlines()
+    lines = list(read_lines(__file__, filename))
 
     width = len(lines[0])
     height = len(lines)
@@ -18,9 +25,6 @@ def expand_input():
         if all([lines[row][column] == "." for row in range(height)]):
             columns_to_duplicate.append(column)
 
-    print("Rows", rows_to_duplicate)
-    print("Columns", columns_to_duplicate)
-
     expanded_lines = []
     for row in range(height):
         expanded_line = ""
@@ -34,9 +38,7 @@ def expand_input():
         if row in rows_to_duplicate:
             expanded_lines.append(expanded_line)
 
-    with open("expanded_input.txt", "w") as f:
-        for line in expanded_lines:
-            f.write(line + "\n")
+    return expanded_lines
 
 
 def collect_emtpy_rows(lines: list[str]) -> list[int]:
@@ -67,8 +69,8 @@ def collect_coordinates(lines: list[str]) -> list[tuple[int, int]]:
     ]
 
 
-def part_1():
-    lines = Path("expanded_input.txt").read_text().splitlines()
+def part_1(filename: str = "input.txt"):
+    lines = expand_input(filename)
     coordinates = collect_coordinates(lines)
 
     sum = 0
@@ -83,8 +85,8 @@ def part_1():
     return sum
 
 
-def part_2():
-    lines = Path("input.txt").read_text().splitlines()
+def part_2(filename: str = "input.txt"):
+    lines = list(read_lines(__file__, filename))
 
     empty_rows = collect_emtpy_rows(lines)
     empty_columns = collect_empty_columns(lines)
@@ -1,12 +1,21 @@
+import sys
 from functools import cache
 from itertools import combinations
 from pathlib import Path
 
 import re
 
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
+from aoc import metrics
+from aoc.cache import parsed_input
+from aoc.inputs import read_lines
+
+
+@parsed_input(version=1)
 def read_input(filename: str) -> list[tuple[str, list[int]]]:
-    lines = Path(filename).read_text().splitlines()
+    lines = read_lines(__file__, filename)
     return [
         ((parts := line.split())[0], list(map(int, parts[1].split(","))))
         for line in lines
@@ -28,7 +37,12 @@ def calc_groups(record: str) -> list[int]:
 
 
 def count_possible_combinations(record: str, desired_groups: list[int]) -> int:
+    # this one has no cache, the metrics count the calls instead of hits and misses
+    calls = 0
+
     def inner_count(text: str) -> int:
+        nonlocal calls
+        calls += 1
         groups = calc_groups(text)
         if "?" not in text:
             return 1 if groups == desired_groups else 0
@@ -45,7 +59,9 @@ def count_possible_combinations(record: str, desired_groups: list[int]) -> int:
             text.replace("?", ".", 1)
         )
 
-    return inner_count(record)
+    result = inner_count(record)
+    metrics.counter("count_possible_combinations.calls").inc(calls)
+    return result
 
 
 def possible_group_prefix(record: str) -> int:
@@ -149,6 +165,13 @@ def count_arrangements(record: str, groups: tuple[int, ...]) -> int:
     )
 
 
+def record_cache_info():
+    # functools counts the hits and misses itself, report them before the cache is cleared
+    info = count_arrangements.cache_info()
+    metrics.counter("count_arrangements.cache_hits").inc(info.hits)
+    metrics.counter("count_arrangements.cache_misses").inc(info.misses)
+
+
 def sandbox():
     puzzle_input = read_input("input_sample.txt")
 
@@ -158,8 +181,8 @@ def sandbox():
         print(record, desired_groups, arrangement_count)
 
 
-def part_1():
-    puzzle_input = read_input("input.txt")
+def part_1(filename: str = "input.txt"):
+    puzzle_input = read_input(filename)
 
     sum = 0
 
@@ -174,8 +197,10 @@ def part_1_optimized_by_me():
 
     sum = 0
 
+    count_arrangements.cache_clear()
     for record, desired_groups in puzzle_input:
         sum += count_arrangements(record, tuple(desired_groups))
+    record_cache_info()
 
     return sum
 
@@ -190,8 +215,7 @@ def part_1_other():
         actual_group_sizes = list(map(len, actual_groups))
         return actual_group_sizes == expected_group_sizes
 
-    with open("input.txt") as f:
-        input_data = f.read().splitlines()
+    input_data = read_lines(__file__, "input.txt")
 
     total_arrangements = 0
     for line in input_data:
@@ -220,8 +244,8 @@ def part_1_other():
     return total_arrangements
 
 
-def part_2():
-    puzzle_input = read_input("input.txt")
+def part_2(filename: str = "input.txt"):
+    puzzle_input = read_input(filename)
 
     sum = 0
 
@@ -232,6 +256,7 @@ def part_2():
         count_arrangements.cache_clear()
         sum += count_arrangements(unfolded_record, tuple(unfolded_groups))
         # print(count_arrangements.cache_info())
+        record_cache_info()
 
 
 
@@ -1,12 +1,19 @@
+import sys
 from collections.abc import Iterable
+from pathlib import Path
 from typing import Optional
 
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import open_input
+
 
 def read_patterns(filename: str) -> Iterable[list[str]]:
     buffer = []
 
-    with open(filename, "r") as f:
-        for line in f:
+    with open_input(__file__, filename) as data:
+        for line in data.text_lines():
             line = line.strip()
             if line == "":
                 yield buffer
@@ -73,8 +80,8 @@ def transpose(pattern: list[str]) -> list[str]:
     return ["".join(row) for row in zip(*pattern)]
 
 
-def part_1():
-    patterns = list(read_patterns("input.txt"))
+def part_1(filename: str = "input.txt"):
+    patterns = list(read_patterns(filename))
 
     sum = 0
 
@@ -90,8 +97,8 @@ def part_1():
     return sum
 
 
-def part_2():
-    patterns = list(read_patterns("input.txt"))
+def part_2(filename: str = "input.txt"):
+    patterns = list(read_patterns(filename))
 
     sum = 0
 
@@ -1,146 +1,99 @@
-from copy import deepcopy
+import sys
+from collections.abc import Iterable
 from pathlib import Path
 
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
-def read_input(filename: str) -> list[str]:
-    return Path(filename).read_text().splitlines()
+from aoc.grid import Grid
+from aoc.inputs import resolve
 
+ROUND = ord("O")
+CUBE = ord("#")
+EMPTY = ord(".")
 
-def part_1():
-    lines = read_input("input.txt")
 
-    width = len(lines[0])
-    height = len(lines)
+def read_input(filename: str) -> Grid:
+    # the border around the platform stops the rolling rocks like a cube rock
+    return Grid.from_file(resolve(__file__, filename), border="#")
+
+
+def part_1(filename: str = "input.txt"):
+    grid = read_input(filename)
+
+    height = grid.height
 
     sum = 0
 
-    for j in range(width):
+    for j in range(grid.width):
         next_collect_position = 0
-        for i in range(height):
-            ch = lines[i][j]
-            if ch == "#":
+        for i, ch in enumerate(grid.column(j)):
+            if ch == CUBE:
                 next_collect_position = i + 1
-            elif ch == "O":
+            elif ch == ROUND:
                 sum += height - next_collect_position
                 next_collect_position += 1
 
     return sum
 
 
-def total_north_load(matrix: list[list[str]]) -> int:
-    width = len(matrix[0])
-    height = len(matrix)
-
+def total_north_load(grid: Grid) -> int:
     sum = 0
 
-    for j in range(width):
-        for i in range(height):
-            ch = matrix[i][j]
-            if ch == "O":
-                sum += height - i
+    for i in range(grid.height):
+        start = grid.index(0, i)
+        sum += grid.cells.count(ROUND, start, start + grid.width) * (grid.height - i)
 
     return sum
 
 
-def north(matrix: list[list[str]]) -> list[list[str]]:
-    width = len(matrix[0])
-    height = len(matrix)
-
-    matrix = deepcopy(matrix)
+def roll(grid: Grid, lines: Iterable[range]) -> Grid:
+    # move the round rocks along every line towards the start of the line
+    grid = grid.copy()
+    cells = grid.cells
 
-    for j in range(width):
-        next_collect_position = 0
-        for i in range(height):
-            ch = matrix[i][j]
-            if ch == "#":
-                next_collect_position = i + 1
-            elif ch == "O":
-                matrix[next_collect_position][j] = "O"
+    for line in lines:
+        next_collect_position = line.start
+        for i in line:
+            ch = cells[i]
+            if ch == CUBE:
+                next_collect_position = i + line.step
+            elif ch == ROUND:
                 if i != next_collect_position:
-                    # if the O round rock actually moved then replace the original place with .
-                    matrix[i][j] = "."
-                next_collect_position += 1
-
-    return matrix
+                    # if the O round rock actually moves then replace the original place with .
+                    cells[next_collect_position] = ROUND
+                    cells[i] = EMPTY
+                next_collect_position += line.step
 
+    return grid
 
-def west(matrix: list[list[str]]) -> list[list[str]]:
-    width = len(matrix[0])
-    height = len(matrix)
 
-    matrix = deepcopy(matrix)
-
-    for i in range(height):
-        next_collect_position = 0
-        for j in range(width):
-            ch = matrix[i][j]
-            if ch == "#":
-                next_collect_position = j + 1
-            elif ch == "O":
-                matrix[i][next_collect_position] = "O"
-                if j != next_collect_position:
-                    # if the O round rock actually moved then replace the original place with .
-                    matrix[i][j] = "."
-                next_collect_position += 1
-
-    return matrix
-
-
-def south(matrix: list[list[str]]) -> list[list[str]]:
-    width = len(matrix[0])
-    height = len(matrix)
-
-    matrix = deepcopy(matrix)
-
-    for j in range(width):
-        next_collect_position = height - 1
-        for i in reversed(range(height)):
-            ch = matrix[i][j]
-            if ch == "#":
-                next_collect_position = i - 1
-            elif ch == "O":
-                matrix[next_collect_position][j] = "O"
-                if i != next_collect_position:
-                    # if the O round rock actually moved then replace the original place with .
-                    matrix[i][j] = "."
-                next_collect_position -= 1
+def north(grid: Grid) -> Grid:
+    return roll(grid, (grid.column_indices(j) for j in range(grid.width)))
 
-    return matrix
 
+def west(grid: Grid) -> Grid:
+    return roll(grid, (grid.row_indices(i) for i in range(grid.height)))
 
-def east(matrix: list[list[str]]) -> list[list[str]]:
-    width = len(matrix[0])
-    height = len(matrix)
 
-    matrix = deepcopy(matrix)
+def south(grid: Grid) -> Grid:
+    return roll(grid, (grid.column_indices(j)[::-1] for j in range(grid.width)))
 
-    for i in range(height):
-        next_collect_position = width - 1
-        for j in reversed(range(width)):
-            ch = matrix[i][j]
-            if ch == "#":
-                next_collect_position = j - 1
-            elif ch == "O":
-                matrix[i][next_collect_position] = "O"
-                if j != next_collect_position:
-                    # if the O round rock actually moved then replace the original place with .
-                    matrix[i][j] = "."
-                next_collect_position -= 1
 
-    return matrix
+def east(grid: Grid) -> Grid:
+    return roll(grid, (grid.row_indices(i)[::-1] for i in range(grid.height)))
 
 
-def cycle(matrix: list[list[str]]) -> list[list[str]]:
-    return east(south(west(north(matrix))))
+def cycle(grid: Grid) -> Grid:
+    return east(south(west(north(grid))))
 
 
-def print_matrix(matrix: list[list[str]]):
-    for row in matrix:
-        print("".join(row))
+def print_matrix(grid: Grid):
+    print(grid)
 
 
-def part_2():
-    matrix = [list(line) for line in read_input("input.txt")]
+def part_2(filename: str = "input.txt"):
+    matrix = read_input(filename)
     total_cycle_count = 1000000000
 
     matrices = [matrix]
@@ -1,5 +1,28 @@
+import sys
+from collections.abc import Iterator
 from pathlib import Path
 
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import open_input
+
+
+def read_steps(filename: str) -> Iterator[str]:
+    # the comma separated steps one by one, the single line of the input is never decoded as a whole
+    with open_input(__file__, filename) as data:
+        end = len(data)
+        start = 0
+        while start < end:
+            stop = data.data.find(b",", start)
+            if stop == -1:
+                stop = end
+            step = str(data.view(start, stop), "ascii").strip()
+            if step:
+                yield step
+            start = stop + 1
+
+
 def my_hash(s: str):
     current = 0
 
@@ -11,9 +34,8 @@ def my_hash(s: str):
     return current
 
 
-def part_1():
-    input_line = Path("input.txt").read_text().strip()
-    input_sequence = input_line.split(",")
+def part_1(filename: str = "input.txt"):
+    input_sequence = read_steps(filename)
 
     sum = 0
 
@@ -23,9 +45,8 @@ def part_1():
     return sum
 
 
-def part_2():
-    input_line = Path("input.txt").read_text().strip()
-    input_sequence = input_line.split(",")
+def part_2(filename: str = "input.txt"):
+    input_sequence = read_steps(filename)
 
     boxes = [{} for _ in range(256)]
 
@@ -1,154 +1,103 @@
-from collections import deque
-from enum import Enum, unique
+import sys
+from enum import IntEnum, unique
 from pathlib import Path
 
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
-Coord = tuple[int, int]
+from aoc.cache import parsed_input
+from aoc.grid import Grid
+from aoc.inputs import resolve
 
 
 @unique
-class Directions(Enum):
-    UP = (0, -1)
-    DOWN = (0, 1)
-    LEFT = (-1, 0)
-    RIGHT = (1, 0)
+class Directions(IntEnum):
+    # same order as Grid.offsets
+    UP = 0
+    RIGHT = 1
+    DOWN = 2
+    LEFT = 3
 
 
-HORIZONTAL = {Directions.LEFT, Directions.RIGHT}
-VERTICAL = {Directions.UP, Directions.DOWN}
+UP, RIGHT, DOWN, LEFT = Directions
 
+# byte value of the tile -> direction of the incoming beam -> directions of the outgoing beams
+NEXT_DIRECTIONS: list = [None] * 256
+NEXT_DIRECTIONS[ord(".")] = ((UP,), (RIGHT,), (DOWN,), (LEFT,))
+NEXT_DIRECTIONS[ord("/")] = ((RIGHT,), (UP,), (LEFT,), (DOWN,))
+NEXT_DIRECTIONS[ord("\\")] = ((LEFT,), (DOWN,), (RIGHT,), (UP,))
+NEXT_DIRECTIONS[ord("|")] = ((UP,), (UP, DOWN), (DOWN,), (UP, DOWN))
+NEXT_DIRECTIONS[ord("-")] = ((LEFT, RIGHT), (RIGHT,), (LEFT, RIGHT), (LEFT,))
 
+# outside of the contraption
+BORDER = " "
+
+
+@parsed_input(version=2)
 def parse_input(filename: str) -> dict:
-    lines = Path(filename).read_text().splitlines()
-    width = len(lines[0])
-    height = len(lines)
+    grid = Grid.from_file(resolve(__file__, filename), border=BORDER)
+
+    for i in grid.indices():
+        if NEXT_DIRECTIONS[grid.cells[i]] is None:
+            raise ValueError(f"Unexpected char {grid[i]}")
+
     return {
-        "width": width,
-        "height": height,
-        "matrix": {(x, y): lines[y][x] for x in range(width) for y in range(height)},
+        "width": grid.width,
+        "height": grid.height,
+        "grid": grid,
     }
 
 
-def next_coord(pos: Coord, dir: Directions) -> Coord:
-    x, y = pos
-    dx, dy = dir.value
-    return (x + dx, y + dy)
+def enter_light(start: tuple[int, Directions], grid: Grid) -> int:
+    # returns the number of energized cells
+    cells = grid.cells
+    offsets = grid.offsets
+    border = grid.border
 
+    # one bit per direction, to avoid endless reflection cycles
+    # and to be able to visit the same cell with different direction
+    visited_with_direction = bytearray(len(cells))
 
-def enter_light(
-    start: tuple[Coord, Directions], matrix: dict[Coord, str]
-) -> set[Coord]:
-    visited = set()
+    stack = [(start[0], int(start[1]))]
+    while stack:
+        current_pos, dir = stack.pop()
+        visited_with_direction[current_pos] |= 1 << dir
 
-    # to avoid endless reflection cycles and to be able to visit the same node with different direction
-    visited_with_direction = set()
+        for next_dir in NEXT_DIRECTIONS[cells[current_pos]][dir]:
+            next_pos = current_pos + offsets[next_dir]
+            if (
+                cells[next_pos] != border
+                and not visited_with_direction[next_pos] & (1 << next_dir)
+            ):
+                stack.append((next_pos, next_dir))
 
-    queue = deque([start])
-    while len(queue) > 0:
-        current_pos, dir = queue.popleft()
-        visited.add(current_pos)
-        visited_with_direction.add((current_pos, dir))
+    return len(visited_with_direction) - visited_with_direction.count(0)
 
-        ch = matrix[current_pos]
 
-        if ch == ".":
-            next_pos = next_coord(current_pos, dir)
-            if next_pos in matrix and (next_pos, dir) not in visited_with_direction:
-                queue.appendleft((next_pos, dir))
-        elif ch == "/":
-            if dir == Directions.UP:
-                next_dir = Directions.RIGHT
-            elif dir == Directions.DOWN:
-                next_dir = Directions.LEFT
-            elif dir == Directions.LEFT:
-                next_dir = Directions.DOWN
-            elif dir == Directions.RIGHT:
-                next_dir = Directions.UP
+def part_1(filename: str = "input.txt"):
+    puzzle_input = parse_input(filename)
 
-            next_pos = next_coord(current_pos, next_dir)
-            if (
-                next_pos in matrix
-                and (next_pos, next_dir) not in visited_with_direction
-            ):
-                queue.appendleft((next_pos, next_dir))
-        elif ch == "\\":
-            if dir == Directions.UP:
-                next_dir = Directions.LEFT
-            elif dir == Directions.DOWN:
-                next_dir = Directions.RIGHT
-            elif dir == Directions.LEFT:
-                next_dir = Directions.UP
-            elif dir == Directions.RIGHT:
-                next_dir = Directions.DOWN
-
-            next_pos = next_coord(current_pos, next_dir)
-            if (
-                next_pos in matrix
-                and (next_pos, next_dir) not in visited_with_direction
-            ):
-                queue.appendleft((next_pos, next_dir))
-        elif ch == "|":
-            if dir in VERTICAL:
-                next_pos = next_coord(current_pos, dir)
-                if next_pos in matrix and (next_pos, dir) not in visited_with_direction:
-                    queue.appendleft((next_pos, dir))
-            else:
-                next_directions = [Directions.UP, Directions.DOWN]
-                for next_dir in next_directions:
-                    next_pos = next_coord(current_pos, next_dir)
-                    if (
-                        next_pos in matrix
-                        and (next_pos, next_dir) not in visited_with_direction
-                    ):
-                        queue.appendleft((next_pos, next_dir))
-        elif ch == "-":
-            if dir in HORIZONTAL:
-                next_pos = next_coord(current_pos, dir)
-                if next_pos in matrix and (next_pos, dir) not in visited_with_direction:
-                    queue.appendleft((next_pos, dir))
-            else:
-                next_directions = [Directions.LEFT, Directions.RIGHT]
-                for next_dir in next_directions:
-                    next_pos = next_coord(current_pos, next_dir)
-                    if (
-                        next_pos in matrix
-                        and (next_pos, next_dir) not in visited_with_direction
-                    ):
-                        queue.appendleft((next_pos, next_dir))
-        else:
-            raise ValueError(f"Unexpected char {ch}")
-
-    return visited
-
-
-def part_1():
-    puzzle_input = parse_input("input.txt")
-
-    matrix = puzzle_input["matrix"]
-
-    start = ((0, 0), Directions.RIGHT)
-
-    visited = enter_light(start, matrix)
-
-    return len(visited)
-
-
-def part_2():
-    puzzle_input = parse_input("input.txt")
-
-    matrix = puzzle_input["matrix"]
+    grid = puzzle_input["grid"]
+
+    start = (grid.index(0, 0), Directions.RIGHT)
+
+    return enter_light(start, grid)
+
+
+def part_2(filename: str = "input.txt"):
+    puzzle_input = parse_input(filename)
+
+    grid = puzzle_input["grid"]
     width = puzzle_input["width"]
     height = puzzle_input["height"]
 
     start_coords = []
-    start_coords.extend(((x, 0), Directions.DOWN) for x in range(width))
-    start_coords.extend(((x, height - 1), Directions.UP) for x in range(width))
-    start_coords.extend(((0, y), Directions.RIGHT) for y in range(height))
-    start_coords.extend(((width - 1, y), Directions.LEFT) for y in range(height))
-
-    energized_cells = [
-        len(enter_light(start, matrix)) for start in start_coords
-    ]
+    start_coords.extend((grid.index(x, 0), Directions.DOWN) for x in range(width))
+    start_coords.extend((grid.index(x, height - 1), Directions.UP) for x in range(width))
+    start_coords.extend((grid.index(0, y), Directions.RIGHT) for y in range(height))
+    start_coords.extend((grid.index(width - 1, y), Directions.LEFT) for y in range(height))
+
+    energized_cells = [enter_light(start, grid) for start in start_coords]
 
     return max(energized_cells)
 
@@ -1,142 +1,103 @@
-from collections import deque
-from enum import Enum, unique
+import sys
 from pathlib import Path
 
-Coord = tuple[int, int]
-
-
-@unique
-class Directions(Enum):
-    UP = (0, -1)
-    DOWN = (0, 1)
-    LEFT = (-1, 0)
-    RIGHT = (1, 0)
-
-    def turn_left(self) -> "Directions":
-        if self == Directions.UP:
-            return Directions.LEFT
-        if self == Directions.DOWN:
-            return Directions.RIGHT
-        if self == Directions.LEFT:
-            return Directions.DOWN
-        if self == Directions.RIGHT:
-            return Directions.UP
-
-    def turn_right(self) -> "Directions":
-        if self == Directions.UP:
-            return Directions.RIGHT
-        if self == Directions.DOWN:
-            return Directions.LEFT
-        if self == Directions.LEFT:
-            return Directions.UP
-        if self == Directions.RIGHT:
-            return Directions.DOWN
-
-    def step(self, pos: Coord) -> Coord:
-        x, y = pos
-        dx, dy = self.value
-        return (x + dx, y + dy)
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
+from aoc.cache import parsed_input
+from aoc.grid import Grid
+from aoc.inputs import resolve
+from aoc.search import shortest_distances, shortest_path
 
-def parse_input(filename: str) -> dict:
-    lines = Path(filename).read_text().splitlines()
-    width = len(lines[0])
-    height = len(lines)
-    return {
-        "width": width,
-        "height": height,
-        "matrix": {
-            (x, y): int(lines[y][x]) for x in range(width) for y in range(height)
-        },
-    }
+# the axis the crucible arrived along, the next move is along the other one
+VERTICAL = 0
+HORIZONTAL = 1
 
+# outside of the city
+BORDER = " "
 
-def part_1():
-    puzzle_input = parse_input("input.txt")
 
-    matrix = puzzle_input["matrix"]
-    width = puzzle_input["width"]
-    height = puzzle_input["height"]
-
-    # reversing the direction
-    start = (width - 1, height - 1)
-    end = (0, 0)
-
-    result = {
-        (start, Directions.UP, 0): matrix[start],
-        (start, Directions.LEFT, 0): matrix[start],
+@parsed_input(version=2)
+def parse_input(filename: str) -> dict:
+    grid = Grid.from_file(resolve(__file__, filename), border=BORDER)
+    return {
+        "width": grid.width,
+        "height": grid.height,
+        "grid": grid,
     }
 
-    queue = deque(list(result.keys()))
-    while len(queue) > 0:
-        item = queue.popleft()
-        pos, dir, step_count = item
-
-        directions = [dir.turn_left(), dir.turn_right()]
-        if step_count < 3:
-            directions.append(dir)
-
-        for next_dir in directions:
-            next_pos = next_dir.step(pos)
-            next_step_count = step_count + 1 if next_dir == dir else 1
-            if next_pos in matrix:
-                key = (next_pos, next_dir, next_step_count)
-                value_candidate = result[item] + matrix[next_pos]
-                if key not in result or value_candidate < result[key]:
-                    result[key] = value_candidate
-                    queue.append(key)
 
-    return min([result[key] for key in result if key[0] == end]) - matrix[end]
+def heat_losses(grid: Grid) -> list[int]:
+    # flat index -> heat loss of the block, 0 on the border, which is never entered
+    border = grid.border
+    return [0 if value == border else value - ord("0") for value in grid.cells]
+
+
+def heat_loss_bound(grid: Grid, end: int) -> list[int]:
+    # Flat index -> least heat lost on the way from the block to the end if the crucible could turn
+    # anywhere. Every real path is one of those, so it never overestimates and it holds step by step:
+    # a much tighter heuristic than the Manhattan distance, which counts 1 per block.
+    cells = grid.cells
+    border = grid.border
+    matrix = heat_losses(grid)
+
+    def entered_from(pos: int) -> list[tuple[int, int]]:
+        # backwards from the end: the blocks next to this one, entering it loses its heat
+        return [(pos + offset, matrix[pos]) for offset in grid.offsets if cells[pos + offset] != border]
+
+    distances = shortest_distances([end], entered_from)
+    return [distances.get(pos, 0) for pos in range(len(cells))]
+
+
+def minimal_heat_loss(grid: Grid, min_steps: int, max_steps: int) -> int:
+    cells = grid.cells
+    border = grid.border
+    matrix = heat_losses(grid)
+
+    axis_offsets = ((grid.up, grid.down), (grid.left, grid.right))
+
+    # A state is the block where the crucible turns and the axis it arrived along, encoded as
+    # block * 2 + axis. Instead of stepping one block at a time and counting the steps, a move goes
+    # min_steps..max_steps blocks straight ahead and then turns, so the step count is not part of the state.
+    def successors(state: int):
+        pos = state >> 1
+        next_axis = 1 - (state & 1)
+
+        for offset in axis_offsets[next_axis]:
+            next_pos = pos
+            heat_loss = 0
+            for step_count in range(1, max_steps + 1):
+                next_pos += offset
+                if cells[next_pos] == border:
+                    break
+                heat_loss += matrix[next_pos]
+                if step_count >= min_steps:
+                    yield next_pos << 1 | next_axis, heat_loss
+
+    start = grid.index(0, 0)
+    end = grid.index(grid.width - 1, grid.height - 1)
+    remaining = heat_loss_bound(grid, end)
+
+    return shortest_path(
+        [start << 1 | VERTICAL, start << 1 | HORIZONTAL],
+        successors,
+        lambda state: state >> 1 == end,
+        heuristic=lambda state: remaining[state >> 1],
+    )
 
 
-def part_2():
-    puzzle_input = parse_input("input.txt")
+def part_1(filename: str = "input.txt"):
+    puzzle_input = parse_input(filename)
 
-    matrix = puzzle_input["matrix"]
-    width = puzzle_input["width"]
-    height = puzzle_input["height"]
+    return minimal_heat_loss(puzzle_input["grid"], 1, 3)
 
-    # reversing the direction
-    start = (width - 1, height - 1)
-    end = (0, 0)
 
-    result = {
-        (start, Directions.UP, 0): matrix[start],
-        (start, Directions.LEFT, 0): matrix[start],
-    }
+def part_2(filename: str = "input.txt"):
+    puzzle_input = parse_input(filename)
 
-    queue = deque(list(result.keys()))
-    while len(queue) > 0:
-        item = queue.popleft()
-        pos, dir, step_count = item
-
-        directions = []
-        if step_count < 4:
-            directions.append(dir)
-        elif 4 <= step_count < 10:
-            directions.append(dir)
-            directions.append(dir.turn_left())
-            directions.append(dir.turn_right())
-        else:
-            directions.append(dir.turn_left())
-            directions.append(dir.turn_right())
-
-        for next_dir in directions:
-            next_pos = next_dir.step(pos)
-            next_step_count = step_count + 1 if next_dir == dir else 1
-            if next_pos in matrix:
-                key = (next_pos, next_dir, next_step_count)
-                value_candidate = result[item] + matrix[next_pos]
-                if key not in result or value_candidate < result[key]:
-                    result[key] = value_candidate
-                    queue.append(key)
-
-    return (
-        min([result[key] for key in result if key[0] == end and key[2] >= 4])
-        - matrix[end]
-    )
+    return minimal_heat_loss(puzzle_input["grid"], 4, 10)
 
 
 if __name__ == "__main__":
-    print("Part 1:", part_1())  # 18 sec
-    print("Part 2:", part_2())  # 26 sec
+    print("Part 1:", part_1())
+    print("Part 2:", part_2())
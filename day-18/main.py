@@ -1,7 +1,15 @@
+import sys
 from collections import deque
 from enum import Enum, unique
 from pathlib import Path
 
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc.cache import parsed_input
+from aoc.inputs import read_lines
+
+
 Coord = tuple[int, int]
 
 
@@ -29,8 +37,9 @@ LEFT = Directions.LEFT
 RIGHT = Directions.RIGHT
 
 
+@parsed_input(version=1)
 def parse_input_part_1(filename: str) -> list[tuple[Directions, int]]:
-    lines = Path(filename).read_text().splitlines()
+    lines = read_lines(__file__, filename)
 
     direction_lookup = {
         "U": Directions.UP,
@@ -44,8 +53,9 @@ def parse_input_part_1(filename: str) -> list[tuple[Directions, int]]:
     ]
 
 
+@parsed_input(version=1)
 def parse_input_part_2(filename: str) -> list[tuple[Directions, int]]:
-    lines = Path(filename).read_text().splitlines()
+    lines = read_lines(__file__, filename)
 
     direction_lookup = {
         "0": Directions.RIGHT,
@@ -173,14 +183,14 @@ def measure_trench_with_shoelace_formula(
     return area // 2
 
 
-def part_1():
-    puzzle_input = parse_input_part_1("input.txt")
+def part_1(filename: str = "input.txt"):
+    puzzle_input = parse_input_part_1(filename)
     # return measure_trench(puzzle_input)
     return measure_trench_with_shoelace_formula(puzzle_input)
 
 
-def part_2():
-    puzzle_input = parse_input_part_2("input.txt")
+def part_2(filename: str = "input.txt"):
+    puzzle_input = parse_input_part_2(filename)
     return measure_trench_with_shoelace_formula(puzzle_input)
 
 
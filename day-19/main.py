@@ -1,13 +1,29 @@
+import sys
 from collections import deque
-from dataclasses import dataclass, replace
+from collections.abc import Iterable
 from functools import partial
+from itertools import takewhile
 from pathlib import Path
 from typing import Optional
 
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
-def parse_parts(filename: str) -> list[dict]:
-    lines = Path(filename).read_text().splitlines()
+from aoc.cache import parsed_input
+from aoc.inputs import read_lines
+from aoc.interval import Box, Interval
 
+
+@parsed_input(version=2)
+def parse_input(filename: str) -> tuple[dict, list[dict]]:
+    lines = read_lines(__file__, filename)
+    # the workflows come first, then a blank line and the parts
+    workflows = parse_workflows(takewhile(bool, lines))
+    parts = parse_parts(lines)
+    return workflows, parts
+
+
+def parse_parts(lines: Iterable[str]) -> list[dict]:
     result = []
 
     for line in lines:
@@ -36,9 +52,7 @@ def always_true(_part: dict) -> bool:
     return True
 
 
-def parse_workflows(filename: str) -> dict:
-    lines = Path(filename).read_text().splitlines()
-
+def parse_workflows(lines: Iterable[str]) -> dict:
     result = {}
 
     for line in lines:
@@ -84,9 +98,8 @@ def evaluate_workflow(workflow: list, part: dict) -> str:
     raise ValueError("Workflow did not apply to part")
 
 
-def part_1():
-    parts = parse_parts("parts.txt")
-    workflows = parse_workflows("workflows.txt")
+def part_1(filename: str = "input.txt"):
+    workflows, parts = parse_input(filename)
 
     accepted_parts = []
 
@@ -103,80 +116,40 @@ def part_1():
     return sum(sum(part.values()) for part in accepted_parts)
 
 
-@dataclass
-class Limits:
-    x_min: int
-    x_max: int
-
-    m_min: int
-    m_max: int
-
-    a_min: int
-    a_max: int
-
-    s_min: int
-    s_max: int
-
-    def apply(self, condition: Optional[dict]) -> "Limits":
-        if condition is None:
-            return self
-
-        copy = replace(self)
-
-        property = condition["property"]
-        operator = condition["operator"]
-        threshold = condition["threshold"]
-
-        if operator == "<":
-            key = f"{property}_max"
-            setattr(copy, key, min(getattr(copy, key), threshold - 1))
-        elif operator == "<=":
-            key = f"{property}_max"
-            setattr(copy, key, min(getattr(copy, key), threshold))
-        elif operator == ">":
-            key = f"{property}_min"
-            setattr(copy, key, max(getattr(copy, key), threshold + 1))
-        elif operator == ">=":
-            key = f"{property}_min"
-            setattr(copy, key, max(getattr(copy, key), threshold))
-        else:
-            raise ValueError(f"Unexpected operator '{operator}'")
+# the property of each axis of the part boxes
+AXES = "xmas"
 
-        return copy
 
-    def inverse_apply(self, condition: Optional[dict]) -> "Limits":
-        if condition is None:
-            return self
+def split_by_condition(box: Box, condition: Optional[dict]) -> tuple[Box, Box]:
+    # the parts of the box that satisfy the condition and the ones that do not
+    if condition is None:
+        nothing = Box(tuple(Interval(0, 0) for _ in box.sides))
+        return box, nothing
 
-        property = condition["property"]
-        operator = condition["operator"]
-        threshold = condition["threshold"]
+    axis = AXES.index(condition["property"])
+    operator = condition["operator"]
+    threshold = condition["threshold"]
 
-        inverse_operator = {"<": ">=", "<=": ">", ">": "<=", ">=": "<"}[operator]
-
-        return self.apply(
-            {"property": property, "operator": inverse_operator, "threshold": threshold}
-        )
-
-    def count(self) -> int:
-        x_count = max(self.x_max - self.x_min + 1, 0)
-        m_count = max(self.m_max - self.m_min + 1, 0)
-        a_count = max(self.a_max - self.a_min + 1, 0)
-        s_count = max(self.s_max - self.s_min + 1, 0)
+    if operator == "<":
+        below, above = box.split(axis, threshold)
+        return below, above
+    if operator == ">":
+        below, above = box.split(axis, threshold + 1)
+        return above, below
 
-        return x_count * m_count * a_count * s_count
+    raise ValueError(f"Unexpected operator '{operator}'")
 
 
-def part_2():
+def part_2(filename: str = "input.txt"):
     # The workflow graph is a tree
-    # We do a depth-first traversal, adding a Limits object to each node
-    # This object represents the limits of the parts that can reach this node
-    # When we reach a node that is an accept state, we collect the appropriate Limits object into a list
-    # The result is the sum of the counts of all the Limits objects in the list
+    # We do a depth-first traversal, adding a box of ratings to each node
+    # This box represents the parts that can reach this node
+    # When we reach a node that is an accept state, we collect the appropriate box into a list
+    # The result is the sum of the volumes of all the boxes in the list
 
-    workflows = parse_workflows("workflows.txt")
+    workflows, _ = parse_input(filename)
 
-    initial_limits = Limits(1, 4000, 1, 4000, 1, 4000, 1, 4000)
+    initial_limits = Box(tuple(Interval.closed(1, 4000) for _ in AXES))
 
     queue = deque([("in", initial_limits)])
 
@@ -188,20 +161,22 @@ def part_2():
         workflow = workflows[current_stage]
 
         for rule in workflow:
-            if rule["target"] == "A":
-                succesful_limits.append(limits.apply(rule["condition"]))
-            elif rule["target"] == "R":
+            # Each workflow can have many rules, and for the nth rule to apply,
+            # all of the conditions of the previous rules must not apply.
+            # So only the rest of the box is carried over to the next rule.
+            matching, limits = split_by_condition(limits, rule["condition"])
+
+            if matching.is_empty() or rule["target"] == "R":
                 pass
+            elif rule["target"] == "A":
+                succesful_limits.append(matching)
             else:
-                queue.append((rule["target"], limits.apply(rule["condition"])))
+                queue.append((rule["target"], matching))
 
-            # Each workflow can have many rules, and for the nth rule to apply,
-            # all of the conditions of the previous rules must not apply.
-            # To handle that we apply the inverse of the current condition at the end of each step
-            # as we loop through the rules of the workflow.
-            limits = limits.inverse_apply(rule["condition"])
+            if limits.is_empty():
+                break
 
-    return sum(limit.count() for limit in succesful_limits)
+    return sum(limit.volume() for limit in succesful_limits)
 
 
 if __name__ == "__main__":
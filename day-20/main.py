@@ -1,9 +1,18 @@
+import sys
 from collections import deque
 from pathlib import Path
 
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
+from aoc import metrics
+from aoc.cache import parsed_input
+from aoc.inputs import read_lines
+
+
+@parsed_input(version=1)
 def parse_input(filename: str) -> dict:
-    lines = Path(filename).read_text().splitlines()
+    lines = read_lines(__file__, filename)
 
     result = {}
 
@@ -32,13 +41,17 @@ def parse_input(filename: str) -> dict:
     return result
 
 
-def part_1():
-    graph = parse_input("input.txt")
+def part_1(filename: str = "input.txt"):
+    graph = parse_input(filename)
 
     low_signals = 0
     high_signals = 0
 
+    pulses_per_press = metrics.histogram("pulses_per_press")
+
     for _ in range(1000):
+        signals_before = low_signals + high_signals
+
         # implement signal propagation with a depth-first traversal
         queue = deque([("button", "broadcaster", False)])
 
@@ -77,20 +90,29 @@ def part_1():
             else:
                 raise ValueError(f"Unknown module type: {type}")
 
+        pulses_per_press.observe(low_signals + high_signals - signals_before)
+
+    metrics.counter("pulses").inc(low_signals + high_signals)
+
     return low_signals * high_signals
 
 
-def part_2():
-    graph = parse_input("input.txt")
+def part_2(filename: str = "input.txt"):
+    graph = parse_input(filename)
 
     # fp, zc, xt, mk
     # bad_boys = ["fp", "zc", "xt", "mk"]
 
+    pulses = metrics.counter("pulses")
+    pulses_per_press = metrics.histogram("pulses_per_press")
+
     for i in range(5000):
         queue = deque([("button", "broadcaster", False)])
+        processed = 0
 
         while len(queue) > 0:
             source, target, value = queue.popleft()
+            processed += 1
 
             if target == "kl" and value is True:
                 print("kl received a high signal at", i + 1, "from", source)
@@ -122,6 +144,9 @@ def part_2():
             else:
                 raise ValueError(f"Unknown module type: {type}")
 
+        pulses.inc(processed)
+        pulses_per_press.observe(processed)
+
     # todo: multiply the printed values (or to be precise, find the least common multiple of them)
 
 
@@ -1,12 +1,19 @@
+import sys
 from pathlib import Path
 
-import networkx as nx
-import matplotlib.pyplot as plt
-from networkx.drawing.nx_agraph import graphviz_layout
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import read_lines
+from aoc.lazy import lazy_import
+
+# only needed for drawing, and importing them takes longer than solving the puzzle
+nx = lazy_import("networkx")
+plt = lazy_import("matplotlib.pyplot")
 
 
 def visualize(filename: str):
-    lines = Path(filename).read_text().splitlines()
+    lines = read_lines(__file__, filename)
 
     g = nx.DiGraph()
 
@@ -30,7 +37,7 @@ def visualize(filename: str):
 
     colors = [color_map.get(node, "violet") for node in g.nodes()]
 
-    nx.draw(g, pos=graphviz_layout(g, prog="dot", root="rx"), with_labels=True, node_color=colors)
+    nx.draw(g, pos=nx.nx_agraph.graphviz_layout(g, prog="dot", root="rx"), with_labels=True, node_color=colors)
     plt.show()
 
 
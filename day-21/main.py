@@ -1,45 +1,50 @@
+import sys
 from pathlib import Path
 
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc.cache import parsed_input
+from aoc.grid import Grid
+from aoc.inputs import resolve
+
 
 Coord = tuple[int, int]
 
 
-def parse_input(filename: str) -> dict:
-    lines = Path(filename).read_text().splitlines()
+GARDEN = ord(".")
 
-    width = len(lines[0])
-    height = len(lines)
 
-    field = {}
+@parsed_input(version=2)
+def parse_input(filename: str) -> dict:
+    # the border is rock, the elf can not leave the garden in part 1
+    field = Grid.from_file(resolve(__file__, filename), border="#")
 
-    for y in range(height):
-        for x in range(width):
-            cell = lines[y][x]
-            if cell == "S":
-                start = (x, y)
-            field[(x, y)] = cell if cell != "S" else "."
+    start = field.find("S")
+    field[start] = "."
 
-    return {"field": field, "width": width, "height": height, "start": start}
+    return {"field": field, "width": field.width, "height": field.height, "start": start}
 
 
-def part_1():
-    data = parse_input("input.txt")
+def part_1(filename: str = "input.txt"):
+    data = parse_input(filename)
     step_count = 64
 
     field = data["field"]
     start = data["start"]
 
+    cells = field.cells
+    offsets = field.offsets
+
     reachable = {start}
 
     for _ in range(step_count):
         new_reachable = set()
 
-        for x, y in reachable:
-            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                new_x = x + dx
-                new_y = y + dy
-                if field.get((new_x, new_y)) == ".":
-                    new_reachable.add((new_x, new_y))
+        for pos in reachable:
+            for offset in offsets:
+                if cells[pos + offset] == GARDEN:
+                    new_reachable.add(pos + offset)
 
         reachable = new_reachable
 
@@ -47,7 +52,7 @@ def part_1():
 
 
 def print_reachable_field(
-    field: dict[Coord, str], reachable: set[Coord], step: int, width: int, height: int
+    field: Grid, reachable: set[Coord], step: int, width: int, height: int
 ):
     with open(f"reachable_{step+1}.txt", "w") as f:
         for y in range(height):
@@ -59,7 +64,7 @@ def print_reachable_field(
             f.write("\n")
 
 
-def part_2():
+def part_2(filename: str = "input.txt"):
     # The given 26501365 steps is not an arbitrary number.
     # 26501365 = 202300 * 131 + 65
     # where the input is a 131x131 square and the starting point is exactly in the middle,
@@ -78,11 +83,13 @@ def part_2():
     # - https://www.reddit.com/r/adventofcode/comments/18nxp7x/2023_day_21_part_2_analytical_solution/
     # - https://colab.research.google.com/drive/16yAGjSGyvHuAurfht0yUv18eY7T207yR
 
-    data = parse_input("input.txt")
+    data = parse_input(filename)
     step_count = 2000
 
     field = data["field"]
-    start = data["start"]
+    # the garden repeats infinitely, so part 2 works with unbounded (x, y) coordinates
+    start = field.coords(data["start"])
+    cells = field.cells
     width = data["width"]
     height = data["height"]
 
@@ -108,7 +115,7 @@ def part_2():
                 for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
                     new_x = x + dx
                     new_y = y + dy
-                    if field[(new_x % width, new_y % height)] == ".":
+                    if cells[field.index(new_x % width, new_y % height)] == GARDEN:
                         new_reachable.add((new_x, new_y))
 
             reachable = new_reachable
@@ -1,8 +1,16 @@
+import sys
 from collections import defaultdict, deque
 from dataclasses import dataclass
 from pathlib import Path
 from pprint import pprint
 
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc.cache import parsed_input
+from aoc.inputs import read_lines
+
+
 Coord = tuple[int, int, int]
 
 
@@ -80,8 +88,9 @@ class Brick:
         self.z2 -= 1
 
 
+@parsed_input(version=1)
 def parse_input(filename: str) -> list[Brick]:
-    lines = Path(filename).read_text().splitlines()
+    lines = read_lines(__file__, filename)
 
     bricks = []
 
@@ -168,8 +177,8 @@ def find_support_relations(
     return supports, supported_by
 
 
-def part_1():
-    bricks = parse_input("input.txt")
+def part_1(filename: str = "input.txt"):
+    bricks = parse_input(filename)
     space = create_space(bricks)
 
     stabilize(bricks, space)
@@ -192,8 +201,8 @@ def part_1():
     return len(removable)
 
 
-def part_2():
-    bricks = parse_input("input.txt")
+def part_2(filename: str = "input.txt"):
+    bricks = parse_input(filename)
     space = create_space(bricks)
 
     stabilize(bricks, space)
@@ -1,22 +1,29 @@
+import sys
 from collections import defaultdict, deque
 from pathlib import Path
 
-Coord = tuple[int, int]
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
+from aoc import metrics
+from aoc.cache import parsed_input
+from aoc.grid import Grid
+from aoc.inputs import resolve
 
-def parse_input(filename: str) -> dict:
-    lines = Path(filename).read_text().splitlines()
-    width = len(lines[0])
-    height = len(lines)
 
-    field = {}
+PATH = ord(".")
+FOREST = ord("#")
 
-    for y in range(height):
-        for x in range(width):
-            field[(x, y)] = lines[y][x]
 
-    start = (lines[0].index("."), 0)
-    end = (lines[-1].index("."), height - 1)
+@parsed_input(version=2)
+def parse_input(filename: str) -> dict:
+    # the border is forest, so the walks never leave the map
+    field = Grid.from_file(resolve(__file__, filename), border="#")
+    width = field.width
+    height = field.height
+
+    start = field.index(field.row(0).tobytes().index(b"."), 0)
+    end = field.index(field.row(height - 1).tobytes().index(b"."), height - 1)
 
     return {
         "field": field,
@@ -27,55 +34,42 @@ def parse_input(filename: str) -> dict:
     }
 
 
-def print_field_with_path(
-    field: dict[Coord, str], width: int, height: int, path: set[Coord]
-):
+def print_field_with_path(field: Grid, width: int, height: int, path: set[int]):
     for y in range(height):
         for x in range(width):
-            if (x, y) in path:
+            if field.index(x, y) in path:
                 print("O", end="")
             else:
-                print(field[(x, y)], end="")
+                print(field[x, y], end="")
         print()
 
 
-UP = (0, -1)
-RIGHT = (1, 0)
-DOWN = (0, 1)
-LEFT = (-1, 0)
-
-
-STEP_VECTORS = [UP, RIGHT, DOWN, LEFT]
-
-
-def part_1():
-    data = parse_input("input.txt")
+def part_1(filename: str = "input.txt"):
+    data = parse_input(filename)
 
     field = data["field"]
     start = data["start"]
     end = data["end"]
 
-    def get_neighbors(coord: Coord, path: set[Coord]) -> list[Coord]:
+    cells = field.cells
+    # the slopes can only be entered in their direction
+    slopes = {ord(">"): field.right, ord("v"): field.down}
+
+    def get_neighbors(coord: int, path: set[int]) -> list[int]:
         result = []
 
-        for vector in STEP_VECTORS:
-            possible = (coord[0] + vector[0], coord[1] + vector[1])
+        for vector in field.offsets:
+            possible = coord + vector
 
-            if possible in path or possible not in field or field[possible] == "#":
+            if possible in path or cells[possible] == FOREST:
                 continue
 
-            # print("Checking", possible, "with vector", vector, field[possible])
-
-            if field[possible] == ".":
-                result.append(possible)
-            elif field[possible] == ">" and vector == RIGHT:
-                result.append(possible)
-            elif field[possible] == "v" and vector == DOWN:
+            if cells[possible] == PATH or slopes.get(cells[possible]) == vector:
                 result.append(possible)
 
         return result
 
-    def walk_until_possible(segment_start: Coord, path: set[Coord]):
+    def walk_until_possible(segment_start: int, path: set[int]):
         path = path.copy()
 
         current = segment_start
@@ -117,37 +111,29 @@ def part_1():
     return max(len(path) - 1 for path in paths_till_end)
 
 
-def part_2():
-    data = parse_input("input.txt")
+def part_2(filename: str = "input.txt"):
+    data = parse_input(filename)
 
     field = data["field"]
     start = data["start"]
     end = data["end"]
 
     # replace every slope with a normal field
-    for coord, value in field.items():
-        if value in ">vV<^":
-            field[coord] = "."
+    field.cells = cells = field.cells.translate(bytes.maketrans(b">vV<^", b"....."))
 
-    def get_neighbors(coord: Coord) -> list[Coord]:
-        result = []
-
-        for vector in STEP_VECTORS:
-            possible = (coord[0] + vector[0], coord[1] + vector[1])
-            if field.get(possible) == ".":
-                result.append(possible)
-
-        return result
+    def get_neighbors(coord: int) -> list[int]:
+        return [coord + vector for vector in field.offsets if cells[coord + vector] == PATH]
 
     junctions = [
         start,
         *(
             coord
-            for coord, value in field.items()
-            if value == "." and len(get_neighbors(coord)) > 2
+            for coord in field.indices()
+            if cells[coord] == PATH and len(get_neighbors(coord)) > 2
         ),
         end,
     ]
+    junction_set = set(junctions)
 
     # print(len(junctions))
 
@@ -163,12 +149,15 @@ def part_2():
             visited.add(current)
 
             for neighbor in get_neighbors(current):
-                if neighbor in junctions and neighbor != coord:
+                if neighbor in junction_set and neighbor != coord:
                     edges[coord].add((neighbor, distance + 1))
                 elif neighbor not in visited:
                     queue.append((neighbor, distance + 1))
 
-    def dfs(from_vertex: tuple, goal: tuple, seen: set=set()) -> list:
+    expanded = metrics.counter("dfs.expanded")
+    found = metrics.counter("dfs.paths_found")
+
+    def dfs(from_vertex: int, goal: int, seen: set=set()) -> list:
         """ Recursive DFS to find all path lengths from from_vertex to goal.
 
         Args:
@@ -182,8 +171,10 @@ def part_2():
             list: lengths of all valid paths
         """
         if from_vertex == goal:
+            found.inc()
             return [0] # Found a path, return a list with length 0 (since no more distance is needed)
 
+        expanded.inc()
         seen.add(from_vertex) # tp prevent backtracking in THIS path
         path_lengths = []
 
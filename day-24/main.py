@@ -1,14 +1,22 @@
+import sys
 from fractions import Fraction
 from pathlib import Path
 
 from linalg import solve_2x2, solve_4x4
 
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from aoc.cache import parsed_input
+from aoc.inputs import read_lines
+
 
 Vector = tuple[Fraction, Fraction, Fraction]
 
 
+@parsed_input(version=1)
 def parse_input(filename: str) -> list[tuple[Vector, Vector]]:
-    lines = Path(filename).read_text().splitlines()
+    lines = read_lines(__file__, filename)
 
     result = []
 
@@ -25,8 +33,8 @@ def parse_input(filename: str) -> list[tuple[Vector, Vector]]:
     return result
 
 
-def part_1():
-    data = parse_input("input.txt")
+def part_1(filename: str = "input.txt"):
+    data = parse_input(filename)
 
     min_coord = 200000000000000
     max_coord = 400000000000000
@@ -85,7 +93,7 @@ def part_1():
     return result
 
 
-def part_2():
+def part_2(filename: str = "input.txt"):
     # Rock's initial position: (px, py, pz)
     # Rock's initial velocity: (vx, vy, vz)
 
@@ -118,7 +126,7 @@ def part_2():
     # above substractions ((1) - (i), for i = 2, 3, 4, 5), we get a system of 4 linear equations for the 4 unknowns: px, py, vx, vy.
     # We can solve this system using Gaussian elimination and get the values for px, py, vx, vy.
 
-    data = parse_input("input.txt")
+    data = parse_input(filename)
 
     m = []
     b = []
@@ -1,11 +1,20 @@
+import sys
 from pathlib import Path
 
-import networkx as nx
-from networkx.algorithms.connectivity import minimum_edge_cut
+# the shared aoc package lives in the parent folder
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
+from aoc.cache import parsed_input
+from aoc.inputs import read_lines
+from aoc.lazy import lazy_import
 
-def parse_input(filename: str) -> nx.Graph:
-    lines = Path(filename).read_text().splitlines()
+# networkx takes a while to import, only load it when part 1 actually runs
+nx = lazy_import("networkx")
+
+
+@parsed_input(version=1)
+def parse_input(filename: str) -> "nx.Graph":
+    lines = read_lines(__file__, filename)
 
     graph = nx.Graph()
     for line in lines:
@@ -17,10 +26,10 @@ def parse_input(filename: str) -> nx.Graph:
     return graph
 
 
-def part_1():
-    graph = parse_input("input.txt")
+def part_1(filename: str = "input.txt"):
+    graph = parse_input(filename)
 
-    edges_to_cut = minimum_edge_cut(graph)
+    edges_to_cut = nx.minimum_edge_cut(graph)
     assert len(edges_to_cut) == 3
 
     for u, v in edges_to_cut:
@@ -32,7 +41,7 @@ def part_1():
     return connected_component_sizes[0] * connected_component_sizes[1]
 
 
-def part_2():
+def part_2(filename: str = "input.txt"):
     pass
 
 